@@ -0,0 +1,291 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/98_Benchmarks.ipynb.
+
+# %% auto 0
+__all__ = ['BenchmarkResult', 'bench_transport_throughput', 'bench_response_parsing', 'bench_get_from_id', 'bench_dictdot',
+           'bench_logger_add_log', 'run_benchmarks', 'compare_benchmarks', 'domo_benchmarks']
+
+# %% ../nbs/98_Benchmarks.ipynb 3
+import sys
+import json
+import time
+import timeit
+import asyncio
+import platform
+import statistics
+import subprocess
+import datetime as dt
+
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Callable
+
+import aiohttp
+import requests
+
+from fastcore.script import call_parse
+
+import nbdev_domo
+import nbdev_domo.utils as utils
+import nbdev_domo.Codec as cd
+import nbdev_domo.Logger as lg
+import nbdev_domo.DomoAuth as dmda
+import nbdev_domo.DomoAccount as dmac
+from .ResponseGetData import ResponseGetData
+from .Transport import TransportAsync
+from .Session import SessionRegistry, session_registry
+from .RateLimiter import RateLimiterRegistry
+from .MockServer import MockDomoServer, MockServerConfig, _make_dataset
+
+# %% ../nbs/98_Benchmarks.ipynb 5
+@dataclass
+class BenchmarkResult:
+    """summary of one benchmark, durations are microseconds per operation"""
+
+    name: str
+    params: dict
+    samples: int
+    median_us: float
+    mean_us: float
+    p90_us: float
+    min_us: float
+    max_us: float
+    ops_per_second: float
+    extra: dict = field(default_factory=dict)  # benchmark specific values, e.g. payload bytes
+
+    @property
+    def key(self) -> str:
+        return self.name + json.dumps(self.params, sort_keys=True)
+
+    @classmethod
+    def _from_durations(cls,
+                        name: str,
+                        durations: List[float],  # seconds per operation
+                        params: Optional[dict] = None,
+                        ops_per_second: Optional[float] = None,  # defaults to 1 / median
+                        **extra):
+        durations = sorted(durations)
+        median = statistics.median(durations)
+
+        return cls(name=name,
+                   params=params or {},
+                   samples=len(durations),
+                   median_us=median * 1e6,
+                   mean_us=statistics.mean(durations) * 1e6,
+                   p90_us=durations[max(int(len(durations) * 0.9 + 0.5), 1) - 1] * 1e6,
+                   min_us=durations[0] * 1e6,
+                   max_us=durations[-1] * 1e6,
+                   ops_per_second=ops_per_second or (1 / median if median else float('inf')),
+                   extra=extra)
+
+
+def _time_repeat(fn: Callable, number: int, repeat: int) -> List[float]:
+    """seconds per call for each of `repeat` timings of `number` calls"""
+    return [seconds / number for seconds in timeit.repeat(fn, number=number, repeat=repeat)]
+
+# %% ../nbs/98_Benchmarks.ipynb 7
+async def bench_transport_throughput(server: MockDomoServer,  # a started server
+                                     request_count: int = 200,
+                                     concurrency: int = 20,
+                                     reuse_session: bool = True
+                                     ) -> BenchmarkResult:
+    url = f'{server.base_url}/api/data/v1/accounts/5'
+    auth_header = {'x-domo-developer-token': server.config.domo_access_token}
+
+    session_registry = SessionRegistry(close_at_exit=False)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    transport = TransportAsync(auth_header=auth_header,
+                               session_registry=session_registry,
+                               rate_limiter_registry=RateLimiterRegistry(rate=None))
+
+    async def send():
+        async with semaphore:
+            started_at = time.perf_counter()
+
+            if reuse_session:
+                res = await transport.get(url, coalesce=False)
+
+            else:
+                async with aiohttp.ClientSession() as session:
+                    res = await transport.get(url, session=session, coalesce=False)
+
+            if not res.is_success:
+                raise Exception(f'benchmark request failed with status {res.status}')
+
+            return time.perf_counter() - started_at
+
+    try:
+        started_at = time.perf_counter()
+        durations = await asyncio.gather(*[send() for _ in range(request_count)])
+        elapsed = time.perf_counter() - started_at
+
+    finally:
+        await session_registry.close()
+
+    return BenchmarkResult._from_durations('transport_throughput', durations,
+                                           params={'request_count': request_count,
+                                                   'concurrency': concurrency,
+                                                   'reuse_session': reuse_session},
+                                           ops_per_second=request_count / elapsed,
+                                           elapsed_seconds=elapsed)
+
+# %% ../nbs/98_Benchmarks.ipynb 9
+def bench_response_parsing(account_count: int = 100,  # accounts in the payload
+                           number: int = 20,
+                           repeat: int = 5
+                           ) -> BenchmarkResult:
+    accounts, _ = _make_dataset(MockServerConfig(account_count=account_count))
+
+    res = requests.Response()
+    res.status_code = 200
+    res.headers['Content-Type'] = 'application/json'
+    res._content = cd.codec.dumps(list(accounts.values())).encode('utf-8')
+
+    # response is decoded lazily, so access it to time the parse
+    durations = _time_repeat(lambda: ResponseGetData._from_requests_response(res).response, number, repeat)
+
+    return BenchmarkResult._from_durations('response_parsing', durations,
+                                           params={'account_count': account_count, 'codec': cd.codec.name},
+                                           payload_bytes=len(res._content))
+
+# %% ../nbs/98_Benchmarks.ipynb 11
+async def bench_get_from_id(server: MockDomoServer,  # a started server that routes point at
+                            iterations: int = 50,
+                            account_id: int = 5
+                            ) -> BenchmarkResult:
+    full_auth = dmda.DomoFullAuth(domo_instance='domo-dojo',
+                                  domo_username=server.config.domo_username,
+                                  domo_password=server.config.domo_password)
+    await full_auth.get_auth_token()
+
+    durations = []
+
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await dmac.DomoAccount.get_from_id(full_auth=full_auth, account_id=account_id)
+        durations.append(time.perf_counter() - started_at)
+
+    return BenchmarkResult._from_durations('get_from_id', durations, params={'iterations': iterations})
+
+# %% ../nbs/98_Benchmarks.ipynb 13
+def bench_dictdot(account_count: int = 100,  # accounts in the converted list
+                  number: int = 20,
+                  repeat: int = 5
+                  ) -> BenchmarkResult:
+    """DictDot construction for a response shaped like get_accounts"""
+
+    accounts, account_configs = _make_dataset(MockServerConfig(account_count=account_count))
+    obj = {'accounts': [{**account, 'config': account_configs[account_id]} for account_id, account in accounts.items()]}
+
+    durations = _time_repeat(lambda: utils.DictDot(obj), number, repeat)
+
+    return BenchmarkResult._from_durations('dictdot', durations, params={'account_count': account_count})
+
+
+def bench_logger_add_log(number: int = 1000,
+                         repeat: int = 5
+                         ) -> BenchmarkResult:
+    """Logger._add_log, which extracts and summarizes the stack on every call"""
+
+    logger = lg.Logger(app_name='benchmark', domo_instance='domo-dojo')
+
+    def add_log():
+        logger._add_log(message='benchmark message', type_str='Info', num_stacks_to_drop=1)
+
+    durations = []
+
+    for _ in range(repeat):
+        durations += _time_repeat(add_log, number, 1)
+        logger.logs.clear()
+
+    return BenchmarkResult._from_durations('logger_add_log', durations)
+
+# %% ../nbs/98_Benchmarks.ipynb 15
+def _get_git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# %% ../nbs/98_Benchmarks.ipynb 16
+async def run_benchmarks(quick: bool = False  # smaller sizes, for checking that the suite runs
+                         ) -> dict:
+    scale = 10 if quick else 1
+    results = []
+
+    async with MockDomoServer(MockServerConfig(seed=1)) as server:
+        for reuse_session in (True, False):
+            results.append(await bench_transport_throughput(server, request_count=200 // scale, reuse_session=reuse_session))
+
+        results.append(await bench_get_from_id(server, iterations=50 // scale))
+
+        # routes borrow the process-wide pooled session, which can't be closed once the loop is gone
+        await session_registry.close(server.base_url)
+
+    for account_count in ((10, 100, 1000) if quick else (10, 1000, 10000)):
+        results.append(bench_response_parsing(account_count=account_count, number=max(20 // scale, 2)))
+
+    results.append(bench_dictdot(account_count=1000 // scale))
+    results.append(bench_logger_add_log(number=1000 // scale))
+
+    return {'meta': {'created_at': dt.datetime.now().isoformat(),
+                     'git_commit': _get_git_commit(),
+                     'version': nbdev_domo.__version__,
+                     'python': platform.python_version(),
+                     'platform': platform.platform(),
+                     'codec': cd.codec.name,
+                     'quick': quick},
+            'results': [asdict(result) for result in results]}
+
+# %% ../nbs/98_Benchmarks.ipynb 17
+def compare_benchmarks(baseline: dict,  # run_benchmarks output from the earlier commit
+                       current: dict,  # run_benchmarks output from the later commit
+                       threshold: float = 0.1  # relative change in median_us reported as a regression / improvement
+                       ) -> List[dict]:
+    """matches results by name and params and reports the change in median duration"""
+
+    baseline_results = {BenchmarkResult(**result).key: result for result in baseline['results']}
+    comparison = []
+
+    for result in current['results']:
+        baseline_result = baseline_results.get(BenchmarkResult(**result).key)
+
+        if baseline_result is None:
+            continue
+
+        change = result['median_us'] / baseline_result['median_us'] - 1
+
+        comparison.append({'name': result['name'],
+                           'params': result['params'],
+                           'baseline_median_us': baseline_result['median_us'],
+                           'current_median_us': result['median_us'],
+                           'change': change,
+                           'status': 'regression' if change > threshold else 'improvement' if change < -threshold else 'unchanged'})
+
+    return comparison
+
+# %% ../nbs/98_Benchmarks.ipynb 22
+@call_parse
+def domo_benchmarks(output: str = 'benchmarks.json',  # file the results are written to
+                    baseline: str = None,  # results from another commit to compare against
+                    threshold: float = 0.1,  # relative change reported as a regression / improvement
+                    quick: bool = False  # smaller sizes, for checking that the suite runs
+                    ):
+    """run the benchmark suite against a local MockDomoServer"""
+
+    benchmarks = asyncio.run(run_benchmarks(quick=quick))
+
+    with open(output, 'w') as f:
+        json.dump(benchmarks, f, indent=2)
+
+    if not baseline:
+        return
+
+    with open(baseline) as f:
+        comparison = compare_benchmarks(json.load(f), benchmarks, threshold=threshold)
+
+    for row in comparison:
+        print(f"{row['status']:<12} {row['change']:+7.1%}  {row['name']} {json.dumps(row['params'])}")
+
+    if any(row['status'] == 'regression' for row in comparison):
+        sys.exit(1)
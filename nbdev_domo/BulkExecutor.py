@@ -0,0 +1,172 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/70_BulkExecutor.ipynb.
+
+# %% auto 0
+__all__ = ['BulkSpec', 'BulkResult', 'BulkSummary', 'BulkExecutor']
+
+# %% ../nbs/70_BulkExecutor.ipynb 3
+import asyncio
+import inspect
+import math
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Union
+
+import aiohttp
+
+from fastcore.basics import patch_to
+
+from .ResponseGetData import ResponseGetData
+
+# %% ../nbs/70_BulkExecutor.ipynb 5
+@dataclass
+class BulkResult:
+    """outcome of one item in a bulk run"""
+
+    index: int  # position of the item in the input iterable
+    spec: Any = field(repr=False)  # the coroutine or (function, kwargs) that was run
+    result: Any = field(default=None, repr=False)
+    exception: Optional[BaseException] = None
+    elapsed: float = 0  # seconds from start to completion of the item
+
+    @property
+    def is_success(self) -> bool:
+        if self.exception is not None:
+            return False
+
+        if isinstance(self.result, ResponseGetData):
+            return self.result.is_success
+
+        return True
+
+
+@dataclass
+class BulkSummary:
+    """throughput and latency percentiles for a bulk run"""
+
+    total: int
+    succeeded: int
+    failed: int
+    elapsed: float  # wall clock seconds for the whole run
+    throughput: float  # completed items per second
+    latency_p50: Optional[float] = None
+    latency_p90: Optional[float] = None
+    latency_p99: Optional[float] = None
+    latency_max: Optional[float] = None
+    failures: List[BulkResult] = field(default_factory=list, repr=False)
+    results: List[BulkResult] = field(default_factory=list, repr=False)  # all results in completion order
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+        """nearest-rank percentile"""
+        if not sorted_values:
+            return None
+
+        rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+        return sorted_values[rank - 1]
+
+    @classmethod
+    def _from_results(cls, results: List[BulkResult], elapsed: float):
+        latencies = sorted(result.elapsed for result in results)
+        failures = [result for result in results if not result.is_success]
+
+        return cls(total=len(results),
+                   succeeded=len(results) - len(failures),
+                   failed=len(failures),
+                   elapsed=elapsed,
+                   throughput=len(results) / elapsed if elapsed else 0,
+                   latency_p50=cls._percentile(latencies, 50),
+                   latency_p90=cls._percentile(latencies, 90),
+                   latency_p99=cls._percentile(latencies, 99),
+                   latency_max=latencies[-1] if latencies else None,
+                   failures=failures,
+                   results=results)
+
+# %% ../nbs/70_BulkExecutor.ipynb 7
+BulkSpec = Union[Awaitable, tuple]
+
+
+class BulkExecutor:
+    """runs route coroutines with a concurrency cap and collects per-item failures"""
+
+    def __init__(self,
+                 max_concurrency: int = 10,  # max items in flight at once
+                 session: Optional[aiohttp.ClientSession] = None  # passed to (function, kwargs) specs that accept a session
+                 ):
+
+        self.max_concurrency = max_concurrency
+        self.session = session
+
+    def _to_coroutine(self, spec: BulkSpec):
+        if inspect.isawaitable(spec):
+            return spec
+
+        fn, kwargs = spec
+        kwargs = dict(kwargs or {})
+
+        if self.session is not None and 'session' not in kwargs and 'session' in inspect.signature(fn).parameters:
+            kwargs['session'] = self.session
+
+        return fn(**kwargs)
+
+    async def _run_one(self, index: int, spec: BulkSpec) -> BulkResult:
+        started_at = time.perf_counter()
+
+        try:
+            result = await self._to_coroutine(spec)
+            return BulkResult(index=index, spec=spec, result=result, elapsed=time.perf_counter() - started_at)
+
+        except Exception as e:
+            return BulkResult(index=index, spec=spec, exception=e, elapsed=time.perf_counter() - started_at)
+
+# %% ../nbs/70_BulkExecutor.ipynb 8
+@patch_to(BulkExecutor)
+async def iter_results(self,
+                       specs: Iterable[BulkSpec]  # coroutines or (function, kwargs) tuples
+                       ) -> AsyncIterator[BulkResult]:
+    """async generator that yields results in completion order"""
+
+    specs = enumerate(specs)
+    pending = set()
+
+    def fill():
+        for index, spec in specs:
+            pending.add(asyncio.ensure_future(self._run_one(index, spec)))
+
+            if len(pending) >= self.max_concurrency:
+                break
+
+    try:
+        fill()
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            fill()
+
+            for task in done:
+                yield task.result()
+
+    finally:
+        # the consumer stopped early
+        for task in pending:
+            task.cancel()
+
+
+@patch_to(BulkExecutor)
+async def run(self,
+              specs: Iterable[BulkSpec],  # coroutines or (function, kwargs) tuples
+              on_result: Optional[Callable[[BulkResult], None]] = None  # called as each item completes
+              ) -> BulkSummary:
+    """runs every spec and returns a BulkSummary with throughput and latency percentiles"""
+
+    started_at = time.perf_counter()
+    results = []
+
+    async for result in self.iter_results(specs):
+        results.append(result)
+
+        if on_result:
+            on_result(result)
+
+    return BulkSummary._from_results(results, elapsed=time.perf_counter() - started_at)
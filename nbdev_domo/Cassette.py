@@ -0,0 +1,275 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_Cassette.ipynb.
+
+# %% auto 0
+__all__ = ['make_cassette_key', 'CassetteEntry', 'CassetteMissError', 'Cassette', 'get_cassette', 'set_cassette']
+
+# %% ../nbs/97_Cassette.ipynb 3
+import gzip
+import time
+import asyncio
+import hashlib
+import threading
+
+from dataclasses import dataclass, asdict
+from typing import Optional, Union, Dict, List, FrozenSet
+
+from fastcore.basics import patch_to
+
+import nbdev_domo.Codec as cd
+from .ResponseGetData import ResponseGetData
+from .utils import REDACTED_HEADERS, REDACTED_KEYS, redact, redact_body, redact_headers
+
+# %% ../nbs/97_Cassette.ipynb 6
+def make_cassette_key(method: str,
+                      url: str,
+                      params: Optional[dict] = None,
+                      body: Optional[str] = None  # the redacted request body
+                      ) -> str:
+    """identifies a request independently of its headers"""
+
+    params_str = cd.codec.dumps(sorted(params.items())) if params else ''
+    body_digest = hashlib.sha1(body.encode('utf-8')).hexdigest() if body else ''
+
+    return f'{method} {url} {params_str} {body_digest}'
+
+
+@dataclass
+class CassetteEntry:
+    """a recorded request and its response"""
+
+    key: str
+    method: str
+    url: str
+    status: int
+    response: Union[list, dict, str]
+    is_success: bool
+    params: Optional[dict] = None
+    request_headers: Optional[dict] = None
+    request_body: Optional[str] = None
+    headers: Optional[dict] = None  # the response headers listed in SELECTED_HEADERS
+    elapsed: float = 0  # seconds the request took when it was recorded
+
+    def to_response(self, auth_header: Optional[dict] = None) -> ResponseGetData:
+        return ResponseGetData(status=self.status,
+                               response=self.response,
+                               is_success=self.is_success,
+                               auth_header=auth_header,
+                               headers=self.headers)
+
+# %% ../nbs/97_Cassette.ipynb 8
+class CassetteMissError(Exception):
+    """raised in replay mode for a request that isn't in the cassette"""
+
+    def __init__(self, key: str):
+        super().__init__(f'no recorded response for {key}')
+        self.key = key
+
+
+class Cassette:
+    """record transport traffic to disk, or replay it without a network"""
+
+    index: Dict[str, List[CassetteEntry]]
+
+    def __init__(self,
+                 path: str,  # cassette file, gzipped if it ends in .gz
+                 mode: str = 'replay',  # 'record' or 'replay'
+                 simulate_latency: Union[bool, float] = False,  # True sleeps the recorded elapsed, a number sleeps that many seconds
+                 redacted_headers: FrozenSet[str] = REDACTED_HEADERS,  # lower case header names
+                 redacted_keys: FrozenSet[str] = REDACTED_KEYS
+                 ):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"mode must be 'record' or 'replay', not {mode!r}")
+
+        self.path = path
+        self.mode = mode
+        self.simulate_latency = simulate_latency
+        self.redacted_headers = redacted_headers
+        self.redacted_keys = redacted_keys
+
+        self.index = {}
+        self._cursors = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._previous_cassette = None
+
+        if mode == 'replay':
+            self.load()
+
+    @property
+    def is_recording(self) -> bool:
+        return self.mode == 'record'
+
+    @property
+    def is_replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.index.values())
+
+    def _open(self, file_mode: str):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, file_mode + 't', encoding='utf-8')
+
+        return open(self.path, file_mode, encoding='utf-8')
+
+# %% ../nbs/97_Cassette.ipynb 9
+@patch_to(Cassette)
+def load(self):
+    """reads the cassette file into the index"""
+
+    self.index = {}
+    self._cursors = {}
+
+    with self._open('r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+
+            entry = CassetteEntry(**cd.codec.loads(line))
+            self.index.setdefault(entry.key, []).append(entry)
+
+
+@patch_to(Cassette)
+def close(self):
+    with self._lock:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+# %% ../nbs/97_Cassette.ipynb 10
+@patch_to(Cassette)
+def record(self,
+           method: str,
+           url: str,
+           params: Optional[dict],
+           body: Union[str, bytes, None],  # the serialized request body
+           request_headers: Optional[dict],
+           rgd: ResponseGetData,
+           elapsed: float = 0
+           ) -> CassetteEntry:
+    """redacts and appends a request / response pair to the cassette"""
+
+    request_body = redact_body(body, self.redacted_keys)
+
+    entry = CassetteEntry(key=make_cassette_key(method, url, params, request_body),
+                          method=method,
+                          url=url,
+                          params=params or None,
+                          request_headers=redact_headers(request_headers or {}, self.redacted_headers),
+                          request_body=request_body,
+                          status=rgd.status,
+                          response=redact(rgd.response, self.redacted_keys),
+                          is_success=rgd.is_success,
+                          headers=rgd.headers,
+                          elapsed=elapsed)
+
+    line = cd.codec.dumps(asdict(entry)) + '\n'
+
+    with self._lock:
+        if self._file is None:
+            self._file = self._open('w')
+
+        self._file.write(line)
+        self._file.flush()
+
+        self.index.setdefault(entry.key, []).append(entry)
+
+    return entry
+
+# %% ../nbs/97_Cassette.ipynb 11
+@patch_to(Cassette)
+def get(self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        body: Union[str, bytes, None] = None  # the serialized request body
+        ) -> CassetteEntry:
+    """the next recorded entry for a request, raises CassetteMissError"""
+
+    key = make_cassette_key(method, url, params, redact_body(body, self.redacted_keys))
+    entries = self.index.get(key)
+
+    if not entries:
+        raise CassetteMissError(key)
+
+    if len(entries) == 1:
+        return entries[0]
+
+    with self._lock:
+        cursor = self._cursors.get(key, 0)
+        self._cursors[key] = cursor + 1
+
+    return entries[min(cursor, len(entries) - 1)]
+
+
+@patch_to(Cassette)
+def _get_delay(self, entry: CassetteEntry) -> float:
+    if self.simulate_latency is True:
+        return entry.elapsed
+
+    return self.simulate_latency or 0
+
+
+@patch_to(Cassette)
+def replay(self, method: str, url: str, params: Optional[dict] = None, body: Union[str, bytes, None] = None,
+           auth_header: Optional[dict] = None) -> ResponseGetData:
+    entry = self.get(method, url, params, body)
+    delay = self._get_delay(entry)
+
+    if delay:
+        time.sleep(delay)
+
+    return entry.to_response(auth_header)
+
+
+@patch_to(Cassette)
+async def replay_async(self, method: str, url: str, params: Optional[dict] = None, body: Union[str, bytes, None] = None,
+                       auth_header: Optional[dict] = None) -> ResponseGetData:
+    entry = self.get(method, url, params, body)
+    delay = self._get_delay(entry)
+
+    if delay:
+        await asyncio.sleep(delay)
+
+    return entry.to_response(auth_header)
+
+# %% ../nbs/97_Cassette.ipynb 13
+_cassette: Optional[Cassette] = None
+
+# %% ../nbs/97_Cassette.ipynb 14
+def get_cassette() -> Optional[Cassette]:
+    """the process-wide cassette, or None"""
+    return _cassette
+
+
+def set_cassette(cassette: Optional[Cassette] = None) -> Optional[Cassette]:
+    """sets the process-wide cassette used by transports that weren't given one, returns the previous cassette"""
+
+    global _cassette
+
+    previous_cassette = _cassette
+    _cassette = cassette
+
+    return previous_cassette
+
+
+@patch_to(Cassette)
+def __enter__(self):
+    self._previous_cassette = set_cassette(self)
+    return self
+
+
+@patch_to(Cassette)
+def __exit__(self, exc_type, exc, tb):
+    set_cassette(self._previous_cassette)
+    self.close()
+
+
+@patch_to(Cassette)
+async def __aenter__(self):
+    return self.__enter__()
+
+
+@patch_to(Cassette)
+async def __aexit__(self, exc_type, exc, tb):
+    self.__exit__(exc_type, exc, tb)
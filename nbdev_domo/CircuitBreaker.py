@@ -0,0 +1,219 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_CircuitBreaker.ipynb.
+
+# %% auto 0
+__all__ = ['circuit_breaker_registry', 'CircuitState', 'CircuitOpenError', 'CircuitBreaker', 'CircuitBreakerRegistry']
+
+# %% ../nbs/97_CircuitBreaker.ipynb 3
+import time
+
+from collections import deque
+
+from enum import Enum
+from typing import Optional, Dict, Deque
+
+from fastcore.basics import patch_to
+
+import nbdev_domo.utils as utils
+import nbdev_domo.Logger as lg
+
+# %% ../nbs/97_CircuitBreaker.ipynb 5
+class CircuitState(Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """raised instead of sending a request while the host's circuit is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f'circuit open for {host}, retry in {retry_in:.1f}s')
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """closed / open / half-open circuit breaker for one host"""
+
+    events: Deque[dict]
+
+    def __init__(self,
+                 host: str,  # host of the Domo instance, used in errors and log messages
+                 failure_threshold: int = 5,  # consecutive failures that open the circuit
+                 reset_timeout: float = 30,  # seconds the circuit stays open before probes are allowed
+                 half_open_max_calls: int = 1,  # probe requests allowed at once while half-open
+                 logger: Optional[lg.Logger] = None,  # receives state transitions
+                 max_events: int = 100  # transitions kept in events, older ones are dropped
+                 ):
+
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.logger = logger
+
+        self.events = deque(maxlen=max_events)
+        self.failure_count = 0
+        self.rejected_count = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """an open circuit becomes half-open once reset_timeout has passed"""
+
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._transition(CircuitState.HALF_OPEN, 'reset timeout elapsed')
+
+        return self._state
+
+# %% ../nbs/97_CircuitBreaker.ipynb 6
+@patch_to(CircuitBreaker)
+def _transition(self, state: CircuitState, reason: str):
+    previous, self._state = self._state, state
+
+    if state == CircuitState.OPEN:
+        self._opened_at = time.monotonic()
+
+    if state != CircuitState.HALF_OPEN:
+        self._probes_in_flight = 0
+
+    event = {'host': self.host, 'from_state': previous.value, 'to_state': state.value,
+             'reason': reason, 'failure_count': self.failure_count}
+    self.events.append(event)
+
+    if not self.logger:
+        return
+
+    message = f'circuit {previous.value} -> {state.value} for {self.host}: {reason}'
+
+    if state == CircuitState.OPEN:
+        self.logger.log_warning(message, domo_instance=self.host)
+    else:
+        self.logger.log_info(message, domo_instance=self.host)
+
+
+@patch_to(CircuitBreaker)
+def before_request(self):
+    """call before sending a request.  raises CircuitOpenError if the request must not be sent"""
+
+    state = self.state
+
+    if state == CircuitState.CLOSED:
+        return
+
+    if state == CircuitState.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+        self._probes_in_flight += 1
+        return
+
+    self.rejected_count += 1
+    raise CircuitOpenError(self.host, max(0, self._opened_at + self.reset_timeout - time.monotonic()))
+
+
+@patch_to(CircuitBreaker)
+def on_success(self):
+    self.failure_count = 0
+
+    if self._state == CircuitState.HALF_OPEN:
+        self._transition(CircuitState.CLOSED, 'probe succeeded')
+
+
+@patch_to(CircuitBreaker)
+def on_failure(self,
+               reason: str = 'request failed'
+               ):
+    self.failure_count += 1
+
+    if self._state == CircuitState.HALF_OPEN:
+        self._transition(CircuitState.OPEN, f'probe failed, {reason}')
+
+    elif self._state == CircuitState.CLOSED and self.failure_count >= self.failure_threshold:
+        self._transition(CircuitState.OPEN, f'{self.failure_count} consecutive failures, {reason}')
+
+
+@patch_to(CircuitBreaker)
+def on_response(self,
+                status: int  # HTTP status of the completed request
+                ):
+    """5xx responses count as failures, any other response as a success"""
+
+    if status >= 500:
+        self.on_failure(f'status {status}')
+    else:
+        self.on_success()
+
+
+@patch_to(CircuitBreaker)
+def release(self):
+    """frees a half-open probe slot for a request that was cancelled before it completed"""
+
+    if self._state == CircuitState.HALF_OPEN and self._probes_in_flight:
+        self._probes_in_flight -= 1
+
+# %% ../nbs/97_CircuitBreaker.ipynb 11
+class CircuitBreakerRegistry:
+    """process-wide registry of CircuitBreakers keyed by host"""
+
+    breakers: Dict[str, CircuitBreaker]
+
+    def __init__(self,
+                 failure_threshold: Optional[int] = 5,  # default consecutive failures per host, None disables the breakers
+                 reset_timeout: float = 30,  # default seconds a circuit stays open
+                 half_open_max_calls: int = 1,
+                 logger: Optional[lg.Logger] = None,  # receives transitions of every breaker, defaults to a Logger owned by the registry
+                 max_events: int = 100  # transitions kept per breaker, and in the registry's own logger
+                 ):
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.max_events = max_events
+        self.breakers = {}
+
+        if logger is None:
+            logger = lg.Logger(app_name='circuit_breaker')
+            # the registry's own logger lives as long as the process, so it keeps only the latest transitions
+            logger.logs = deque(maxlen=max_events)
+
+        self.logger = logger
+
+    def configure(self,
+                  url: str,  # url or host of the Domo instance
+                  failure_threshold: int,
+                  reset_timeout: Optional[float] = None,
+                  **kwargs  # passed to CircuitBreaker
+                  ) -> CircuitBreaker:
+        """sets the thresholds for one host, replacing its existing breaker"""
+
+        host = utils.convert_url_to_host(url)
+        kwargs.setdefault('max_events', self.max_events)
+        breaker = CircuitBreaker(host, failure_threshold=failure_threshold,
+                                 reset_timeout=self.reset_timeout if reset_timeout is None else reset_timeout,
+                                 logger=self.logger, **kwargs)
+        self.breakers[host] = breaker
+        return breaker
+
+    def get_breaker(self,
+                    url: str  # url or host the request will be sent to
+                    ) -> Optional[CircuitBreaker]:
+        """returns the breaker for the url's host, or None if circuit breaking is disabled"""
+
+        host = utils.convert_url_to_host(url)
+        breaker = self.breakers.get(host)
+
+        if breaker is None and self.failure_threshold:
+            breaker = CircuitBreaker(host, failure_threshold=self.failure_threshold, reset_timeout=self.reset_timeout,
+                                     half_open_max_calls=self.half_open_max_calls, logger=self.logger,
+                                     max_events=self.max_events)
+            self.breakers[host] = breaker
+
+        return breaker
+
+    @property
+    def states(self) -> Dict[str, str]:
+        """current state of every host's circuit"""
+        return {host: breaker.state.value for host, breaker in self.breakers.items()}
+
+# %% ../nbs/97_CircuitBreaker.ipynb 12
+circuit_breaker_registry = CircuitBreakerRegistry()
@@ -0,0 +1,134 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/99_Codec.ipynb.
+
+# %% auto 0
+__all__ = ['codec', 'JsonCodec', 'OrjsonCodec', 'MsgspecCodec', 'get_available_codecs', 'set_codec', 'benchmark_codecs']
+
+# %% ../nbs/99_Codec.ipynb 3
+import json
+import math
+import timeit
+
+from enum import Enum
+
+from typing import Any, Union, Optional, List
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# %% ../nbs/99_Codec.ipynb 5
+class JsonCodec:
+    """standard library json codec, the base class for faster codecs"""
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+def _orjson_differs(obj: Any) -> bool:
+    """True if obj holds values orjson encodes differently from the standard library: plain Enums and NaN / infinity"""
+
+    if isinstance(obj, dict):
+        return any(_orjson_differs(key) or _orjson_differs(value) for key, value in obj.items())
+
+    if isinstance(obj, (list, tuple)):
+        return any(_orjson_differs(item) for item in obj)
+
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+
+    # str / int Enums encode as their value in both libraries
+    return isinstance(obj, Enum) and not isinstance(obj, (str, int))
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec.  datetimes and dataclasses are passed through to default=str, and bodies holding Enums or NaN go to the standard library, to match its output"""
+
+    name = 'orjson'
+
+    def __init__(self):
+        self.option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> str:
+        if _orjson_differs(obj):
+            return super().dumps(obj)
+
+        try:
+            return orjson.dumps(obj, default=str, option=self.option).decode('utf-8')
+
+        # e.g. integers larger than 64 bits
+        except (TypeError, orjson.JSONEncodeError):
+            return super().dumps(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec decoder.  encoding stays on the standard library because msgspec has no way to route datetimes to default=str"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+# %% ../nbs/99_Codec.ipynb 6
+def get_available_codecs() -> List[JsonCodec]:
+    """installed codecs, fastest first"""
+
+    codecs = []
+
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+
+    if msgspec is not None:
+        codecs.append(MsgspecCodec())
+
+    codecs.append(JsonCodec())
+
+    return codecs
+
+
+codec = get_available_codecs()[0]
+
+
+def set_codec(new_codec: JsonCodec):
+    """replaces the codec used by Transport and ResponseGetData"""
+    global codec
+    codec = new_codec
+
+# %% ../nbs/99_Codec.ipynb 11
+def benchmark_codecs(payload: Any,  # a representative request or response body
+                     number: int = 20,  # calls per timing
+                     repeat: int = 3,  # timings per measurement, the fastest is kept
+                     codecs: Optional[List[JsonCodec]] = None  # defaults to get_available_codecs()
+                     ) -> List[dict]:
+    """returns dumps / loads microseconds per call for each codec"""
+
+    results = []
+
+    for bench_codec in codecs or get_available_codecs():
+        encoded = bench_codec.dumps(payload).encode('utf-8')
+
+        dumps_seconds = min(timeit.repeat(lambda: bench_codec.dumps(payload), number=number, repeat=repeat))
+        loads_seconds = min(timeit.repeat(lambda: bench_codec.loads(encoded), number=number, repeat=repeat))
+
+        results.append({'codec': bench_codec.name,
+                        'payload_bytes': len(encoded),
+                        'dumps_us': dumps_seconds / number * 1e6,
+                        'loads_us': loads_seconds / number * 1e6})
+
+    return results
@@ -0,0 +1,230 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/96_CsvMaterializer.ipynb.
+
+# %% auto 0
+__all__ = ['CsvMaterializer']
+
+# %% ../nbs/96_CsvMaterializer.ipynb 3
+import csv
+import io
+
+from typing import Optional, Dict, List, Union
+
+import pandas as pd
+
+from fastcore.basics import patch_to
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    # pyarrow 14 replaced concat_tables(promote = True) with promote_options
+    _CONCAT_PROMOTE = {'promote_options': 'default'} if int(pa.__version__.split('.')[0]) >= 14 else {'promote': True}
+except ImportError:
+    pa = None
+
+# %% ../nbs/96_CsvMaterializer.ipynb 5
+def _find_record_end(data: Union[bytes, bytearray],
+                     last: bool = True  # end of the last complete record, otherwise of the first
+                     ) -> int:
+    """returns the offset just past a complete record, or 0.  a newline inside a quoted value doesn't end a record"""
+
+    end = data.rfind(b'\n') if last else data.find(b'\n')
+
+    while end != -1:
+        if data.count(b'"', 0, end) % 2 == 0:
+            return end + 1
+
+        end = data.rfind(b'\n', 0, end) if last else data.find(b'\n', end + 1)
+
+    return 0
+
+
+# pandas dtypes and pyarrow aliases for the same type, so a column_types hint means the same with either backend
+_PANDAS_TO_ARROW = {'float64': 'double', 'float32': 'float', 'float16': 'halffloat', 'object': 'string', 'str': 'string',
+                    'boolean': 'bool', 'Int64': 'int64', 'Int32': 'int32', 'Float64': 'double'}
+
+_ARROW_TO_PANDAS = {'double': 'float64', 'float': 'float32', 'halffloat': 'float16', 'utf8': 'string',
+                    'large_string': 'string'}
+
+
+def _arrow_type(hint: str) -> 'pa.DataType':
+    if hint == 'category':
+        return pa.dictionary(pa.int32(), pa.string())
+
+    # datetime64[ns] -> timestamp[ns]
+    if hint.startswith('datetime64'):
+        hint = 'timestamp' + (hint[len('datetime64'):] or '[ns]')
+
+    return pa.type_for_alias(_PANDAS_TO_ARROW.get(hint, hint))
+
+
+def _is_date_hint(hint: str) -> bool:
+    return hint.startswith(('datetime64', 'timestamp', 'date'))
+
+
+def _pandas_dtype(hint: str) -> str:
+    hint = _ARROW_TO_PANDAS.get(hint, hint)
+    pd.api.types.pandas_dtype(hint)  # raises TypeError for unknown dtypes
+    return hint
+
+
+class CsvMaterializer:
+    """incrementally parses byte chunks of a csv export into columnar blocks"""
+
+    column_names: Optional[List[str]]
+    blocks_parsed: int
+
+    def __init__(self,
+                 column_types: Optional[Dict[str, str]] = None,  # column name to a pandas dtype or pyarrow type alias
+                 backend: str = 'auto',  # auto, pyarrow or pandas
+                 block_size: int = 2 ** 23,  # bytes of csv buffered before a block is parsed
+                 has_header: bool = True,  # the first record holds the column names
+                 column_names: Optional[List[str]] = None,  # required if has_header is False, replaces the header names otherwise
+                 encoding: str = 'utf-8'
+                 ):
+
+        if backend == 'auto':
+            backend = 'pyarrow' if pa is not None else 'pandas'
+
+        if backend not in ('pyarrow', 'pandas'):
+            raise ValueError(f'unknown backend {backend}')
+
+        if backend == 'pyarrow' and pa is None:
+            raise ImportError('pyarrow is not installed, use backend = "pandas"')
+
+        if not has_header and not column_names:
+            raise ValueError('column_names are required when the csv has no header')
+
+        self.column_types = column_types or {}
+        self.backend = backend
+        self.block_size = block_size
+        self.has_header = has_header
+        self.column_names = column_names
+        self.encoding = encoding
+
+        try:
+            if backend == 'pyarrow':
+                # types of unhinted columns are pinned from the first block that has values
+                self._arrow_types = {name: _arrow_type(hint) for name, hint in self.column_types.items()}
+
+            else:
+                self._date_columns = [name for name, hint in self.column_types.items() if _is_date_hint(hint)]
+                self._dtypes = {name: _pandas_dtype(hint) for name, hint in self.column_types.items()
+                                if name not in self._date_columns}
+
+        except (ValueError, TypeError) as e:
+            raise ValueError(f'unsupported column_types for the {backend} backend: {e}')
+
+        self.blocks_parsed = 0
+        self._header_read = not has_header
+        self._buffer = bytearray()
+
+# %% ../nbs/96_CsvMaterializer.ipynb 6
+@patch_to(CsvMaterializer)
+def _read_header(self) -> bool:
+    """takes the header record off the buffer, returns False until it has fully arrived"""
+
+    end = _find_record_end(self._buffer, last=False)
+
+    if not end:
+        return False
+
+    header = next(csv.reader(io.StringIO(self._buffer[:end].decode(self.encoding))), [])
+    self.column_names = self.column_names or header
+    self._header_read = True
+    del self._buffer[:end]
+
+    return True
+
+
+@patch_to(CsvMaterializer)
+def _parse_block(self, block: bytearray):
+    if self.backend == 'pyarrow':
+        read_options = pa_csv.ReadOptions(column_names=self.column_names, encoding=self.encoding)
+        convert_options = pa_csv.ConvertOptions(column_types=self._arrow_types)
+
+        table = pa_csv.read_csv(pa.BufferReader(block), read_options=read_options, convert_options=convert_options)
+
+        # later blocks use the same types, so the blocks can be concatenated
+        for column in table.schema:
+            if column.name not in self._arrow_types and not pa.types.is_null(column.type):
+                self._arrow_types[column.name] = column.type
+
+        return table
+
+    return pd.read_csv(io.BytesIO(block), header=None, names=self.column_names, dtype=self._dtypes or None,
+                       parse_dates=self._date_columns or False, encoding=self.encoding, engine='c')
+
+
+@patch_to(CsvMaterializer)
+def _empty_block(self):
+    if self.backend == 'pyarrow':
+        return pa.table({name: pa.array([], type=self._arrow_types.get(name, pa.string()))
+                         for name in self.column_names or []})
+
+    return pd.DataFrame({name: pd.Series(dtype='datetime64[ns]' if name in self._date_columns else self._dtypes.get(name, 'object'))
+                         for name in self.column_names or []})
+
+
+@patch_to(CsvMaterializer)
+def feed(self,
+         chunk: bytes  # next chunk of the csv body
+         ) -> list:
+    """buffers a chunk and returns the blocks that are ready, usually none"""
+
+    self._buffer += chunk
+
+    if not self._header_read and not self._read_header():
+        return []
+
+    if len(self._buffer) < self.block_size:
+        return []
+
+    end = _find_record_end(self._buffer)
+
+    if not end:
+        return []
+
+    block = self._buffer[:end]
+    del self._buffer[:end]
+
+    self.blocks_parsed += 1
+    return [self._parse_block(block)]
+
+
+@patch_to(CsvMaterializer)
+def close(self) -> list:
+    """parses whatever is left in the buffer, a final record without a trailing newline included"""
+
+    if not self._header_read:
+        self._buffer += b'\n'
+
+        if not self._read_header():
+            return []
+
+    if not self._buffer.strip():
+        return [] if self.blocks_parsed else [self._empty_block()]
+
+    block, self._buffer = self._buffer, bytearray()
+
+    self.blocks_parsed += 1
+    return [self._parse_block(block)]
+
+
+@patch_to(CsvMaterializer)
+def to_frame(self,
+             blocks: list  # blocks returned by feed and close
+             ) -> Union[pd.DataFrame, 'pa.Table']:
+    """concatenates parsed blocks into one table or dataframe"""
+
+    if not blocks:
+        return self._empty_block()
+
+    if len(blocks) == 1:
+        return blocks[0]
+
+    if self.backend == 'pyarrow':
+        # columns without values in the first blocks are null typed there
+        return pa.concat_tables(blocks, **_CONCAT_PROMOTE)
+
+    return pd.concat(blocks, ignore_index=True)
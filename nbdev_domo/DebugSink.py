@@ -0,0 +1,131 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_DebugSink.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_MAX_BODY_SIZE', 'debug_tracer', 'DebugEvent', 'print_sink', 'DebugTracer']
+
+# %% ../nbs/97_DebugSink.ipynb 3
+import warnings
+
+from dataclasses import dataclass, field
+from typing import Optional, Callable, List, Any
+
+import nbdev_domo.Codec as cd
+from .ResponseGetData import ResponseGetData
+from .utils import REDACTED, redact, redact_body, redact_headers
+
+# %% ../nbs/97_DebugSink.ipynb 5
+DEFAULT_MAX_BODY_SIZE = 2048
+
+
+def _truncate(text: str, max_size: Optional[int]) -> str:
+    if max_size is None or len(text) <= max_size:
+        return text
+
+    return f'{text[:max_size]}... ({len(text) - max_size} more characters)'
+
+
+def _format_body(body: Any, max_size: Optional[int]) -> Optional[str]:
+    """redacts and serializes a request or response body, then truncates it"""
+
+    # response events hold the ResponseGetData, so a lazy body is only decoded when the event is formatted
+    if isinstance(body, ResponseGetData):
+        body = body.response
+
+    if body is None:
+        return None
+
+    if isinstance(body, (str, bytes)):
+        text = redact_body(body)
+
+    elif isinstance(body, (dict, list)):
+        text = cd.codec.dumps(redact(body))
+
+    # streamed uploads can't be read without consuming them
+    else:
+        return f'<{type(body).__name__}>'
+
+    return _truncate(text, max_size)
+
+
+@dataclass
+class DebugEvent:
+    """a request, response or retry captured for debugging"""
+
+    kind: str  # request, response or retry
+    method: str
+    url: str
+    params: Optional[dict] = None
+    headers: Optional[dict] = field(default=None, repr=False)
+    body: Any = field(default=None, repr=False)  # the request body or the ResponseGetData, not decoded or serialized until the event is formatted
+    status: Optional[int] = None
+    elapsed: Optional[float] = None  # seconds
+    message: Optional[str] = None
+    max_body_size: Optional[int] = field(default=DEFAULT_MAX_BODY_SIZE, repr=False)  # None disables truncation
+
+    def to_dict(self) -> dict:
+        headers = self.headers and redact_headers(self.headers)
+
+        return {'kind': self.kind, 'method': self.method, 'url': self.url, 'params': self.params,
+                'headers': headers, 'body': _format_body(self.body, self.max_body_size),
+                'status': self.status, 'elapsed': self.elapsed, 'message': self.message}
+
+    def format(self) -> str:
+        event = self.to_dict()
+
+        line = ' '.join(str(value) for value in [self.kind, self.method, self.url, self.status] if value is not None)
+
+        if self.elapsed is not None:
+            line += f' in {self.elapsed:.3f}s'
+
+        lines = [line]
+
+        for key in ['message', 'params', 'headers', 'body']:
+            if event[key]:
+                lines.append(f'  {key}: {event[key]}')
+
+        return '\n'.join(lines)
+
+# %% ../nbs/97_DebugSink.ipynb 10
+def print_sink(event: DebugEvent):
+    print(event.format())
+
+
+class DebugTracer:
+    """registry of debug sinks shared by every transport"""
+
+    sinks: List[Callable[[DebugEvent], None]]
+
+    def __init__(self,
+                 max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE  # bodies are truncated to this many characters, None keeps the whole body
+                 ):
+        self.max_body_size = max_body_size
+        self.sinks = []
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink: Callable[[DebugEvent], None]):
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink: Callable[[DebugEvent], None]):
+        self.sinks.remove(sink)
+
+    def emit(self, kind: str, method: str, url: str, **kwargs):
+        """builds a DebugEvent and passes it to every sink.  callers check is_active first to skip the work"""
+
+        if not self.sinks:
+            return
+
+        event = DebugEvent(kind, method, url, max_body_size=self.max_body_size, **kwargs)
+
+        for sink in self.sinks:
+            try:
+                sink(event)
+
+            # a failing sink shouldn't fail the request
+            except Exception as e:
+                warnings.warn(f'debug sink {sink!r} failed: {type(e).__name__}: {e}', RuntimeWarning)
+
+# %% ../nbs/97_DebugSink.ipynb 11
+debug_tracer = DebugTracer()
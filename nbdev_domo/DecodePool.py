@@ -0,0 +1,120 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_DecodePool.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_OFFLOAD_THRESHOLD', 'decode_pool', 'DecodeStats', 'DecodePool']
+
+# %% ../nbs/97_DecodePool.ipynb 3
+import time
+import asyncio
+
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Optional, Callable, Any
+
+from fastcore.basics import patch_to
+
+# %% ../nbs/97_DecodePool.ipynb 5
+DEFAULT_OFFLOAD_THRESHOLD = 2 ** 20  # 1 MiB
+
+
+@dataclass
+class DecodeStats:
+    """decode work kept on, and moved off, the event loop"""
+
+    inline_count: int = 0
+    inline_bytes: int = 0
+    inline_seconds: float = 0  # event loop time spent on calls below the threshold
+    offloaded_count: int = 0
+    offloaded_bytes: int = 0
+    loop_seconds_saved: float = 0  # worker time spent on offloaded calls
+    process_count: int = 0  # offloaded calls that ran in the process pool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _timed_call(fn: Callable, *args) -> tuple:
+    """runs in the worker and returns the result with the seconds it took"""
+
+    started_at = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started_at
+
+# %% ../nbs/97_DecodePool.ipynb 7
+class DecodePool:
+    """bounded worker pools for decoding response bodies above a size threshold"""
+
+    def __init__(self,
+                 threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,  # bytes at which calls move to a worker thread, None keeps every call on the event loop
+                 process_threshold: Optional[int] = None,  # bytes at which calls move to a worker process, None disables the process pool
+                 max_workers: int = 4,  # worker threads
+                 max_processes: Optional[int] = 2  # worker processes
+                 ):
+
+        self.threshold = threshold
+        self.process_threshold = process_threshold
+        self.max_workers = max_workers
+        self.max_processes = max_processes
+
+        self.stats = DecodeStats()
+        self._thread_executor = None
+        self._process_executor = None
+
+    def should_offload(self, size: int) -> bool:
+        return self.threshold is not None and size >= self.threshold
+
+    def _get_executor(self, size: int, allow_process: bool = True) -> Executor:
+        """executors are created on first use"""
+
+        if allow_process and self.process_threshold is not None and size >= self.process_threshold:
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor(max_workers=self.max_processes)
+
+            return self._process_executor
+
+        if self._thread_executor is None:
+            self._thread_executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='nbdev_domo_decode')
+
+        return self._thread_executor
+
+    def shutdown(self, wait: bool = True):
+        for executor in (self._thread_executor, self._process_executor):
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
+        self._thread_executor = None
+        self._process_executor = None
+
+# %% ../nbs/97_DecodePool.ipynb 8
+@patch_to(DecodePool)
+async def run(self,
+              fn: Callable,  # must be picklable, with picklable args, to run in the process pool
+              *args,
+              size: int,  # bytes of the payload, compared against the thresholds
+              allow_process: bool = True  # False keeps calls that return unpicklable objects out of the process pool
+              ) -> Any:
+    """calls fn(*args) on the event loop below the threshold and in a worker otherwise"""
+
+    if not self.should_offload(size):
+        result, duration = _timed_call(fn, *args)
+
+        self.stats.inline_count += 1
+        self.stats.inline_bytes += size
+        self.stats.inline_seconds += duration
+
+        return result
+
+    executor = self._get_executor(size, allow_process)
+    result, duration = await asyncio.get_running_loop().run_in_executor(executor, _timed_call, fn, *args)
+
+    self.stats.offloaded_count += 1
+    self.stats.offloaded_bytes += size
+    self.stats.loop_seconds_saved += duration
+
+    if executor is self._process_executor:
+        self.stats.process_count += 1
+
+    return result
+
+# %% ../nbs/97_DecodePool.ipynb 9
+decode_pool = DecodePool()
@@ -1,11 +1,11 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/80_DomoAccount.ipynb.
 
 # %% auto 0
-__all__ = ['get_accounts', 'get_account_from_id', 'get_account_config', 'update_account_config', 'update_account_name',
-           'create_account_route', 'delete_account_route', 'DomoAccount_Config',
-           'DomoAccount_Config_Athena_HighBandwidthConnector', 'DomoAccount_Config_AbstractCredential',
-           'DomoAccount_Config_DomoGovernance', 'AccountConfig', 'DomoAccount', 'InvalidAccountError',
-           'InvalidAccountConfigError', 'UpdateAccountConfigError', 'DeleteAccountError']
+__all__ = ['get_accounts', 'iter_accounts', 'stream_accounts', 'get_account_from_id', 'get_account_config',
+           'update_account_config', 'update_account_name', 'create_account_route', 'delete_account_route',
+           'DomoAccount_Config', 'DomoAccount_Config_Athena_HighBandwidthConnector',
+           'DomoAccount_Config_AbstractCredential', 'DomoAccount_Config_DomoGovernance', 'AccountConfig', 'DomoAccount',
+           'InvalidAccountError', 'InvalidAccountConfigError', 'UpdateAccountConfigError', 'DeleteAccountError']
 
 # %% ../nbs/80_DomoAccount.ipynb 3
 from typing import Optional, Union
@@ -27,6 +27,9 @@ import nbdev_domo.ResponseGetData as rgd
 import nbdev_domo.Transport as tr
 import nbdev_domo.DomoAuth as dmda
 import nbdev_domo.Logger as lg
+import nbdev_domo.Metrics as mt
+import nbdev_domo.Paginator as pg
+import nbdev_domo.DecodePool as dp
 
 
 # %% ../nbs/80_DomoAccount.ipynb 4
@@ -34,6 +37,7 @@ ACCOUNT_ID = 5
 ACCOUNT_DATA_PROVIDER_TYPE = "domo-governance-d14c2fef-49a8-4898-8ddd-f64998005600"
 
 # %% ../nbs/80_DomoAccount.ipynb 6
+@mt.track_route
 async def get_accounts(
     full_auth: dmda.DomoAuth,
     debug: bool = False,
@@ -41,18 +45,54 @@ async def get_accounts(
 ) -> rgd.ResponseGetData:
     """retrieves a list of all accounts this auth has read access to."""
 
-    url = f"https://{full_auth.domo_instance}.domo.com/api/data/v1/accounts"
-
-    if debug:
-        print(url)
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts"
 
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
     )
 
-    return await domo_transport.get(url=url)
+    # callers read the body, so it is decoded before returning, off the event loop when it is large
+    return await domo_transport.get(url=url, debug=debug, options=tr.RequestOptions(decode_body=True))
 
 # %% ../nbs/80_DomoAccount.ipynb 9
+async def iter_accounts(
+    full_auth: dmda.DomoAuth,
+    page_size: int = 100,  # accounts requested per page
+    prefetch: int = 2,  # pages requested ahead of the page being consumed
+    debug: bool = False,
+    session: Optional[aiohttp.ClientSession] = None,
+):
+    """async generator that yields accounts one page at a time, use instead of get_accounts on instances with many accounts"""
+
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts"
+
+    domo_transport = tr.TransportAsync(
+        auth_header=await full_auth.generate_auth_header(), session=session
+    )
+
+    async for account in pg.paginate(
+        domo_transport, url, page_size=page_size, prefetch=prefetch, debug=debug
+    ):
+        yield account
+
+# %% ../nbs/80_DomoAccount.ipynb 12
+async def stream_accounts(
+    full_auth: dmda.DomoAuth,
+    session: Optional[aiohttp.ClientSession] = None,
+):
+    """async generator that yields each account as the get_accounts response downloads, without buffering the whole list"""
+
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts"
+
+    domo_transport = tr.TransportAsync(
+        auth_header=await full_auth.generate_auth_header(), session=session
+    )
+
+    async for account in domo_transport.get_json_stream(url, session=session):
+        yield account
+
+# %% ../nbs/80_DomoAccount.ipynb 15
+@mt.track_route
 async def get_account_from_id(
     account_id: int,
     full_auth: dmda.DomoFullAuth,
@@ -61,18 +101,17 @@ async def get_account_from_id(
 ) -> rgd.ResponseGetData:
     """retrieves metadata about an account, does not retrieve configuration settings"""
 
-    url = f"https://{full_auth.domo_instance}.domo.com/api/data/v1/accounts/{account_id}?unmask=true"
-
-    if debug:
-        print(url)
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts/{account_id}?unmask=true"
 
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
     )
 
-    return await domo_transport.get(url=url)
+    # callers read the body, so it is decoded before returning, off the event loop when it is large
+    return await domo_transport.get(url=url, debug=debug, options=tr.RequestOptions(decode_body=True))
 
-# %% ../nbs/80_DomoAccount.ipynb 12
+# %% ../nbs/80_DomoAccount.ipynb 18
+@mt.track_route
 async def get_account_config(
     account_id: int,
     data_provider_type: str,
@@ -82,18 +121,17 @@ async def get_account_config(
 ) -> rgd.ResponseGetData:
     """retrieves account configuration information, does not include metadata"""
 
-    url = f"https://{full_auth.domo_instance}.domo.com/api/data/v1/providers/{data_provider_type}/account/{account_id}?unmask=true"
-
-    if debug:
-        print(url)
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/providers/{data_provider_type}/account/{account_id}?unmask=true"
 
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
     )
 
-    return await domo_transport.get(url=url)
+    # callers read the body, so it is decoded before returning, off the event loop when it is large
+    return await domo_transport.get(url=url, debug=debug, options=tr.RequestOptions(decode_body=True))
 
-# %% ../nbs/80_DomoAccount.ipynb 16
+# %% ../nbs/80_DomoAccount.ipynb 22
+@mt.track_route
 async def update_account_config(
     account_id: int,
     config_body: dict,  # config_body is determined by the data_provider_type
@@ -104,10 +142,7 @@ async def update_account_config(
 ) -> rgd.ResponseGetData:
     """updates account configuration.  does not alter metadata"""
 
-    url = f"https://{full_auth.domo_instance}.domo.com/api/data/v1/providers/{data_provider_type}/account/{account_id}"
-
-    if debug:
-        print(url)
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/providers/{data_provider_type}/account/{account_id}"
 
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
@@ -118,7 +153,8 @@ async def update_account_config(
     )
 
 
-# %% ../nbs/80_DomoAccount.ipynb 17
+# %% ../nbs/80_DomoAccount.ipynb 23
+@mt.track_route
 async def update_account_name(
     account_id: int,
     account_name: str,
@@ -128,10 +164,7 @@ async def update_account_name(
 ) -> rgd.ResponseGetData:
     """update an account's display name"""
 
-    url = f"https://{full_auth.domo_instance}.domo.com/api/data/v1/accounts/{account_id}/name"
-
-    if debug:
-        print(url)
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts/{account_id}/name"
 
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
@@ -141,7 +174,8 @@ async def update_account_name(
         url=url, body=account_name, session=session, debug=debug
     )
 
-# %% ../nbs/80_DomoAccount.ipynb 21
+# %% ../nbs/80_DomoAccount.ipynb 27
+@mt.track_route
 async def create_account_route(
     config_body: dict,  # config body is dependent on data provider type
     full_auth: dmda.DomoFullAuth,  # domo auth
@@ -150,10 +184,7 @@ async def create_account_route(
 ) -> rgd.ResponseGetData:  # returns account metadata
     """create a new Domo Account object"""
 
-    url = f"https://{full_auth.domo_instance}.domo.com/api/data/v1/accounts"
-
-    if debug:
-        print(url)
+    url = f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts"
 
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
@@ -163,7 +194,8 @@ async def create_account_route(
         url=url, body=config_body, debug=debug, session=session
     )
 
-# %% ../nbs/80_DomoAccount.ipynb 23
+# %% ../nbs/80_DomoAccount.ipynb 29
+@mt.track_route
 async def delete_account_route(
     account_id: str,
     full_auth: dmda.DomoFullAuth,
@@ -172,19 +204,16 @@ async def delete_account_route(
 ) -> rgd.ResponseGetData:
 
     url = (
-        f"https://{full_auth.domo_instance}.domo.com/api/data/v1/accounts/{account_id}"
+        f"{utils.get_base_url(full_auth.domo_instance)}/api/data/v1/accounts/{account_id}"
     )
 
-    if debug:
-        print(url)
-
     domo_transport = tr.TransportAsync(
         auth_header=await full_auth.generate_auth_header(), session=session
     )
 
     return await domo_transport.delete(url=url, debug=debug, session=session)
 
-# %% ../nbs/80_DomoAccount.ipynb 25
+# %% ../nbs/80_DomoAccount.ipynb 31
 class DomoAccount_Config(ABC):
     """
     Abstract method for defining Domo Account Configuration bodies.
@@ -203,7 +232,7 @@ class DomoAccount_Config(ABC):
     def to_json(self):
         pass
 
-# %% ../nbs/80_DomoAccount.ipynb 27
+# %% ../nbs/80_DomoAccount.ipynb 33
 @dataclass
 class DomoAccount_Config_Athena_HighBandwidthConnector(DomoAccount_Config):
     aws_access_key: str
@@ -267,7 +296,7 @@ class DomoAccount_Config_DomoGovernance(DomoAccount_Config):
     def to_json(self):
         return {"apikey": self.api_key, "customer": self.customer}
 
-# %% ../nbs/80_DomoAccount.ipynb 29
+# %% ../nbs/80_DomoAccount.ipynb 35
 class AccountConfig(Enum):
     """enum to match account types with config classes"""
 
@@ -275,7 +304,7 @@ class AccountConfig(Enum):
     abstract_credential_store = DomoAccount_Config_AbstractCredential
     domo_governance = DomoAccount_Config_DomoGovernance
 
-# %% ../nbs/80_DomoAccount.ipynb 31
+# %% ../nbs/80_DomoAccount.ipynb 37
 @dataclass
 class DomoAccount:
     """class for interacting with Domo Account entities"""
@@ -324,7 +353,7 @@ class DomoAccount:
             "configurations": configuration,
         }
 
-# %% ../nbs/80_DomoAccount.ipynb 32
+# %% ../nbs/80_DomoAccount.ipynb 38
 class InvalidAccountError(dmda.DomoErrror):
     """return invalid account id sent to API"""
 
@@ -376,7 +405,7 @@ class DeleteAccountError(dmda.DomoErrror):
 
         super().__init__(status=status, message=message, domo_instance=domo_instance)
 
-# %% ../nbs/80_DomoAccount.ipynb 33
+# %% ../nbs/80_DomoAccount.ipynb 39
 @patch_to(DomoAccount, cls_method=True)
 async def get_from_id(
     cls,
@@ -393,12 +422,9 @@ async def get_from_id(
     """
 
     account_res = await get_account_from_id(
-        full_auth=full_auth, account_id=account_id, session=session
+        full_auth=full_auth, account_id=account_id, session=session, debug=debug
     )
 
-    if debug:
-        print(account_res.response)
-
     message = f"metadata retreived from get_account_from_id: account - {account_id} from {full_auth.domo_instance}"
 
     if not account_res.is_success:
@@ -417,7 +443,10 @@ async def get_from_id(
         )
 
     obj = account_res.response
-    acc = cls._from_json(obj, full_auth, logger=logger)
+
+    # DictDot conversion of a large response runs in a worker thread, the result isn't worth pickling for a process
+    acc = await dp.decode_pool.run(cls._from_json, obj, full_auth, logger,
+                                   size=account_res.bytes_received or 0, allow_process=False)
 
     acc.logger.log_info(
         message=f"SUCCESS - {message}",
@@ -464,11 +493,12 @@ async def get_from_id(
     if not config_match:
         return acc
 
-    acc.config = config_match._from_json(config_res.response)
+    acc.config = await dp.decode_pool.run(config_match._from_json, config_res.response,
+                                          size=config_res.bytes_received or 0, allow_process=False)
 
     return acc
 
-# %% ../nbs/80_DomoAccount.ipynb 37
+# %% ../nbs/80_DomoAccount.ipynb 43
 @patch_to(DomoAccount)
 async def update_config(
     self,
@@ -508,7 +538,7 @@ async def update_config(
 
     return await self.get_from_id(full_auth=full_auth, account_id=self.id)
 
-# %% ../nbs/80_DomoAccount.ipynb 38
+# %% ../nbs/80_DomoAccount.ipynb 44
 @patch_to(DomoAccount)
 async def update_name(
     self,
@@ -551,7 +581,7 @@ async def update_name(
 
     return await self.get_from_id(full_auth=full_auth, account_id=self.id)
 
-# %% ../nbs/80_DomoAccount.ipynb 41
+# %% ../nbs/80_DomoAccount.ipynb 47
 @patch_to(DomoAccount, cls_method=True)
 async def create_account(
     cls,
@@ -577,9 +607,6 @@ async def create_account(
         session=session,
     )
 
-    if debug:
-        print(res)
-
     if res.status != 200:
         return False
 
@@ -606,9 +633,6 @@ async def delete_account(
         session=session,
     )
 
-    if debug:
-        print(res)
-
     message = f"delete account {account_id} from {full_auth.domo_instance}"
 
     if res.status != 200:
@@ -5,13 +5,16 @@ __all__ = ['get_full_auth', 'test_access_token', 'get_developer_auth', 'DomoAuth
            'InvalidInstanceError', 'DomoFullAuth', 'DomoTokenAuth', 'DomoDeveloperAuth']
 
 # %% ../nbs/90_DomoAuth.ipynb 3
+import time
 from dataclasses import dataclass, field
 
 import aiohttp
 from typing import Optional, Union
+import nbdev_domo.utils as utils
 import nbdev_domo.ResponseGetData as rgd
 import nbdev_domo.Logger as lg
 from nbdev_domo.Transport import TransportAsync
+from nbdev_domo.TokenCache import TokenCache, TokenKey, CachedToken, _fingerprint, token_cache as token_cache_default
 
 # %% ../nbs/90_DomoAuth.ipynb 5
 async def get_full_auth(
@@ -22,7 +25,7 @@ async def get_full_auth(
 ) -> rgd.ResponseGetData:
     """uses username and password authentication to retrieve a full_auth access token"""
 
-    url = f"https://{domo_instance}.domo.com/api/content/v2/authentication"
+    url = f"{utils.get_base_url(domo_instance)}/api/content/v2/authentication"
 
     body = {
         "method": "password",
@@ -45,7 +48,7 @@ async def test_access_token(
     This is the same authentication test the Domo Java CLI uses.
     """
 
-    url = f"https://{domo_instance}.domo.com/api/content/v2/users/me"
+    url = f"{utils.get_base_url(domo_instance)}/api/content/v2/users/me"
 
     transport = TransportAsync(
         session=session, auth_header={"X-DOMO-Developer-Token": domo_access_token}
@@ -64,23 +67,16 @@ async def get_developer_auth(
     only use for authenticating against apis documented under developer.domo.com
     """
 
-    url = "https://api.domo.com/oauth/token?grant_type=client_credentials"
+    url = f"{utils.get_base_url()}/oauth/token?grant_type=client_credentials"
 
-    is_close_session = False
-
-    if not session:
-        is_close_session = True
-        session = aiohttp.ClientSession(
-            auth=aiohttp.BasicAuth(domo_client_id, domo_client_secret)
-        )
-
-    transport = TransportAsync(session=session)
-    res = await transport.get(url=url)
+    # send basic auth as a header so the request can use a pooled session
+    auth_header = {
+        "Authorization": aiohttp.BasicAuth(domo_client_id, domo_client_secret).encode()
+    }
 
-    if is_close_session:
-        await session.close()
+    transport = TransportAsync(session=session, auth_header=auth_header)
 
-    return res
+    return await transport.get(url=url)
 
 # %% ../nbs/90_DomoAuth.ipynb 19
 @dataclass
@@ -95,7 +91,7 @@ class _DomoAuth_Required:
 
     def set_manual_login(self):
         self.url_manual_login = (
-            f"https://{self.domo_instance}.domo.com/auth/index?domoManualLogin=true"
+            f"{utils.get_base_url(self.domo_instance)}/auth/index?domoManualLogin=true"
         )
 
 
@@ -112,6 +108,48 @@ class _DomoAuth_Optional:
 
     logger : Optional[lg.Logger] = None
 
+    token_issued_at: Optional[float] = field(default=None, repr=False)  # seconds since the epoch
+    token_expires_at: Optional[float] = field(default=None, repr=False)
+    # shares tokens between auth objects with the same credentials, defaults to the process-wide cache
+    token_cache: Optional[TokenCache] = field(default=None, repr=False, compare=False)
+
+    def _get_token_cache(self) -> TokenCache:
+        return self.token_cache or token_cache_default
+
+    @property
+    def is_token_expired(self) -> bool:
+        """True once the token is within the token cache's expiry margin, capped at half the token's lifetime"""
+
+        if self.token_expires_at is None:
+            return False
+
+        margin = self._get_token_cache().expiry_margin
+
+        if self.token_issued_at is not None:
+            margin = min(margin, (self.token_expires_at - self.token_issued_at) / 2)
+
+        return time.time() >= self.token_expires_at - margin
+
+    async def _get_cached_token(self,
+                                key: TokenKey,
+                                credential: str,  # password, secret or access token, only its fingerprint is cached
+                                fetch_fn,  # authenticates and returns a CachedToken
+                                force_refresh: bool = False  # authenticate even if a valid token is cached
+                                ) -> CachedToken:
+        token_cache = self._get_token_cache()
+
+        if force_refresh:
+            token_cache.invalidate(key)
+
+        entry = await token_cache.get_or_fetch(key, credential, fetch_fn)
+
+        self.token = entry.token
+        self.user_id = entry.user_id
+        self.token_issued_at = entry.issued_at
+        self.token_expires_at = entry.expires_at
+
+        return entry
+
     async def get_auth_token(self) -> Union[str, None]:
         """placeholder method"""
         pass
@@ -128,7 +166,7 @@ class DomoAuth(_DomoAuth_Optional, _DomoAuth_Required):
     pass
 
 
-# %% ../nbs/90_DomoAuth.ipynb 24
+# %% ../nbs/90_DomoAuth.ipynb 25
 class DomoErrror(Exception):
     """base exception"""
 
@@ -144,7 +182,7 @@ class DomoErrror(Exception):
         self.message = f"{status_str}{message}{instance_str}"
         super().__init__(self.message)
 
-# %% ../nbs/90_DomoAuth.ipynb 25
+# %% ../nbs/90_DomoAuth.ipynb 26
 class InvalidCredentialsError(DomoErrror):
     """return invalid credentials sent to API"""
 
@@ -169,7 +207,7 @@ class InvalidInstanceError(DomoErrror):
     ):
         super().__init__(status=status, message=message, domo_instance=domo_instance)
 
-# %% ../nbs/90_DomoAuth.ipynb 28
+# %% ../nbs/90_DomoAuth.ipynb 29
 @dataclass
 class _DomoFullAuth_Required(_DomoAuth_Required):
     """mix requied parameters for DomoFullAuth"""
@@ -178,7 +216,7 @@ class _DomoFullAuth_Required(_DomoAuth_Required):
     domo_password: str = field(repr=False)
 
 
-# %% ../nbs/90_DomoAuth.ipynb 29
+# %% ../nbs/90_DomoAuth.ipynb 30
 @dataclass
 class DomoFullAuth(_DomoAuth_Optional, _DomoFullAuth_Required):
     """use for full authentication token"""
@@ -189,17 +227,16 @@ class DomoFullAuth(_DomoAuth_Optional, _DomoFullAuth_Required):
             
 
     async def generate_auth_header(self, token: str = None) -> dict:
-        if not self.token:
+        if not token and (not self.token or self.is_token_expired):
             await self.get_auth_token()
 
         self.auth_header = {"x-domo-authentication": token or self.token}
         return self.auth_header
 
-    async def get_auth_token(
+    async def _fetch_auth_token(
         self,
         session: Optional[aiohttp.ClientSession] = None,
-    ) -> str:
-        """returns `token` if valid credentials provided else raises Exception and returns None"""
+    ) -> CachedToken:
 
         res = await get_full_auth(
             domo_instance=self.domo_instance,
@@ -230,23 +267,38 @@ class DomoFullAuth(_DomoAuth_Optional, _DomoFullAuth_Required):
                 domo_instance=self.domo_instance,
             )
 
-        token = str(res.response.get("sessionToken"))
-        self.token = token
-        self.user_id = str(res.response.get("userId"))
+        return CachedToken(
+            token=str(res.response.get("sessionToken")),
+            user_id=str(res.response.get("userId")),
+        )
+
+    async def get_auth_token(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        force_refresh: bool = False,  # authenticate even if the token cache holds a valid token
+    ) -> str:
+        """returns `token` if valid credentials provided else raises Exception and returns None.  tokens are shared with every DomoFullAuth for the same user through the token cache"""
+
+        await self._get_cached_token(
+            key=("full_auth", utils.get_base_url(self.domo_instance), self.domo_username),
+            credential=self.domo_password,
+            fetch_fn=lambda: self._fetch_auth_token(session=session),
+            force_refresh=force_refresh,
+        )
 
         if not self.token_name:
             self.token_name = "full_auth"
 
         return self.token
 
-# %% ../nbs/90_DomoAuth.ipynb 35
+# %% ../nbs/90_DomoAuth.ipynb 36
 @dataclass
 class _DomoTokenAuth_Required(_DomoAuth_Required):
     """mix requied parameters for DomoFullAuth"""
 
     domo_access_token: str = field(repr=False)
 
-# %% ../nbs/90_DomoAuth.ipynb 36
+# %% ../nbs/90_DomoAuth.ipynb 37
 @dataclass
 class DomoTokenAuth(_DomoAuth_Optional, _DomoTokenAuth_Required):
     """
@@ -263,13 +315,9 @@ class DomoTokenAuth(_DomoAuth_Optional, _DomoTokenAuth_Required):
         self.auth_header = {"x-domo-developer-token": token}
         return self.auth_header
 
-    async def get_auth_token(
+    async def _fetch_auth_token(
         self, session: Optional[aiohttp.ClientSession] = None
-    ) -> str:
-        """
-        updates internal attributes
-        having an access_token assumes pre-authenticaiton
-        """
+    ) -> CachedToken:
 
         res = await test_access_token(
             domo_instance=self.domo_instance,
@@ -287,8 +335,25 @@ class DomoTokenAuth(_DomoAuth_Optional, _DomoTokenAuth_Required):
                 domo_instance=self.domo_instance,
             )
 
-        self.token = self.domo_access_token
-        self.user_id = res.response.get("id")
+        return CachedToken(token=self.domo_access_token, user_id=res.response.get("id"))
+
+    async def get_auth_token(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        force_refresh: bool = False,  # validate the access token even if the token cache holds it
+    ) -> str:
+        """
+        updates internal attributes
+        having an access_token assumes pre-authenticaiton
+        """
+
+        # the access token is the credential, so it is keyed by its fingerprint
+        await self._get_cached_token(
+            key=("token_auth", utils.get_base_url(self.domo_instance), _fingerprint(self.domo_access_token)),
+            credential=self.domo_access_token,
+            fetch_fn=lambda: self._fetch_auth_token(session=session),
+            force_refresh=force_refresh,
+        )
 
         self.auth_header = self.generate_auth_header(token=self.token)
 
@@ -297,7 +362,7 @@ class DomoTokenAuth(_DomoAuth_Optional, _DomoTokenAuth_Required):
 
         return self.token
 
-# %% ../nbs/90_DomoAuth.ipynb 40
+# %% ../nbs/90_DomoAuth.ipynb 41
 @dataclass
 class _DomoDeveloperAuth_Required(_DomoAuth_Required):
     """mix requied parameters for DomoFullAuth"""
@@ -305,29 +370,31 @@ class _DomoDeveloperAuth_Required(_DomoAuth_Required):
     domo_client_id: str
     domo_client_secret: str = field(repr=False)
 
-# %% ../nbs/90_DomoAuth.ipynb 41
+# %% ../nbs/90_DomoAuth.ipynb 42
 @dataclass(init=False)
 class DomoDeveloperAuth(_DomoAuth_Optional, _DomoDeveloperAuth_Required):
     """use for full authentication token"""
 
-    def __init__(self, domo_client_id: str, domo_client_secret: str, logger : Optional[lg.Logger] = None):
+    def __init__(self, domo_client_id: str, domo_client_secret: str, logger : Optional[lg.Logger] = None,
+                 token_cache: Optional[TokenCache] = None):
         self.domo_client_id = domo_client_id
         self.domo_client_secret = domo_client_secret
         self.domo_instance = ""
+        self.token_cache = token_cache
 
         self.logger = logger or lg.Logger(app_name='default_domo_developer_auth', domo_instance = self.domo_instance)
 
-    async def generate_auth_header(self, token: str) -> dict:
-        if not self.token:
+    async def generate_auth_header(self, token: Optional[str] = None) -> dict:
+        if not token and (not self.token or self.is_token_expired):
             await self.get_auth_token()
 
-        self.auth_header = {"Authorization": "bearer " + token}
+        self.auth_header = {"Authorization": "bearer " + (token or self.token)}
         return self.auth_header
 
-    async def get_auth_token(
+    async def _fetch_auth_token(
         self,
         session: Optional[aiohttp.ClientSession] = None,
-    ) -> str:
+    ) -> CachedToken:
 
         res = await get_developer_auth(
             domo_client_id=self.domo_client_id,
@@ -345,15 +412,38 @@ class DomoDeveloperAuth(_DomoAuth_Optional, _DomoDeveloperAuth_Required):
                 domo_instance=self.domo_instance,
             )
 
-        token = str(res.response.get("access_token"))
-        self.token = token
-        self.user_id = res.response.get("userId")
-        self.domo_instance = res.response.get("domain")
+        issued_at = time.time()
+        expires_in = res.response.get("expires_in")
+
+        return CachedToken(
+            token=str(res.response.get("access_token")),
+            user_id=res.response.get("userId"),
+            issued_at=issued_at,
+            expires_at=issued_at + expires_in if expires_in else None,
+            extra={"domain": res.response.get("domain")},
+        )
+
+    async def get_auth_token(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        force_refresh: bool = False,  # authenticate even if the token cache holds a valid token
+    ) -> str:
+        """tokens are shared with every DomoDeveloperAuth for the same client through the token cache, and expire after the `expires_in` the API returns"""
+
+        entry = await self._get_cached_token(
+            key=("developer_auth", utils.get_base_url(), self.domo_client_id),
+            credential=self.domo_client_secret,
+            fetch_fn=lambda: self._fetch_auth_token(session=session),
+            force_refresh=force_refresh,
+        )
+
+        self.domo_instance = entry.extra.get("domain")
         self.set_manual_login()
 
-        self.auth_header = self.generate_auth_header(token=token)
+        # built here rather than by generate_auth_header, which calls get_auth_token to refresh expired tokens
+        self.auth_header = {"Authorization": f"bearer {self.token}"}
 
         if not self.token_name:
             self.token_name = "developer_auth"
 
-        return token
+        return self.token
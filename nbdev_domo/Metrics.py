@@ -0,0 +1,255 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_Metrics.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_BUCKETS', 'metrics_registry', 'Histogram', 'MetricFamily', 'MetricsRegistry', 'track_route']
+
+# %% ../nbs/97_Metrics.ipynb 3
+import re
+import time
+import bisect
+import inspect
+import functools
+
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+from typing import Optional, Union, Dict, Tuple, List, Callable, Awaitable
+
+from fastcore.basics import patch_to
+
+# %% ../nbs/97_Metrics.ipynb 5
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+@dataclass
+class Histogram:
+    """fixed-bucket histogram, `counts[i]` holds observations <= `buckets[i]`, the last count is +Inf"""
+
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default=None)
+    sum: float = 0
+    count: int = 0
+
+    def __post_init__(self):
+        if self.counts is None:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def get_cumulative_counts(self) -> List[Tuple[str, int]]:
+        """(upper bound, cumulative count) pairs as exposed by Prometheus"""
+
+        total = 0
+        cumulative = []
+
+        for bound, count in zip(list(self.buckets) + ['+Inf'], self.counts):
+            total += count
+            cumulative.append((str(bound), total))
+
+        return cumulative
+
+# %% ../nbs/97_Metrics.ipynb 8
+class MetricFamily:
+    """request count, error count and latency histogram per combination of label values"""
+
+    series: Dict[tuple, Histogram]
+    errors: Dict[tuple, int]
+
+    def __init__(self,
+                 name: str,  # metric name, without the registry prefix
+                 description: str,  # used as the Prometheus HELP text
+                 label_names: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+                 ):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series = {}
+        self.errors = {}
+
+    def observe(self,
+                labels: tuple,  # label values, in the order of label_names
+                duration: float,  # seconds
+                is_error: bool = False
+                ):
+        histogram = self.series.get(labels)
+
+        if histogram is None:
+            histogram = self.series.setdefault(labels, Histogram(self.buckets))
+
+        histogram.observe(duration)
+
+        if is_error:
+            self.errors[labels] = self.errors.get(labels, 0) + 1
+
+    def reset(self):
+        self.series = {}
+        self.errors = {}
+
+# %% ../nbs/97_Metrics.ipynb 9
+@patch_to(MetricFamily)
+def snapshot(self) -> List[dict]:
+    """one dict per label combination with request count, error count and latency buckets"""
+
+    return [{**dict(zip(self.label_names, labels)),
+             'count': histogram.count,
+             'errors': self.errors.get(labels, 0),
+             'latency_sum': histogram.sum,
+             'latency_buckets': dict(histogram.get_cumulative_counts())}
+            for labels, histogram in list(self.series.items())]
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+@patch_to(MetricFamily)
+def to_prometheus(self, prefix: str = 'nbdev_domo') -> str:
+    """Prometheus text exposition format (version 0.0.4)"""
+
+    name = f'{prefix}_{self.name}'
+    series = list(self.series.items())
+
+    def format_labels(labels, extra: str = ''):
+        pairs = [f'{label_name}="{_escape_label_value(value)}"' for label_name, value in zip(self.label_names, labels)]
+        return '{' + ','.join(pairs + ([extra] if extra else [])) + '}'
+
+    lines = [f'# HELP {name}_total {self.description}',
+             f'# TYPE {name}_total counter']
+    lines += [f'{name}_total{format_labels(labels)} {histogram.count}' for labels, histogram in series]
+
+    lines += [f'# HELP {name}_errors_total {self.description} that failed',
+              f'# TYPE {name}_errors_total counter']
+    lines += [f'{name}_errors_total{format_labels(labels)} {self.errors.get(labels, 0)}' for labels, _ in series]
+
+    lines += [f'# HELP {name}_duration_seconds {self.description}, latency in seconds',
+              f'# TYPE {name}_duration_seconds histogram']
+
+    for labels, histogram in series:
+        for bound, count in histogram.get_cumulative_counts():
+            bucket_labels = format_labels(labels, 'le="%s"' % bound)
+            lines.append(f'{name}_duration_seconds_bucket{bucket_labels} {count}')
+
+        lines.append(f'{name}_duration_seconds_sum{format_labels(labels)} {histogram.sum}')
+        lines.append(f'{name}_duration_seconds_count{format_labels(labels)} {histogram.count}')
+
+    return '\n'.join(lines) + '\n'
+
+# %% ../nbs/97_Metrics.ipynb 11
+_ID_SEGMENT = re.compile(r'^\d+$|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_route_labels(url: str) -> Tuple[str, str]:
+    """(templated path, domo_instance) for a url, e.g. ('/api/data/v1/accounts/{id}', 'domo-dojo')"""
+
+    parsed_url = urlparse(url)
+
+    route = '/'.join('{id}' if _ID_SEGMENT.search(segment) else segment
+                     for segment in parsed_url.path.split('/'))
+
+    host = parsed_url.hostname or ''
+    domo_instance = host[: -len('.domo.com')] if host.endswith('.domo.com') else host
+
+    return route, domo_instance
+
+# %% ../nbs/97_Metrics.ipynb 13
+class MetricsRegistry:
+    """aggregate request metrics for long-running jobs"""
+
+    def __init__(self,
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS,  # latency histogram upper bounds, in seconds
+                 prefix: str = 'nbdev_domo',  # prepended to metric names in the Prometheus export
+                 enabled: bool = True
+                 ):
+        self.prefix = prefix
+        self.enabled = enabled
+
+        self.http_requests = MetricFamily('http_requests', 'HTTP requests sent by RequestTransport',
+                                          ('route', 'method', 'status', 'domo_instance'), buckets)
+
+        self.route_calls = MetricFamily('route_calls', 'calls to API route functions',
+                                        ('route', 'status', 'domo_instance'), buckets)
+
+    @property
+    def families(self) -> List[MetricFamily]:
+        return [self.http_requests, self.route_calls]
+
+    def record_request(self,
+                       url: str,
+                       method: str,
+                       status: Union[int, str],  # http status, or the exception class name
+                       duration: float,  # seconds
+                       is_error: bool = False
+                       ):
+        if not self.enabled:
+            return
+
+        route, domo_instance = _get_route_labels(url)
+        self.http_requests.observe((route, method, str(status), domo_instance), duration, is_error)
+
+    def record_route_call(self,
+                          route: str,
+                          status: Union[int, str],
+                          duration: float,
+                          domo_instance: Optional[str] = None,
+                          is_error: bool = False
+                          ):
+        if not self.enabled:
+            return
+
+        self.route_calls.observe((route, str(status), domo_instance or ''), duration, is_error)
+
+    def snapshot(self) -> Dict[str, List[dict]]:
+        return {family.name: family.snapshot() for family in self.families}
+
+    def to_prometheus(self) -> str:
+        """metrics in the Prometheus text format, serve with content type `text/plain; version=0.0.4`"""
+        return ''.join(family.to_prometheus(self.prefix) for family in self.families)
+
+    def reset(self):
+        for family in self.families:
+            family.reset()
+
+# %% ../nbs/97_Metrics.ipynb 14
+metrics_registry = MetricsRegistry()
+
+# %% ../nbs/97_Metrics.ipynb 16
+def track_route(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+    """decorator for async route functions that records calls in metrics_registry"""
+
+    parameter_names = list(inspect.signature(func).parameters)
+    auth_index = parameter_names.index('full_auth') if 'full_auth' in parameter_names else None
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if not metrics_registry.enabled:
+            return await func(*args, **kwargs)
+
+        full_auth = kwargs.get('full_auth')
+
+        if full_auth is None and auth_index is not None and auth_index < len(args):
+            full_auth = args[auth_index]
+
+        domo_instance = getattr(full_auth, 'domo_instance', None)
+        started_at = time.perf_counter()
+
+        try:
+            res = await func(*args, **kwargs)
+
+        except Exception as e:
+            metrics_registry.record_route_call(func.__name__, type(e).__name__, time.perf_counter() - started_at,
+                                               domo_instance, is_error=True)
+            raise
+
+        status = getattr(res, 'status', '')
+        is_error = getattr(res, 'is_success', True) is False
+
+        metrics_registry.record_route_call(func.__name__, status, time.perf_counter() - started_at,
+                                           domo_instance, is_error=is_error)
+
+        return res
+    return wrapper
@@ -0,0 +1,411 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/98_MockServer.ipynb.
+
+# %% auto 0
+__all__ = ['MOCK_USER_ID', 'PROVIDER_TYPES', 'MockServerConfig', 'MockDomoServer', 'mock_domo_server']
+
+# %% ../nbs/98_MockServer.ipynb 3
+import uuid
+import random
+import socket
+import asyncio
+import datetime as dt
+
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from fastcore.basics import patch_to
+from fastcore.script import call_parse
+
+import nbdev_domo.utils as utils
+import nbdev_domo.Codec as cd
+
+# %% ../nbs/98_MockServer.ipynb 5
+@dataclass
+class MockServerConfig:
+    """latency, fault and dataset settings for MockDomoServer.  rates are probabilities between 0 and 1"""
+
+    latency: float = 0  # seconds added to every response
+    latency_jitter: float = 0  # up to this many additional seconds, chosen at random per request
+    error_rate: float = 0  # share of requests answered with 500
+    throttle_rate: float = 0  # share of requests answered with 429
+    retry_after: int = 1  # Retry-After header sent with 429 responses
+    payload_size: int = 0  # bytes of padding added to each account
+    account_count: int = 100  # number of accounts in the dataset
+    seed: Optional[int] = None  # makes injected latency and faults reproducible
+
+    domo_username: str = 'test@domo.com'
+    domo_password: str = field(default='testpassword', repr=False)
+    domo_access_token: str = field(default='test-access-token', repr=False)
+    domo_client_id: str = 'test-client-id'
+    domo_client_secret: str = field(default='test-client-secret', repr=False)
+
+# %% ../nbs/98_MockServer.ipynb 7
+MOCK_USER_ID = 1893952720
+
+PROVIDER_TYPES = ('abstract-credential-store',
+                  'amazon-athena-high-bandwidth',
+                  'domo-governance-d14c2fef-49a8-4898-8ddd-f64998005600')
+
+# %% ../nbs/98_MockServer.ipynb 8
+def _make_account_config(data_provider_type: str, account_id: int) -> dict:
+    if data_provider_type.startswith('domo-governance'):
+        return {'apikey': f'mock-api-key-{account_id}', 'customer': 'domo-dojo'}
+
+    if data_provider_type.startswith('amazon-athena-high-bandwidth'):
+        return {'awsAccessKey': f'mock-access-key-{account_id}',
+                'awsSecretKey': f'mock-secret-key-{account_id}',
+                's3StagingDir': f's3://mock-bucket/{account_id}/',
+                'region': 'us-west-2'}
+
+    return {'credentials': f'{{"account_id": {account_id}}}'}
+
+
+def _make_account(account_id: int,
+                  data_provider_type: str,
+                  display_name: Optional[str] = None,
+                  payload_size: int = 0
+                  ) -> dict:
+    now = utils.convert_datetime_to_epoch_millisecond(dt.datetime.now())
+
+    account = {'id': account_id,
+               'name': data_provider_type,
+               'displayName': display_name or f'mock account {account_id}',
+               'type': 'data',
+               'dataProviderType': data_provider_type,
+               'valid': True,
+               'ownerId': MOCK_USER_ID,
+               'createdAt': now,
+               'modifiedAt': now}
+
+    if payload_size:
+        account['description'] = 'x' * payload_size
+
+    return account
+
+
+def _make_dataset(config: MockServerConfig) -> Tuple[Dict[int, dict], Dict[int, dict]]:
+    """accounts and account configs, keyed by account id"""
+
+    accounts, account_configs = {}, {}
+
+    for account_id in range(1, config.account_count + 1):
+        data_provider_type = PROVIDER_TYPES[account_id % len(PROVIDER_TYPES)]
+
+        accounts[account_id] = _make_account(account_id, data_provider_type, payload_size=config.payload_size)
+        account_configs[account_id] = _make_account_config(data_provider_type, account_id)
+
+    return accounts, account_configs
+
+# %% ../nbs/98_MockServer.ipynb 10
+class MockDomoServer:
+    """in-process stand-in for the Domo APIs"""
+
+    accounts: Dict[int, dict]
+    account_configs: Dict[int, dict]
+
+    def __init__(self,
+                 config: Optional[MockServerConfig] = None,
+                 host: str = '127.0.0.1',
+                 port: int = 0  # 0 picks a free port when the server starts
+                 ):
+        self.config = config or MockServerConfig()
+        self.host = host
+        self.port = port
+
+        self.random = random.Random(self.config.seed)
+        self.accounts, self.account_configs = _make_dataset(self.config)
+        self.tokens = set()
+
+        self.request_count = 0
+        self.error_count = 0
+        self.throttle_count = 0
+
+        self._runner = None
+        self._previous_base_url = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://{self.host}:{self.port}'
+
+    @property
+    def stats(self) -> dict:
+        return {'requests': self.request_count,
+                'errors': self.error_count,
+                'throttled': self.throttle_count}
+
+# %% ../nbs/98_MockServer.ipynb 11
+def _json_response(obj, status: int = 200, headers: Optional[dict] = None) -> web.Response:
+    return web.Response(text=cd.codec.dumps(obj), status=status, headers=headers, content_type='application/json')
+
+
+def _error_response(status: int, reason: str, headers: Optional[dict] = None) -> web.Response:
+    return _json_response({'status': status, 'statusReason': reason, 'toe': str(uuid.uuid4())},
+                          status=status, headers=headers)
+
+# %% ../nbs/98_MockServer.ipynb 12
+@patch_to(MockDomoServer)
+async def _inject_faults(self, request: web.Request, handler) -> web.Response:
+    config = self.config
+    self.request_count += 1
+
+    delay = config.latency + (self.random.uniform(0, config.latency_jitter) if config.latency_jitter else 0)
+
+    if delay:
+        await asyncio.sleep(delay)
+
+    if config.throttle_rate and self.random.random() < config.throttle_rate:
+        self.throttle_count += 1
+        return _error_response(429, 'Too Many Requests', headers={'Retry-After': str(config.retry_after)})
+
+    if config.error_rate and self.random.random() < config.error_rate:
+        self.error_count += 1
+        return _error_response(500, 'Internal Server Error')
+
+    return await handler(request)
+
+
+@patch_to(MockDomoServer)
+def _is_authorized(self, request: web.Request) -> bool:
+    headers = request.headers
+
+    if headers.get('x-domo-authentication') in self.tokens:
+        return True
+
+    if headers.get('x-domo-developer-token') == self.config.domo_access_token:
+        return True
+
+    authorization = headers.get('Authorization', '')
+
+    return authorization.lower().startswith('bearer ') and authorization[len('bearer '):] in self.tokens
+
+# %% ../nbs/98_MockServer.ipynb 14
+@patch_to(MockDomoServer)
+async def _authenticate(self, request: web.Request) -> web.Response:
+    body = await request.json(loads=cd.codec.loads)
+
+    if body.get('emailAddress') != self.config.domo_username or body.get('password') != self.config.domo_password:
+        return _json_response({'success': False, 'status': 'UNAUTHORIZED', 'reason': 'INVALID_CREDENTIALS'})
+
+    token = f'mock-session-{uuid.uuid4()}'
+    self.tokens.add(token)
+
+    return _json_response({'success': True, 'sessionToken': token, 'userId': MOCK_USER_ID})
+
+
+@patch_to(MockDomoServer)
+async def _get_me(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return web.Response(text='Unauthorized', status=401)
+
+    return _json_response({'id': MOCK_USER_ID, 'displayName': 'Mock User',
+                           'emailAddress': self.config.domo_username, 'role': 'Admin'})
+
+
+@patch_to(MockDomoServer)
+async def _get_oauth_token(self, request: web.Request) -> web.Response:
+    try:
+        credentials = aiohttp.BasicAuth.decode(request.headers.get('Authorization', ''))
+
+    except ValueError:
+        credentials = None
+
+    if (credentials is None
+            or credentials.login != self.config.domo_client_id
+            or credentials.password != self.config.domo_client_secret):
+        return _json_response({'status': 401, 'error': 'Unauthorized', 'path': '/oauth/token'}, status=401)
+
+    token = f'mock-access-{uuid.uuid4()}'
+    self.tokens.add(token)
+
+    return _json_response({'access_token': token, 'token_type': 'bearer', 'expires_in': 3599,
+                           'scope': 'data user', 'userId': MOCK_USER_ID, 'role': 'Admin'})
+
+# %% ../nbs/98_MockServer.ipynb 16
+@patch_to(MockDomoServer)
+def _get_account_id(self, request: web.Request) -> Optional[int]:
+    account_id = request.match_info['account_id']
+    return int(account_id) if account_id.isdigit() and int(account_id) in self.accounts else None
+
+
+@patch_to(MockDomoServer)
+async def _get_accounts(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    accounts = list(self.accounts.values())
+
+    # offset / limit paging is optional, without a limit the full list is returned
+    offset = int(request.query.get('offset', 0))
+    limit = int(request.query.get('limit', len(accounts)))
+
+    return _json_response(accounts[offset: offset + limit])
+
+
+@patch_to(MockDomoServer)
+async def _create_account(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    body = await request.json(loads=cd.codec.loads)
+    account_id = max(self.accounts, default=0) + 1
+
+    self.accounts[account_id] = _make_account(account_id, body.get('dataProviderType'), body.get('displayName'))
+    self.account_configs[account_id] = body.get('configurations') or {}
+
+    return _json_response(self.accounts[account_id])
+
+
+@patch_to(MockDomoServer)
+async def _get_account(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    account_id = self._get_account_id(request)
+
+    if account_id is None:
+        return _error_response(404, 'Not Found')
+
+    return _json_response(self.accounts[account_id])
+
+
+@patch_to(MockDomoServer)
+async def _delete_account(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    account_id = self._get_account_id(request)
+
+    if account_id is None:
+        return _error_response(404, 'Not Found')
+
+    self.accounts.pop(account_id)
+    self.account_configs.pop(account_id, None)
+
+    return web.Response(status=200)
+
+
+@patch_to(MockDomoServer)
+async def _update_account_name(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    account_id = self._get_account_id(request)
+
+    if account_id is None:
+        return _error_response(404, 'Not Found')
+
+    account = self.accounts[account_id]
+    account['displayName'] = await request.text()
+    account['modifiedAt'] = utils.convert_datetime_to_epoch_millisecond(dt.datetime.now())
+
+    return _json_response(account)
+
+
+@patch_to(MockDomoServer)
+async def _get_account_config(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    account_id = self._get_account_id(request)
+
+    if account_id is None or not self.accounts[account_id]['dataProviderType'] == request.match_info['data_provider_type']:
+        return _error_response(404, 'Not Found')
+
+    return _json_response(self.account_configs.get(account_id, {}))
+
+
+@patch_to(MockDomoServer)
+async def _update_account_config(self, request: web.Request) -> web.Response:
+    if not self._is_authorized(request):
+        return _error_response(401, 'Unauthorized')
+
+    account_id = self._get_account_id(request)
+
+    if account_id is None or not self.accounts[account_id]['dataProviderType'] == request.match_info['data_provider_type']:
+        return _error_response(404, 'Not Found')
+
+    self.account_configs[account_id] = await request.json(loads=cd.codec.loads)
+
+    return _json_response(self.account_configs[account_id])
+
+# %% ../nbs/98_MockServer.ipynb 18
+@patch_to(MockDomoServer, as_prop=True)
+def app(self) -> web.Application:
+    """the aiohttp application, e.g. for web.run_app or aiohttp.test_utils.TestServer"""
+
+    @web.middleware
+    async def inject_faults(request, handler):
+        return await self._inject_faults(request, handler)
+
+    app = web.Application(middlewares=[inject_faults])
+
+    app.router.add_post('/api/content/v2/authentication', self._authenticate)
+    app.router.add_get('/api/content/v2/users/me', self._get_me)
+    app.router.add_get('/oauth/token', self._get_oauth_token)
+
+    app.router.add_get('/api/data/v1/accounts', self._get_accounts)
+    app.router.add_post('/api/data/v1/accounts', self._create_account)
+    app.router.add_get('/api/data/v1/accounts/{account_id}', self._get_account)
+    app.router.add_delete('/api/data/v1/accounts/{account_id}', self._delete_account)
+    app.router.add_put('/api/data/v1/accounts/{account_id}/name', self._update_account_name)
+    app.router.add_get('/api/data/v1/providers/{data_provider_type}/account/{account_id}', self._get_account_config)
+    app.router.add_put('/api/data/v1/providers/{data_provider_type}/account/{account_id}', self._update_account_config)
+
+    return app
+
+
+@patch_to(MockDomoServer)
+async def start(self) -> str:
+    """starts serving in the running event loop, returns base_url"""
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((self.host, self.port))
+    self.port = sock.getsockname()[1]
+
+    self._runner = web.AppRunner(self.app, access_log=None)
+    await self._runner.setup()
+    await web.SockSite(self._runner, sock).start()
+
+    return self.base_url
+
+
+@patch_to(MockDomoServer)
+async def close(self):
+    if self._runner is not None:
+        await self._runner.cleanup()
+        self._runner = None
+
+
+@patch_to(MockDomoServer)
+async def __aenter__(self):
+    await self.start()
+    self._previous_base_url = utils.set_base_url(self.base_url)
+    return self
+
+
+@patch_to(MockDomoServer)
+async def __aexit__(self, exc_type, exc, tb):
+    utils.set_base_url(self._previous_base_url)
+    await self.close()
+
+# %% ../nbs/98_MockServer.ipynb 25
+@call_parse
+def mock_domo_server(host: str = '127.0.0.1',  # interface to listen on
+                     port: int = 8080,
+                     latency: float = 0,  # seconds added to every response
+                     error_rate: float = 0,  # share of requests answered with 500
+                     throttle_rate: float = 0,  # share of requests answered with 429
+                     payload_size: int = 0,  # bytes of padding added to each account
+                     account_count: int = 100,  # number of accounts in the dataset
+                     seed: int = None  # makes injected latency and faults reproducible
+                     ):
+    """serve MockDomoServer until interrupted"""
+
+    config = MockServerConfig(latency=latency, error_rate=error_rate, throttle_rate=throttle_rate,
+                              payload_size=payload_size, account_count=account_count, seed=seed)
+
+    web.run_app(MockDomoServer(config, host=host, port=port).app, host=host, port=port)
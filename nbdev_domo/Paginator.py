@@ -0,0 +1,89 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/96_Paginator.ipynb.
+
+# %% auto 0
+__all__ = ['PaginationError', 'paginate']
+
+# %% ../nbs/96_Paginator.ipynb 3
+import asyncio
+
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Deque, Optional
+
+from .ResponseGetData import ResponseGetData
+from .Transport import TransportAsync, RequestOptions
+
+# %% ../nbs/96_Paginator.ipynb 5
+class PaginationError(Exception):
+    """raised when a page request fails"""
+
+    def __init__(self, rgd: ResponseGetData, offset: int):
+        super().__init__(f'Status {rgd.status} - failed to retrieve page at offset {offset}')
+        self.rgd = rgd
+        self.offset = offset
+
+
+def _get_items_default(response: Any) -> list:
+    return response if isinstance(response, list) else []
+
+
+async def paginate(transport: TransportAsync,
+                   url: str,
+                   params: Optional[dict] = None,  # additional query parameters sent with every page
+                   page_size: int = 50,  # items requested per page
+                   prefetch: int = 2,  # pages requested ahead of the page being consumed, 0 fetches pages one at a time
+                   get_items: Optional[Callable[[Any], list]] = None,  # extracts the items from a page's response, defaults to a json array
+                   offset_param: str = 'offset',
+                   limit_param: str = 'limit',
+                   start_offset: int = 0,
+                   debug: bool = False,  # emit debug events for every page request
+                   options: Optional[RequestOptions] = None  # per-call transport options applied to every page
+                   ) -> AsyncIterator[Any]:
+    """yields items from an offset / limit paged endpoint.  raises PaginationError if a page request fails"""
+
+    get_items = get_items or _get_items_default
+    pages: Deque[asyncio.Task] = deque()
+    next_offset = start_offset
+
+    def _schedule_page():
+        nonlocal next_offset
+
+        page_params = {**(params or {}), offset_param: next_offset, limit_param: page_size}
+        pages.append(asyncio.ensure_future(transport.get(url, params=page_params, coalesce=False, debug=debug, options=options)))
+        next_offset += page_size
+
+    try:
+        _schedule_page()
+
+        while pages:
+            offset = next_offset - page_size * len(pages)
+            rgd = await pages.popleft()
+
+            if not rgd.is_success:
+                raise PaginationError(rgd, offset)
+
+            items = get_items(rgd.response)
+            is_last_page = len(items) != page_size
+
+            if is_last_page:
+                for page in pages:
+                    page.cancel()
+
+                pages.clear()
+
+            else:
+                while len(pages) < prefetch:
+                    _schedule_page()
+
+            for item in items:
+                yield item
+
+            # without read-ahead, the next page is requested once this page has been consumed
+            if not is_last_page and not pages:
+                _schedule_page()
+
+    finally:
+        for page in pages:
+            page.cancel()
+
+        if pages:
+            await asyncio.gather(*pages, return_exceptions=True)
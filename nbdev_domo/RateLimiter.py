@@ -0,0 +1,180 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_RateLimiter.ipynb.
+
+# %% auto 0
+__all__ = ['rate_limiter_registry', 'TokenBucket', 'RateLimiterRegistry']
+
+# %% ../nbs/97_RateLimiter.ipynb 3
+import asyncio
+import heapq
+import itertools
+import time
+
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List
+
+from fastcore.basics import patch_to
+
+import nbdev_domo.utils as utils
+
+# %% ../nbs/97_RateLimiter.ipynb 5
+class TokenBucket:
+    """async token bucket that shrinks its rate when the server responds with 429"""
+
+    max_rate: float
+    rate: float
+    burst: float
+    tokens: float
+
+    def __init__(self,
+                 rate: float,  # requests per second once the burst is spent
+                 burst: Optional[float] = None,  # max requests sent back to back, defaults to rate
+                 min_rate: float = 0.5,  # rate never drops below this, in requests per second
+                 decrease_factor: float = 0.5,  # multiplies the rate on each 429
+                 increase_step: Optional[float] = None  # rate added back per success, defaults to 5% of rate
+                 ):
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or rate
+        self.min_rate = min(min_rate, rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step or rate * 0.05
+
+        self.tokens = self.burst
+        self.blocked_until = 0
+        self.throttle_count = 0
+
+        self._updated_at = time.monotonic()
+        self._waiters = []
+        self._waiters_loop = None
+        self._sequence = itertools.count()
+
+    def _get_waiters(self) -> List['_Waiter']:
+        """waiters are bound to one event loop, so the queue is reset if the loop changes"""
+        loop = asyncio.get_running_loop()
+
+        if self._waiters_loop is not loop:
+            self._waiters = []
+            self._waiters_loop = loop
+
+        return self._waiters
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+# %% ../nbs/97_RateLimiter.ipynb 6
+@dataclass(order=True)
+class _Waiter:
+    sort_key: tuple  # (-priority, arrival sequence)
+    event: asyncio.Event = field(compare=False, default_factory=asyncio.Event)
+
+
+@patch_to(TokenBucket)
+async def acquire(self,
+                  priority: int = 0  # higher priority waiters take tokens first
+                  ) -> float:
+    """waits until a token is available, returns the seconds spent waiting"""
+
+    started_at = time.monotonic()
+
+    waiters = self._get_waiters()
+    waiter = _Waiter((-priority, next(self._sequence)))
+    heapq.heappush(waiters, waiter)
+
+    try:
+        while True:
+            # only the waiter at the head of the queue takes tokens, the rest wait to be woken
+            if waiters[0] is not waiter:
+                waiter.event.clear()
+                await waiter.event.wait()
+                continue
+
+            now = time.monotonic()
+            self._refill(now)
+
+            wait = self.blocked_until - now
+
+            if wait <= 0 and self.tokens >= 1:
+                self.tokens -= 1
+                return now - started_at
+
+            if wait <= 0:
+                wait = (1 - self.tokens) / self.rate
+
+            await asyncio.sleep(wait)
+
+    finally:
+        if waiters and waiters[0] is waiter:
+            heapq.heappop(waiters)
+        else:
+            waiters.remove(waiter)
+            heapq.heapify(waiters)
+
+        if waiters:
+            waiters[0].event.set()
+
+
+@patch_to(TokenBucket)
+def on_response(self,
+                status: int,  # HTTP status of the completed request
+                retry_after: Optional[float] = None  # seconds parsed from the Retry-After header
+                ):
+    """adjusts the rate based on the response, 429 slows the bucket down and success speeds it back up"""
+
+    now = time.monotonic()
+    self._refill(now)
+
+    if status == 429:
+        self.throttle_count += 1
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self.tokens = min(self.tokens, 0)
+        self.blocked_until = max(self.blocked_until, now + (retry_after or 1 / self.rate))
+        return
+
+    if status < 400 and self.rate < self.max_rate:
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+# %% ../nbs/97_RateLimiter.ipynb 12
+class RateLimiterRegistry:
+    """process-wide registry of TokenBucket rate limiters keyed by host"""
+
+    limiters: Dict[str, TokenBucket]
+
+    def __init__(self,
+                 rate: Optional[float] = None,  # default requests per second for hosts without configured limits, None leaves them unlimited
+                 burst: Optional[float] = None  # default burst size per host
+                 ):
+
+        self.rate = rate
+        self.burst = burst
+        self.limiters = {}
+
+    def configure(self,
+                  url: str,  # url or host of the Domo instance
+                  rate: float,
+                  burst: Optional[float] = None,
+                  **kwargs  # passed to TokenBucket
+                  ) -> TokenBucket:
+        """sets the limits for one host, replacing its existing bucket"""
+
+        limiter = TokenBucket(rate=rate, burst=burst, **kwargs)
+        self.limiters[utils.convert_url_to_host(url)] = limiter
+        return limiter
+
+    def get_limiter(self,
+                    url: str  # url or host the request will be sent to
+                    ) -> Optional[TokenBucket]:
+        """returns the bucket for the url's host, or None if rate limiting is disabled"""
+
+        host = utils.convert_url_to_host(url)
+        limiter = self.limiters.get(host)
+
+        if limiter is None and self.rate:
+            limiter = TokenBucket(rate=self.rate, burst=self.burst)
+            self.limiters[host] = limiter
+
+        return limiter
+
+# %% ../nbs/97_RateLimiter.ipynb 13
+rate_limiter_registry = RateLimiterRegistry()
@@ -0,0 +1,228 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_ResponseCache.ipynb.
+
+# %% auto 0
+__all__ = ['response_cache', 'CacheEntry', 'ResponseCache']
+
+# %% ../nbs/97_ResponseCache.ipynb 3
+import re
+import time
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional, List, Tuple, Pattern
+from urllib.parse import urlparse
+
+from fastcore.basics import patch_to
+
+import nbdev_domo.Codec as cd
+from .ResponseGetData import ResponseGetData
+
+# %% ../nbs/97_ResponseCache.ipynb 5
+@dataclass
+class CacheEntry:
+    """a cached response and the metadata needed to expire and revalidate it"""
+
+    response: ResponseGetData
+    path: str  # url path of the resource, used for invalidation
+    expires_at: float
+    size: int  # approximate size of the body in bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    @property
+    def is_revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def get_conditional_headers(self) -> dict:
+        headers = {}
+
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+# %% ../nbs/97_ResponseCache.ipynb 7
+class ResponseCache:
+    """TTL + LRU cache for GET responses with hit / miss / eviction stats"""
+
+    entries: "OrderedDict[tuple, CacheEntry]"
+    route_ttls: List[Tuple[Pattern, float]]
+
+    def __init__(self,
+                 max_size: int = 64 * 2 ** 20,  # max bytes of cached bodies before LRU eviction
+                 default_ttl: float = 0  # seconds to cache routes without a route ttl, 0 disables caching
+                 ):
+
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+        self.entries = OrderedDict()
+        self.route_ttls = []
+        self.size = 0
+
+        # the process-wide cache is shared by transports on different threads.  reentrant, because _remove is called with it held
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _get_path(url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.netloc}{parsed.path.rstrip('/')}"
+
+    @staticmethod
+    def _estimate_size(response: ResponseGetData) -> int:
+        """size of the raw body, without decoding a lazy body.  only responses built by hand are serialized to measure them"""
+
+        if response.bytes_received is not None:
+            return response.bytes_received
+
+        if not response.is_decoded:
+            return len(response._body)
+
+        body = response.response
+
+        if isinstance(body, (str, bytes)):
+            return len(body)
+
+        return len(cd.codec.dumps(body))
+
+    def set_route_ttl(self,
+                      pattern: str,  # regex searched against the url, e.g. r'/api/data/v1/accounts'
+                      ttl: float  # seconds to cache matching responses
+                      ):
+        """routes are matched in the order they are added, the first match wins"""
+        self.route_ttls.append((re.compile(pattern), ttl))
+
+    def get_ttl(self, url: str) -> float:
+        return next((ttl for pattern, ttl in self.route_ttls if pattern.search(url)), self.default_ttl)
+
+    @property
+    def stats(self) -> dict:
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'revalidations': self.revalidations,
+                'invalidations': self.invalidations,
+                'entries': len(self.entries),
+                'size': self.size}
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            self.size = 0
+
+# %% ../nbs/97_ResponseCache.ipynb 8
+@patch_to(ResponseCache)
+def get(self, key: tuple) -> Optional[CacheEntry]:
+    """returns the entry for key, fresh or stale, and counts a hit only for fresh entries"""
+
+    with self._lock:
+        entry = self.entries.get(key)
+
+        if entry is None or not entry.is_fresh:
+            self.misses += 1
+
+            # stale entries without validators are useless
+            if entry is not None and not entry.is_revalidatable:
+                self._remove(key)
+                return None
+
+            return entry
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+
+@patch_to(ResponseCache)
+def set(self,
+        key: tuple,
+        url: str,
+        response: ResponseGetData,
+        ttl: float,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+        ) -> Optional[CacheEntry]:
+    """stores a response, evicting least recently used entries to stay under max_size"""
+
+    size = self._estimate_size(response)
+
+    if ttl <= 0 or size > self.max_size:
+        return None
+
+    entry = CacheEntry(response=response, path=self._get_path(url), expires_at=time.monotonic() + ttl,
+                       size=size, etag=etag, last_modified=last_modified)
+
+    with self._lock:
+        self._remove(key)
+
+        self.entries[key] = entry
+        self.size += size
+
+        while self.size > self.max_size:
+            oldest_key = next(iter(self.entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    return entry
+
+
+@patch_to(ResponseCache)
+def revalidate(self, key: tuple, ttl: float) -> Optional[CacheEntry]:
+    """called when the server answers a conditional request with 304 Not Modified"""
+
+    with self._lock:
+        entry = self.entries.get(key)
+
+        if entry is None:
+            return None
+
+        entry.expires_at = time.monotonic() + ttl
+        self.entries.move_to_end(key)
+        self.revalidations += 1
+        return entry
+
+
+@patch_to(ResponseCache)
+def invalidate(self,
+               url: str  # url of a resource that was modified
+               ) -> int:
+    """removes entries for the resource, its parents and its children.  returns the number of entries removed"""
+
+    path = self._get_path(url)
+
+    with self._lock:
+        keys = [key for key, entry in self.entries.items()
+                if entry.path == path or path.startswith(entry.path + '/') or entry.path.startswith(path + '/')]
+
+        for key in keys:
+            self._remove(key)
+
+        self.invalidations += len(keys)
+
+    return len(keys)
+
+
+@patch_to(ResponseCache)
+def _remove(self, key: tuple):
+    with self._lock:
+        entry = self.entries.pop(key, None)
+
+        if entry is not None:
+            self.size -= entry.size
+
+# %% ../nbs/97_ResponseCache.ipynb 9
+response_cache = ResponseCache()
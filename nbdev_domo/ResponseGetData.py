@@ -1,100 +1,208 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/99_ResponseGetData.ipynb.
 
 # %% auto 0
-__all__ = ['ResponseGetData']
+__all__ = ['SELECTED_HEADERS', 'ResponseGetData']
 
 # %% ../nbs/99_ResponseGetData.ipynb 3
 import requests
-import asyncio
 import aiohttp
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Union, Optional
 
 from fastcore.utils import patch_to
 
+import nbdev_domo.Codec as cd
+from .Tracing import RequestTiming
+from .DecodePool import DecodePool
+
 
 # %% ../nbs/99_ResponseGetData.ipynb 5
 @dataclass
 class ResponseGetData:
-    """preferred response class for all API routes"""
+    """preferred response class for all API routes.  instances are slotted to keep bulk jobs that hold many responses small"""
     status: int
     response: Union[list, dict, str]
     is_success: bool
-    auth_header: Optional[dict] = field(default = None, repr = False)
+    auth_header: Optional[dict] = field(default = None, repr = False) # the transport's auth header, shared by reference and never copied
+    retry_count: int = field(default = 0, repr = False) # number of retries the transport made before returning
+    upload_stats: Optional[dict] = field(default = None, repr = False) # bytes in / out and throughput of streamed uploads
+    headers: Optional[dict] = field(default = None, repr = False) # the response headers listed in SELECTED_HEADERS
+    timing: Optional[RequestTiming] = field(default = None, repr = False) # per-phase timing, set when nbdev_domo.Tracing.request_tracer is enabled
+    method: Optional[str] = field(default = None, repr = False) # HTTP method of the request
+    url: Optional[str] = field(default = None, repr = False) # url of the request
+    elapsed: Optional[float] = field(default = None, repr = False) # seconds from sending the request to reading the body
+    bytes_received: Optional[int] = field(default = None, repr = False) # size of the raw response body
+
+
+# %% ../nbs/99_ResponseGetData.ipynb 7
+def _decode_body(body: bytes,
+                 content_type: str,
+                 encoding: Optional[str] = None  # charset of text bodies, defaults to utf-8
+                 ) -> Union[list, dict, str]:
+    """json bodies are parsed with the active codec, anything else is returned as text"""
+
+    if 'application/json' in content_type:
+        try:
+            return cd.codec.loads(body)
+
+        # fall back to text if unable to decode json
+        except Exception:
+            pass
+
+    return body.decode(encoding or 'utf-8', errors='replace')
+
+
+def _get_response(self) -> Union[list, dict, str]:
+    body = self._body
+
+    if body is not None:
+        self._response = _decode_body(body, self._content_type, self._encoding)
+        self._body = None
+
+    return self._response
+
+
+def _set_response(self, response: Union[list, dict, str]):
+    self._response = response
+    self._body = None
+
+
+ResponseGetData.response = property(_get_response, _set_response, doc='the decoded body, parsed on first access')
+
+
+def _add_slots(cls, extra_slots: tuple = ()):
+    """rebuilds a dataclass with __slots__, dataclass(slots = True) requires python 3.10.  fields backed by a property aren't slotted"""
+
+    cls_dict = dict(cls.__dict__)
+    field_names = [f.name for f in fields(cls) if not isinstance(cls_dict.get(f.name), property)]
+
+    for name in field_names:
+        cls_dict.pop(name, None)
+
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = tuple(field_names) + extra_slots
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    return slotted_cls
+
+
+# the raw body and the decoded response back the response property
+ResponseGetData = _add_slots(ResponseGetData, ('_response', '_body', '_content_type', '_encoding'))
 
 
+@patch_to(ResponseGetData, as_prop=True)
+def is_decoded(self) -> bool:
+    return self._body is None
+
+
+@patch_to(ResponseGetData, cls_method=True)
+def _from_body(cls,
+               status: int,
+               body: bytes,  # raw response body, decoded on first access of response
+               content_type: str = '',
+               encoding: Optional[str] = None,
+               auth_header: Optional[dict] = None,
+               headers: Optional[dict] = None
+               ) -> ResponseGetData:
+    rgd = cls(status=status, response=None, is_success=True, auth_header=auth_header, headers=headers)
+
+    rgd._body = body
+    rgd._content_type = content_type
+    rgd._encoding = encoding
+
+    return rgd
+
 # %% ../nbs/99_ResponseGetData.ipynb 10
+@patch_to(ResponseGetData)
+async def _decode_async(self,
+                        decode_pool: DecodePool
+                        ) -> None:
+    """decodes the body through decode_pool, on the event loop below its threshold and in a worker above it"""
+
+    body = self._body
+
+    if body is None:
+        return
+
+    self.response = await decode_pool.run(_decode_body, body, self._content_type, self._encoding, size=len(body))
+
+# %% ../nbs/99_ResponseGetData.ipynb 16
+SELECTED_HEADERS = ('Content-Type', 'Content-Length', 'ETag', 'Last-Modified', 'Cache-Control', 'Retry-After')
+
+# %% ../nbs/99_ResponseGetData.ipynb 17
+def _select_headers(headers) -> dict:
+    """copies SELECTED_HEADERS from a requests or aiohttp case-insensitive header mapping"""
+    return {key: headers[key] for key in SELECTED_HEADERS if key in headers}
+
+# %% ../nbs/99_ResponseGetData.ipynb 19
 @patch_to(ResponseGetData, cls_method=True)
 def _from_requests_response(cls, res: requests.Response,  # requests response object
                             auth_header: Optional[dict] = None # auth header used to authenticate request
                             ) -> ResponseGetData:
-    """returns ResponseGetData"""
+    """returns ResponseGetData, the body is decoded on first access of response"""
 
-    # JSON responses
-    if res.ok and "application/json" in res.headers.get("Content-Type", {}):
-        return ResponseGetData(
+    headers = _select_headers(res.headers)
+
+    # JSON and text responses
+    if res.ok:
+        rgd = cls._from_body(
             status=res.status_code,
-            response=res.json(),
-            is_success=True,
-            auth_header=auth_header
+            body=res.content,
+            content_type=res.headers.get("Content-Type", ""),
+            encoding=res.encoding,
+            auth_header=auth_header,
+            headers=headers
         )
+        rgd.bytes_received = len(res.content)
 
-    # default text responses
-    elif res.ok:
-        return ResponseGetData(
+    # errors
+    else:
+        rgd = ResponseGetData(
             status=res.status_code,
-            response=res.text,
-            is_success=True,
-            auth_header=auth_header
+            response=res.reason,
+            is_success=False,
+            auth_header=auth_header,
+            headers=headers
         )
 
-    # errors
-    return ResponseGetData(
-        status=res.status_code,
-        response=res.reason,
-        is_success=False,
-        auth_header=auth_header
-    )
+    rgd.method = res.request.method if res.request else None
+    rgd.url = res.url
+    rgd.elapsed = res.elapsed.total_seconds()
+
+    return rgd
 
 
-# %% ../nbs/99_ResponseGetData.ipynb 15
+# %% ../nbs/99_ResponseGetData.ipynb 24
 @patch_to(ResponseGetData, cls_method=True)
 async def _from_aiohttp_response(cls, res: aiohttp.ClientResponse,  # requests response object
                                  auth_header: Optional[dict] = None, # auth header used to authenticate request
                                  ) -> ResponseGetData:
 
-    """async method returns ResponseGetData"""
+    """async method returns ResponseGetData, the body is read now and decoded on first access of response"""
 
-    if res.ok and "application/json" in res.headers.get("Content-Type", {}):
-        try:
-            return cls(
-                status=res.status, response=await res.json(), is_success=True, auth_header=auth_header
-            )
-
-        # handle if unable to decode json()
-        except asyncio.TimeoutError as e:
-            print(e)
-
-            return cls(
-                status=res.status, response=await res.json(content_type=None), is_success=True, auth_header=auth_header
-            )
-
-        except Exception as e:
-            print(e)
-
-            data = await res.read()
-            return cls(
-                status=res.status, response=data.decode(), is_success=True, auth_header=auth_header
-            )
-
-        # response is text
-    elif res.ok:
-        return cls(
-            status=res.status, response=await res.text(), is_success=True, auth_header=auth_header
+    headers = _select_headers(res.headers)
+
+    # JSON and text responses
+    if res.ok:
+        # read outside of any try block so timeouts reach the transport's retry policy
+        data = await res.read()
+
+        rgd = cls._from_body(
+            status=res.status, body=data, content_type=res.headers.get("Content-Type", ""), encoding=res.charset,
+            auth_header=auth_header, headers=headers
         )
+        rgd.bytes_received = len(data)
 
     # response is error
     else:
-        return cls(status=res.status, response=str(res.reason), is_success=False, auth_header=auth_header)
+        rgd = cls(status=res.status, response=str(res.reason), is_success=False, auth_header=auth_header, headers=headers)
+
+    rgd.method = res.method
+    rgd.url = str(res.url)
+
+    return rgd
 
@@ -0,0 +1,154 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_Session.ipynb.
+
+# %% auto 0
+__all__ = ['session_registry', 'PoolConfig', 'SessionRegistry']
+
+# %% ../nbs/97_Session.ipynb 3
+import asyncio
+import atexit
+
+from dataclasses import dataclass
+from typing import Optional, Dict, Tuple
+
+import aiohttp
+
+from fastcore.basics import patch_to
+
+import nbdev_domo.utils as utils
+from .Tracing import request_tracer
+
+# %% ../nbs/97_Session.ipynb 5
+@dataclass(frozen=True)
+class PoolConfig:
+    """connection pool limits used when the registry creates a new aiohttp.TCPConnector"""
+
+    limit: int = 100  # total simultaneous connections per session
+    limit_per_host: int = 20  # simultaneous connections to the same endpoint
+    keepalive_timeout: float = 30  # seconds an idle connection is kept open
+    ttl_dns_cache: Optional[int] = 300  # seconds to cache DNS lookups
+    enable_cleanup_closed: bool = False
+
+    def _to_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            enable_cleanup_closed=self.enable_cleanup_closed,
+        )
+
+# %% ../nbs/97_Session.ipynb 7
+class SessionRegistry:
+    """process-wide registry of pooled aiohttp.ClientSession objects keyed by event loop and host"""
+
+    pool_config: PoolConfig
+    sessions: Dict[Tuple[asyncio.AbstractEventLoop, str], aiohttp.ClientSession]
+    loop_watchers: Dict[asyncio.AbstractEventLoop, asyncio.Task]
+
+    def __init__(self,
+                 pool_config: Optional[PoolConfig] = None,  # connector limits for new sessions
+                 close_at_exit: bool = True  # register an atexit hook that closes open sessions
+                 ):
+
+        self.pool_config = pool_config or PoolConfig()
+        self.sessions = {}
+        self.loop_watchers = {}
+
+        if close_at_exit:
+            atexit.register(self._close_at_exit)
+
+    def configure(self,
+                  pool_config: PoolConfig  # connector limits for sessions created from now on
+                  ):
+        """updates pool limits.  existing sessions keep their connector until they are closed"""
+        self.pool_config = pool_config
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+# %% ../nbs/97_Session.ipynb 8
+@patch_to(SessionRegistry)
+def get_session(self,
+                url: str  # url or host the session will send requests to
+                ) -> aiohttp.ClientSession:
+    """returns the pooled session for the url's host on the running event loop, creating one if necessary.  must be called from a running event loop"""
+
+    host = utils.convert_url_to_host(url)
+    loop = asyncio.get_running_loop()
+
+    session = self.sessions.get((loop, host))
+
+    if session is not None and not session.closed:
+        return session
+
+    # sessions of loops closed without asyncio.run can't be closed anymore, only forgotten
+    for key in [key for key in self.sessions if key[0].is_closed()]:
+        self.sessions.pop(key, None)
+        self.loop_watchers.pop(key[0], None)
+
+    session = aiohttp.ClientSession(connector=self.pool_config._to_connector(),
+                                    trace_configs=[request_tracer.trace_config])
+    self.sessions[(loop, host)] = session
+
+    if loop not in self.loop_watchers:
+        self.loop_watchers[loop] = loop.create_task(self._close_on_loop_shutdown(loop))
+
+    return session
+
+
+@patch_to(SessionRegistry)
+async def _close_on_loop_shutdown(self, loop: asyncio.AbstractEventLoop):
+    """waits until cancelled, which asyncio.run does before closing the loop, then closes the loop's sessions"""
+
+    try:
+        await loop.create_future()
+
+    finally:
+        if self.loop_watchers.get(loop) is asyncio.current_task():
+            del self.loop_watchers[loop]
+
+        await self.close()
+
+
+@patch_to(SessionRegistry)
+async def close(self,
+                url: Optional[str] = None  # close only the session for this url / host
+                ):
+    """closes pooled sessions owned by the running event loop and removes them from the registry"""
+
+    loop = asyncio.get_running_loop()
+    host = utils.convert_url_to_host(url) if url else None
+
+    keys = [key for key in self.sessions if key[0] is loop and (host is None or key[1] == host)]
+
+    for key in keys:
+        session = self.sessions.pop(key)
+
+        if not session.closed:
+            await session.close()
+
+    watcher = self.loop_watchers.pop(loop, None) if host is None else None
+
+    if watcher is not None and watcher is not asyncio.current_task():
+        watcher.cancel()
+
+
+@patch_to(SessionRegistry)
+def _close_at_exit(self):
+    """atexit hook, closes the sessions of every event loop that is still usable"""
+
+    for loop, watcher in list(self.loop_watchers.items()):
+        if loop.is_closed() or loop.is_running():
+            continue
+
+        watcher.cancel()
+        loop.run_until_complete(asyncio.gather(watcher, return_exceptions=True))
+
+    self.sessions = {}
+    self.loop_watchers = {}
+
+# %% ../nbs/97_Session.ipynb 9
+session_registry = SessionRegistry()
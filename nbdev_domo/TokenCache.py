@@ -0,0 +1,200 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_TokenCache.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_TOKEN_TTL', 'TokenKey', 'token_cache', 'CachedToken', 'TokenCache']
+
+# %% ../nbs/97_TokenCache.ipynb 3
+import os
+import time
+import asyncio
+import hashlib
+import functools
+
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Tuple, Callable, Awaitable
+
+from fastcore.basics import patch_to
+
+# %% ../nbs/97_TokenCache.ipynb 5
+DEFAULT_TOKEN_TTL = 3600  # seconds a token is trusted when the auth response doesn't say
+
+_FINGERPRINT_SALT = os.urandom(16)
+
+
+def _fingerprint(secret: str) -> str:
+    """salted sha256 of a credential, so neither keys nor entries hold the secret itself"""
+    return hashlib.sha256(_FINGERPRINT_SALT + str(secret).encode()).hexdigest()
+
+
+@dataclass
+class CachedToken:
+    """a token with its issue and expiry time"""
+
+    token: str = field(repr=False)
+    user_id: Optional[str] = None
+    issued_at: float = field(default_factory=time.time)
+    expires_at: Optional[float] = None  # defaults to issued_at + the cache's default_ttl
+    extra: dict = field(default_factory=dict)  # auth specific values, e.g. the developer auth's domain
+    credential_hash: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def expires_in(self) -> float:
+        return self.expires_at - time.time()
+
+    def is_expired(self,
+                   margin: float = 0  # seconds before expires_at a token already counts as expired
+                   ) -> bool:
+        # a margin longer than the token's lifetime would expire it as soon as it is issued
+        margin = min(margin, (self.expires_at - self.issued_at) / 2)
+        return self.expires_in <= margin
+
+# %% ../nbs/97_TokenCache.ipynb 7
+TokenKey = Tuple[str, str, str]  # (auth type, instance, principal)
+
+
+class TokenCache:
+    """process-wide cache of auth tokens with expiry"""
+
+    tokens: Dict[TokenKey, CachedToken]
+    inflight: Dict[TokenKey, asyncio.Task]
+    waiter_counts: Dict[TokenKey, int]
+
+    def __init__(self,
+                 default_ttl: float = DEFAULT_TOKEN_TTL,  # seconds, for tokens without an expiry of their own
+                 expiry_margin: float = 60,  # tokens this close to expiring are refreshed instead of handed out
+                 enabled: bool = True
+                 ):
+
+        self.default_ttl = default_ttl
+        self.expiry_margin = expiry_margin
+        self.enabled = enabled
+
+        self.tokens = {}
+        self.inflight = {}
+        self.waiter_counts = {}
+        self.hit_count = 0
+        self.fetch_count = 0
+
+    @property
+    def stats(self) -> dict:
+        return {'hit_count': self.hit_count, 'fetch_count': self.fetch_count, 'cached_count': len(self.tokens)}
+
+    def get(self,
+            key: TokenKey,
+            credential: str  # password, secret or access token the caller authenticates with
+            ) -> Optional[CachedToken]:
+        """returns the cached token if it was issued for the same credential and isn't about to expire"""
+
+        entry = self.tokens.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.is_expired(self.expiry_margin):
+            self.tokens.pop(key, None)
+            return None
+
+        if entry.credential_hash != _fingerprint(credential):
+            return None
+
+        return entry
+
+    def set(self,
+            key: TokenKey,
+            credential: str,
+            entry: CachedToken
+            ) -> CachedToken:
+
+        entry.credential_hash = _fingerprint(credential)
+
+        if entry.expires_at is None:
+            entry.expires_at = entry.issued_at + self.default_ttl
+
+        self.tokens[key] = entry
+        return entry
+
+    def invalidate(self, key: TokenKey):
+        self.tokens.pop(key, None)
+
+    def clear(self):
+        self.tokens = {}
+
+# %% ../nbs/97_TokenCache.ipynb 8
+@patch_to(TokenCache)
+def _discard(self, key: TokenKey, task: asyncio.Task):
+    if self.inflight.get(key) is task:
+        del self.inflight[key]
+
+
+@patch_to(TokenCache)
+async def _fetch_and_set(self,
+                         key: TokenKey,
+                         credential: str,
+                         fetch_fn: Callable[[], Awaitable[CachedToken]]
+                         ) -> CachedToken:
+    return self.set(key, credential, await fetch_fn())
+
+
+@patch_to(TokenCache)
+async def _fetch(self,
+                 key: TokenKey,
+                 credential: str,
+                 fetch_fn: Callable[[], Awaitable[CachedToken]]
+                 ) -> CachedToken:
+    """single-flight fetch, identical concurrent requests wait on the first one"""
+
+    task = self.inflight.get(key)
+
+    if task is None:
+        # the cache owns the fetch, so cancelling the caller that started it doesn't cancel the others
+        task = asyncio.ensure_future(self._fetch_and_set(key, credential, fetch_fn))
+        task.add_done_callback(functools.partial(self._discard, key))
+        self.inflight[key] = task
+        self.fetch_count += 1
+
+    self.waiter_counts[key] = self.waiter_counts.get(key, 0) + 1
+
+    try:
+        # a cancelled caller only detaches from the shared fetch
+        entry = await asyncio.shield(task)
+
+    except asyncio.CancelledError:
+        # the fetch is cancelled once nobody is waiting for it anymore
+        if self.waiter_counts[key] == 1 and not task.done():
+            task.cancel()
+
+        raise
+
+    finally:
+        self.waiter_counts[key] -= 1
+
+        if not self.waiter_counts[key]:
+            del self.waiter_counts[key]
+
+    # a caller with different credentials for the same principal checks its own
+    if entry.credential_hash != _fingerprint(credential):
+        return await self.get_or_fetch(key, credential, fetch_fn)
+
+    return entry
+
+# %% ../nbs/97_TokenCache.ipynb 9
+@patch_to(TokenCache)
+async def get_or_fetch(self,
+                       key: TokenKey,
+                       credential: str,
+                       fetch_fn: Callable[[], Awaitable[CachedToken]]  # authenticates and returns a new CachedToken
+                       ) -> CachedToken:
+
+    if not self.enabled:
+        return await fetch_fn()
+
+    entry = self.get(key, credential)
+
+    if entry is not None:
+        self.hit_count += 1
+        return entry
+
+    return await self._fetch(key, credential, fetch_fn)
+
+# %% ../nbs/97_TokenCache.ipynb 10
+token_cache = TokenCache()
@@ -0,0 +1,225 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/97_Tracing.ipynb.
+
+# %% auto 0
+__all__ = ['request_tracer', 'RequestTiming', 'RequestTracer']
+
+# %% ../nbs/97_Tracing.ipynb 3
+import time
+import warnings
+
+from dataclasses import dataclass, field, asdict
+from types import SimpleNamespace
+from typing import Optional, Callable, List
+
+import aiohttp
+
+from fastcore.basics import patch_to
+
+# %% ../nbs/97_Tracing.ipynb 5
+@dataclass
+class RequestTiming:
+    """per-phase timing of a single request"""
+
+    method: str
+    url: str
+    status: Optional[int] = None
+
+    pool_wait: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    request_sent: Optional[float] = None
+    ttfb: Optional[float] = None
+    body_read: Optional[float] = None
+    total: Optional[float] = None
+
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    connection_reused: Optional[bool] = None
+
+    # perf_counter marks used to derive the durations
+    _started_at: Optional[float] = field(default=None, repr=False)
+    _connection_ready_at: Optional[float] = field(default=None, repr=False)
+    _sent_at: Optional[float] = field(default=None, repr=False)
+    _response_at: Optional[float] = field(default=None, repr=False)
+
+    def to_dict(self) -> dict:
+        return {key: value for key, value in asdict(self).items() if not key.startswith('_')}
+
+    def _start(self):
+        self._started_at = time.perf_counter()
+
+    def _mark_response(self,
+                       status: int,
+                       ttfb: Optional[float] = None  # measured by the caller, e.g. requests.Response.elapsed
+                       ):
+        """called when the response headers have been received"""
+
+        self._response_at = time.perf_counter()
+        self.status = status
+
+        if ttfb is not None:
+            self.ttfb = ttfb
+
+        # sessions without the trace config don't report when the request was sent
+        elif self._sent_at is not None or self._started_at is not None:
+            self.ttfb = self._response_at - (self._sent_at or self._started_at)
+
+        if self._connection_ready_at is not None and self._sent_at is not None:
+            self.request_sent = self._sent_at - self._connection_ready_at
+
+    def _finish(self):
+        """called once the body has been read"""
+
+        now = time.perf_counter()
+
+        if self._response_at is not None:
+            self.body_read = now - self._response_at
+
+        if self._started_at is not None:
+            self.total = now - self._started_at
+
+# %% ../nbs/97_Tracing.ipynb 7
+class RequestTracer:
+    """opt-in registry of request timing callbacks"""
+
+    callbacks: List[Callable[[RequestTiming], None]]
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.callbacks = []
+        self._trace_config = None
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def add_callback(self, callback: Callable[[RequestTiming], None]):
+        """callback is called with the RequestTiming of every traced request"""
+        self.callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[RequestTiming], None]):
+        self.callbacks.remove(callback)
+
+    def start_timing(self, method: str, url: str) -> Optional[RequestTiming]:
+        """returns a started RequestTiming, or None if tracing is disabled"""
+
+        if not self.enabled:
+            return None
+
+        timing = RequestTiming(method=method, url=url)
+        timing._start()
+        return timing
+
+    def export(self, timing: RequestTiming):
+        for callback in self.callbacks:
+            try:
+                callback(timing)
+
+            # a failing exporter shouldn't fail the request, but it mustn't fail silently either
+            except Exception as e:
+                warnings.warn(f'request timing callback {callback!r} failed: {type(e).__name__}: {e}', RuntimeWarning)
+
+# %% ../nbs/97_Tracing.ipynb 8
+def _get_timing(trace_config_ctx: SimpleNamespace) -> Optional[RequestTiming]:
+    timing = trace_config_ctx.trace_request_ctx
+    return timing if isinstance(timing, RequestTiming) else None
+
+
+async def _on_connection_queued_start(session, ctx, params):
+    ctx.queued_at = time.perf_counter()
+
+
+async def _on_connection_queued_end(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing.pool_wait = time.perf_counter() - ctx.queued_at
+
+
+async def _on_connection_create_start(session, ctx, params):
+    ctx.create_started_at = time.perf_counter()
+
+
+async def _on_connection_create_end(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing._connection_ready_at = time.perf_counter()
+        timing.connect = timing._connection_ready_at - ctx.create_started_at - (timing.dns or 0)
+        timing.connection_reused = False
+
+
+async def _on_connection_reuseconn(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing._connection_ready_at = time.perf_counter()
+        timing.connection_reused = True
+
+
+async def _on_dns_resolvehost_start(session, ctx, params):
+    ctx.dns_started_at = time.perf_counter()
+
+
+async def _on_dns_resolvehost_end(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing.dns = time.perf_counter() - ctx.dns_started_at
+
+
+async def _on_dns_cache_hit(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing.dns = 0
+
+
+async def _on_request_headers_sent(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing._sent_at = time.perf_counter()
+
+
+async def _on_request_chunk_sent(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing.bytes_sent += len(params.chunk)
+        timing._sent_at = time.perf_counter()
+
+
+async def _on_request_end(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing._mark_response(params.response.status)
+
+
+async def _on_response_chunk_received(session, ctx, params):
+    timing = _get_timing(ctx)
+    if timing:
+        timing.bytes_received += len(params.chunk)
+
+# %% ../nbs/97_Tracing.ipynb 9
+@patch_to(RequestTracer, as_prop=True)
+def trace_config(self) -> aiohttp.TraceConfig:
+    """the TraceConfig to pass to aiohttp.ClientSession(trace_configs=[...])"""
+
+    if self._trace_config is not None:
+        return self._trace_config
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_queued_start.append(_on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(_on_connection_queued_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace_config.on_request_headers_sent.append(_on_request_headers_sent)
+    trace_config.on_request_chunk_sent.append(_on_request_chunk_sent)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+
+    self._trace_config = trace_config
+    return trace_config
+
+# %% ../nbs/97_Tracing.ipynb 10
+request_tracer = RequestTracer()
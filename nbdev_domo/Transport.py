@@ -1,23 +1,47 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/95_Transport.ipynb.
 
 # %% auto 0
-__all__ = ['TransportSync', 'TransportAsync']
+__all__ = ['DEFAULT_REQUEST_OPTIONS', 'request_coalescer', 'RetryPolicy', 'CachePolicy', 'RequestOptions', 'TransportSync',
+           'RequestCoalescer', 'TransportAsync', 'GzipCsvStream']
 
 # %% ../nbs/95_Transport.ipynb 3
+import io
+import re
+import csv
 import json
+import codecs
+import contextlib
+import functools
+import queue
+import threading
+import time
+import zlib
+import random
+import email.utils
+import datetime as dt
 import requests
+import requests.adapters
 import aiohttp
 import asyncio
 
-from requests_toolbelt.utils import dump
-
 from enum import Enum
 from abc import abstractmethod
-from typing import Optional, Union
+from dataclasses import dataclass, replace
+from typing import Optional, Union, Dict, Awaitable, FrozenSet, Tuple, List, Callable, Iterator, AsyncIterator, Iterable, AsyncIterable, Any
 
 from fastcore.basics import patch_to
+import nbdev_domo.Codec as cd
 from .ResponseGetData import ResponseGetData
-
+from .ResponseCache import ResponseCache, CacheEntry, response_cache as response_cache_default
+from .Session import SessionRegistry, session_registry as session_registry_default
+from .RateLimiter import RateLimiterRegistry, rate_limiter_registry as rate_limiter_registry_default
+from .CircuitBreaker import CircuitBreakerRegistry, circuit_breaker_registry as circuit_breaker_registry_default
+from .Tracing import RequestTracer, request_tracer as request_tracer_default
+from .Metrics import MetricsRegistry, metrics_registry as metrics_registry_default
+from .DecodePool import DecodePool, decode_pool as decode_pool_default
+from .Cassette import Cassette, get_cassette
+from .DebugSink import DebugTracer, DebugEvent, debug_tracer as debug_tracer_default
+from .CsvMaterializer import CsvMaterializer
 
 # %% ../nbs/95_Transport.ipynb 5
 class RequestTransport:
@@ -28,24 +52,45 @@ class RequestTransport:
 
     def __init__(self, auth_header: Optional[dict] = None,  # optional API authentication header
                  # defalt timeout to prevent infinite loops
-                 request_timeout: Optional[int] = 10
+                 request_timeout: Optional[int] = 10,
+                 # caches GET responses for routes with a ttl, defaults to the process-wide cache
+                 response_cache: Optional[ResponseCache] = None,
+                 # per-phase request timing, defaults to the process-wide tracer
+                 tracer: Optional[RequestTracer] = None,
+                 # request counts and latency histograms, defaults to the process-wide registry
+                 metrics: Optional[MetricsRegistry] = None,
+                 # records or replays requests, defaults to the process-wide cassette if one is set
+                 cassette: Optional[Cassette] = None,
+                 # receives debug events for requests sent with debug = True, defaults to the process-wide debug tracer
+                 debug_tracer: Optional[DebugTracer] = None
                  ):
 
         self.auth_header = auth_header
         self.request_timeout = request_timeout
+        self.response_cache = response_cache or response_cache_default
+        self.tracer = tracer or request_tracer_default
+        self.metrics = metrics or metrics_registry_default
+        self.cassette = cassette
+        self.debug_tracer = debug_tracer or debug_tracer_default
 
     @abstractmethod
     def _request() -> ResponseGetData:
         """Because each library has their own request methods, _request will be implemented in the interface classes of RequestTransport"""
         pass
 
-    def dump_response(self, response):
-        data = dump.dump_all(response)
-        return str(data.decode('utf-8'))
+    def dump_response(self, response: requests.Response,
+                      max_body_size: Optional[int] = None  # defaults to the debug tracer's max_body_size
+                      ) -> str:
+        """formats a requests.Response for debugging with redacted headers and a truncated body"""
+
+        return DebugEvent('response', response.request.method, response.url,
+                          headers=dict(response.headers), body=response.content, status=response.status_code,
+                          elapsed=response.elapsed.total_seconds(),
+                          max_body_size=max_body_size or self.debug_tracer.max_body_size).format()
 
     @staticmethod
     def _obj_to_json(obj):
-        return json.dumps(obj, default=str)
+        return cd.codec.dumps(obj)
 
     def _headers_default_receive_json(self):
         headers = {'Accept': 'application/json'}
@@ -91,99 +136,279 @@ class HTTPMethod(Enum):
     DELETE = 'DELETE'
 
 
-# %% ../nbs/95_Transport.ipynb 8
+def _make_request_key(method: HTTPMethod, url: str, headers: dict, params: Optional[dict] = None) -> tuple:
+    """identity of a request, headers are included so requests with different auth are never confused"""
+    return (method.value,
+            url,
+            json.dumps(params, sort_keys=True, default=str) if params else None,
+            tuple(sorted(headers.items())))
+
+
+# %% ../nbs/95_Transport.ipynb 9
+@dataclass
+class RetryPolicy:
+    """exponential backoff with jitter used by TransportAsync to retry failed requests"""
+
+    max_retries: int = 3  # retries after the first attempt, 0 disables retries
+    backoff_base: float = 0.5  # seconds to wait before the first retry
+    backoff_max: float = 30  # upper bound on any single wait, including Retry-After
+    jitter: float = 1  # fraction of the delay that is randomized, 1 = full jitter
+    retry_methods: FrozenSet[str] = frozenset({'GET', 'PUT', 'DELETE'})
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_exceptions: Tuple[type, ...] = (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+    respect_retry_after: bool = True
+
+    def _can_retry(self, method: HTTPMethod, attempt: int) -> bool:
+        return attempt < self.max_retries and method.value in self.retry_methods
+
+    def should_retry_status(self, method: HTTPMethod, status: int, attempt: int) -> bool:
+        """attempt is the number of retries already made"""
+        return self._can_retry(method, attempt) and status in self.retry_statuses
+
+    def should_retry_exception(self, method: HTTPMethod, exception: Exception, attempt: int) -> bool:
+        return self._can_retry(method, attempt) and isinstance(exception, self.retry_exceptions)
+
+    @staticmethod
+    def _parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """Retry-After is either a number of seconds or an HTTP date"""
+        if not retry_after:
+            return None
+
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+
+        try:
+            retry_dt = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+
+        return max((retry_dt - dt.datetime.now(dt.timezone.utc)).total_seconds(), 0)
+
+    def get_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """seconds to wait before retry number attempt + 1"""
+
+        retry_after_seconds = self._parse_retry_after(retry_after) if self.respect_retry_after else None
+
+        if retry_after_seconds is not None:
+            return min(retry_after_seconds, self.backoff_max)
+
+        delay = min(self.backoff_base * 2 ** attempt, self.backoff_max)
+        return delay * (1 - self.jitter * random.random())
+
+# %% ../nbs/95_Transport.ipynb 14
+class CachePolicy(Enum):
+    """how a request uses the response cache"""
+
+    DEFAULT = 'default'
+    REFRESH = 'refresh'
+    BYPASS = 'bypass'
+
+
+@dataclass(frozen=True)
+class RequestOptions:
+    """immutable per-call request settings"""
+
+    timeout: Optional[float] = None  # seconds, defaults to the transport's request_timeout
+    max_retries: Optional[int] = None  # defaults to the transport's retry_policy.max_retries
+    cache_policy: CachePolicy = CachePolicy.DEFAULT
+    priority: int = 0  # higher priority requests take rate limiter tokens first
+    decode_body: bool = False  # decode the body through the transport's decode_pool before returning it, for callers that read it
+
+    def replace(self, **kwargs) -> 'RequestOptions':
+        """copy with some options changed"""
+        return replace(self, **kwargs)
+
+
+DEFAULT_REQUEST_OPTIONS = RequestOptions()
+
+
+def _resolve_options(options: Optional[RequestOptions] = None,
+                     request_timeout: Optional[float] = None  # the legacy per-call argument, wins over options.timeout
+                     ) -> RequestOptions:
+    options = options or DEFAULT_REQUEST_OPTIONS
+    return options.replace(timeout=request_timeout) if request_timeout else options
+
+# %% ../nbs/95_Transport.ipynb 16
 # Each method establishes the appropriate headers before calling the request method.
+# request_timeout is kept for backwards compatibility and is folded into the per-call RequestOptions, the transport is never mutated.
 
 
 @patch_to(RequestTransport)
-def get(self, url, params=None, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def get(self, url, params=None, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+        coalesce: bool = True,  # share the response of an identical in-flight GET (TransportAsync only)
+        debug: bool = False,  # emit debug events to the debug tracer
+        options: Optional[RequestOptions] = None
+        ):
     headers = self._headers_default_receive_json()
-    return self._request(url, HTTPMethod.GET, headers, params, session=session)
+    return self._request(url, HTTPMethod.GET, headers, params, session=session, coalesce=coalesce,
+                         debug=debug, options=_resolve_options(options, request_timeout))
 
 
 @patch_to(RequestTransport)
-def get_csv(self, url, params=None, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def get_csv(self, url, params=None, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+            coalesce: bool = True,  # share the response of an identical in-flight GET (TransportAsync only)
+            debug: bool = False,  # emit debug events to the debug tracer
+            options: Optional[RequestOptions] = None
+            ):
     headers = self._headers_receive_csv()
-    return self._request(url, HTTPMethod.GET, headers, params, session=session)
+    return self._request(url, HTTPMethod.GET, headers, params, session=session, coalesce=coalesce,
+                         debug=debug, options=_resolve_options(options, request_timeout))
 
 
 @patch_to(RequestTransport)
-def post(self, url, body, params=None, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None) -> ResponseGetData:
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def post(self, url, body, params=None, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+         debug: bool = False,  # emit debug events to the debug tracer
+         options: Optional[RequestOptions] = None) -> ResponseGetData:
     headers = self._headers_send_json()
     return self._request(url, HTTPMethod.POST, headers, params,
-                         self._obj_to_json(body), session=session)
+                         self._obj_to_json(body), session=session, debug=debug, options=_resolve_options(options, request_timeout))
 
 
 @patch_to(RequestTransport)
-def put(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def put(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+        debug: bool = False,  # emit debug events to the debug tracer
+        options: Optional[RequestOptions] = None):
     headers = self._headers_send_json()
     return self._request(url, HTTPMethod.PUT, headers, {},
-                         self._obj_to_json(body), session=session)
+                         self._obj_to_json(body), session=session, debug=debug, options=_resolve_options(options, request_timeout))
 
 @patch_to(RequestTransport)
-def put_text(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None, debug: bool = False):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def put_text(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+             debug: bool = False,  # emit debug events to the debug tracer
+             options: Optional[RequestOptions] = None):
     headers = self._headers_send_text()
     return self._request(url, HTTPMethod.PUT, headers, {},
-                         str(body), session=session, debug = debug)
+                         str(body), session=session, debug=debug, options=_resolve_options(options, request_timeout))
 
 @patch_to(RequestTransport)
-def put_csv(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def put_csv(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+            debug: bool = False,  # emit debug events to the debug tracer
+            options: Optional[RequestOptions] = None):
     headers = self._headers_send_csv()
-    return self._request(url, HTTPMethod.PUT, headers, {}, body, session=session)
+    return self._request(url, HTTPMethod.PUT, headers, {}, body, session=session,
+                         debug=debug, options=_resolve_options(options, request_timeout))
 
 
 @patch_to(RequestTransport)
-def put_gzip(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def put_gzip(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+             debug: bool = False,  # emit debug events to the debug tracer
+             options: Optional[RequestOptions] = None):
     headers = self._headers_send_gzip()
-    return self._request(url, HTTPMethod.PUT, headers, {}, body, session=session)
+    return self._request(url, HTTPMethod.PUT, headers, {}, body, session=session,
+                         debug=debug, options=_resolve_options(options, request_timeout))
 
 
 @patch_to(RequestTransport)
-def patch(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def patch(self, url, body, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+          debug: bool = False,  # emit debug events to the debug tracer
+          options: Optional[RequestOptions] = None):
     headers = self._headers_send_json()
     return self._request(url, HTTPMethod.PATCH, headers, {},
-                         self._obj_to_json(body), session=session)
+                         self._obj_to_json(body), session=session, debug=debug, options=_resolve_options(options, request_timeout))
 
 
 @patch_to(RequestTransport)
-def delete(self, url, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None):
-    if request_timeout:
-        self.request_timeout = request_timeout
-
+def delete(self, url, request_timeout: Optional[int] = None, session: Optional[aiohttp.ClientSession] = None,
+           debug: bool = False,  # emit debug events to the debug tracer
+           options: Optional[RequestOptions] = None):
     headers = self._headers_default_receive_json()
-    return self._request(url, HTTPMethod.DELETE, headers, session=session)
+    return self._request(url, HTTPMethod.DELETE, headers, session=session,
+                         debug=debug, options=_resolve_options(options, request_timeout))
+
+
+# %% ../nbs/95_Transport.ipynb 18
+@patch_to(RequestTransport)
+def _cache_lookup(self, url: str, method: HTTPMethod, headers: dict, params: Optional[dict] = None,
+                  options: Optional[RequestOptions] = None
+                  ) -> Tuple[Optional[tuple], Optional[CacheEntry]]:
+    """returns the cache key and cached entry (fresh or stale) for GET requests to routes with a ttl"""
+
+    cache_policy = options.cache_policy if options else CachePolicy.DEFAULT
+
+    if method != HTTPMethod.GET or not self.response_cache or cache_policy == CachePolicy.BYPASS or self.response_cache.get_ttl(url) <= 0:
+        return None, None
+
+    key = _make_request_key(method, url, headers, params)
+
+    if cache_policy == CachePolicy.REFRESH:
+        return key, None
+
+    return key, self.response_cache.get(key)
+
+
+@patch_to(RequestTransport)
+def _cache_store(self, url: str, method: HTTPMethod, rgd: ResponseGetData,
+                 key: Optional[tuple] = None, entry: Optional[CacheEntry] = None
+                 ) -> ResponseGetData:
+    """caches or revalidates GET responses and invalidates the resource on any other method, returns the response to hand back"""
+
+    if not self.response_cache:
+        return rgd
+
+    if method != HTTPMethod.GET:
+        self.response_cache.invalidate(url)
+        return rgd
+
+    if key is None:
+        return rgd
 
+    ttl = self.response_cache.get_ttl(url)
 
-# %% ../nbs/95_Transport.ipynb 10
+    if rgd.status == 304 and entry is not None:
+        self.response_cache.revalidate(key, ttl)
+        return entry.response
+
+    if rgd.is_success:
+        headers = rgd.headers or {}
+        self.response_cache.set(key, url, rgd, ttl, etag=headers.get('ETag'), last_modified=headers.get('Last-Modified'))
+
+    return rgd
+
+# %% ../nbs/95_Transport.ipynb 20
 class TransportSync(RequestTransport):
+    """wrapper for requests.Session.  Connections are pooled by an HTTPAdapter owned by the transport, so one instance can be shared across threads"""
+
     def __init__(self, auth_header: Optional[dict] = None,  # for API Authentication
-                 request_timeout: int = 10  # for default timeout to prevent infinite loops
+                 request_timeout: int = 10,  # for default timeout to prevent infinite loops
+                 response_cache: Optional[ResponseCache] = None,  # defaults to the process-wide cache
+                 pool_connections: int = 10,  # number of hosts to keep connection pools for
+                 pool_maxsize: int = 20,  # connections kept alive per host, size this to the number of threads
+                 tracer: Optional[RequestTracer] = None,  # defaults to the process-wide tracer
+                 metrics: Optional[MetricsRegistry] = None,  # defaults to the process-wide registry
+                 cassette: Optional[Cassette] = None,  # defaults to the process-wide cassette if one is set
+                 debug_tracer: Optional[DebugTracer] = None  # defaults to the process-wide debug tracer
                  ):
-        super().__init__(auth_header=auth_header, request_timeout=request_timeout)
+        super().__init__(auth_header=auth_header, request_timeout=request_timeout, response_cache=response_cache,
+                         tracer=tracer, metrics=metrics, cassette=cassette, debug_tracer=debug_tracer)
+
+        self.adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """requests.Session is not thread-safe, so each thread gets its own session mounted on the shared adapter"""
+
+        session = getattr(self._local, 'session', None)
+
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', self.adapter)
+            session.mount('http://', self.adapter)
+            self._local.session = session
+
+        return session
+
+    def close(self):
+        """closes pooled connections"""
+        self.adapter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _request(self,
                  url: str,
@@ -191,10 +416,31 @@ class TransportSync(RequestTransport):
                  headers: dict,
                  params: Optional[dict] = None,
                  body: Union[str, dict, None] = None, 
+                 options: Optional[RequestOptions] = None,  # per-call timeout and cache policy
+                 debug: bool = False,  # emit debug events to the debug tracer
                  **kwargs
                  ):
 
-        # self.logger.debug('{} {} {}'.format(method, url, body))
+        options = options or DEFAULT_REQUEST_OPTIONS
+        cache_key, cache_entry = self._cache_lookup(url, method, headers, params, options)
+
+        if cache_entry is not None and cache_entry.is_fresh:
+            return cache_entry.response
+
+        if cache_entry is not None:
+            headers = {**headers, **cache_entry.get_conditional_headers()}
+
+        cassette = self.cassette or get_cassette()
+
+        if cassette is not None and cassette.is_replaying:
+            rgd = cassette.replay(method.value, url, params, body, auth_header=self.auth_header)
+            return self._cache_store(url, method, rgd, cache_key, cache_entry)
+
+        # debug events are only built while a sink is attached to the debug tracer
+        debug = debug and self.debug_tracer.is_active
+
+        if debug:
+            self.debug_tracer.emit('request', method.value, url, params=params, headers=headers, body=body)
 
         request_args = {'method': method.value,
                         'url': url,
@@ -203,26 +449,458 @@ class TransportSync(RequestTransport):
                         'data': body,
                         'stream': True}
 
-        if self.request_timeout:
-            request_args['timeout'] = self.request_timeout
+        timeout = options.timeout or self.request_timeout
 
-        res = requests.request(**request_args)
-        return ResponseGetData._from_requests_response(res=res, auth_header=self.auth_header)
+        if timeout:
+            request_args['timeout'] = timeout
 
+        timing = self.tracer.start_timing(method.value, url)
+        started_at = time.perf_counter()
 
-# %% ../nbs/95_Transport.ipynb 14
+        try:
+            res = self.session.request(**request_args)
+
+        except Exception as e:
+            self.metrics.record_request(url, method.value, type(e).__name__, time.perf_counter() - started_at, is_error=True)
+            raise
+
+        # the context manager releases the connection back to the pool, even if the body is not read
+        with res:
+            if timing:
+                timing._mark_response(res.status_code, ttfb=res.elapsed.total_seconds())
+
+            rgd = ResponseGetData._from_requests_response(res=res, auth_header=self.auth_header)
+            rgd.elapsed = time.perf_counter() - started_at
+
+            if timing:
+                timing.bytes_received = res.raw.tell()
+
+        self.metrics.record_request(url, method.value, rgd.status, time.perf_counter() - started_at,
+                                    is_error=not rgd.is_success)
+
+        if cassette is not None and cassette.is_recording:
+            cassette.record(method.value, url, params, body, headers, rgd, time.perf_counter() - started_at)
+
+        if debug:
+            self.debug_tracer.emit('response', method.value, url, headers=rgd.headers, body=rgd,
+                                   status=rgd.status, elapsed=time.perf_counter() - started_at)
+
+        if timing:
+            timing._finish()
+            rgd.timing = timing
+            self.tracer.export(timing)
+
+        return self._cache_store(url, method, rgd, cache_key, cache_entry)
+
+
+# %% ../nbs/95_Transport.ipynb 25
+class _CsvRowParser:
+    """incrementally parses csv rows from a stream of byte chunks"""
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._pending = ''
+
+    @staticmethod
+    def _split_complete_records(text: str) -> Tuple[str, str]:
+        """splits text after the last newline that is not inside a quoted value"""
+
+        end = text.rfind('\n')
+
+        while end != -1:
+            if text.count('"', 0, end) % 2 == 0:
+                return text[:end + 1], text[end + 1:]
+
+            end = text.rfind('\n', 0, end)
+
+        return '', text
+
+    def feed(self, chunk: bytes) -> List[list]:
+        complete, self._pending = self._split_complete_records(self._pending + self._decoder.decode(chunk))
+        return list(csv.reader(io.StringIO(complete))) if complete else []
+
+    def close(self) -> List[list]:
+        remainder, self._pending = self._pending + self._decoder.decode(b'', final=True), ''
+        return list(csv.reader(io.StringIO(remainder))) if remainder else []
+
+# %% ../nbs/95_Transport.ipynb 27
+def _is_2xx(status: int) -> bool:
+    return 200 <= status < 300
+
+
+def _iter_chunks(res: requests.Response,
+                 chunk_size: int,
+                 on_progress: Optional[Callable[[int], None]] = None  # called with the total bytes received
+                 ) -> Iterator[bytes]:
+    bytes_received = 0
+
+    for chunk in res.iter_content(chunk_size=chunk_size):
+        bytes_received += len(chunk)
+
+        if on_progress:
+            on_progress(bytes_received)
+
+        yield chunk
+
+
+@patch_to(TransportSync)
+def _open_stream(self,
+                 url: str,
+                 headers: dict,
+                 params: Optional[dict] = None,
+                 **kwargs  # passed to requests.Session.request
+                 ) -> requests.Response:
+    """sends a GET whose body is read as it arrives, use as a context manager so the connection is released"""
+
+    kwargs.setdefault('timeout', self.request_timeout)
+
+    return self.session.request(method=HTTPMethod.GET.value,
+                                url=url,
+                                headers=headers,
+                                params=params,
+                                stream=True,
+                                **kwargs)
+
+
+@patch_to(TransportSync)
+def get_csv_stream(self,
+                   url: str,
+                   params: Optional[dict] = None,
+                   chunk_size: int = 2 ** 16,  # bytes read from the socket at a time
+                   parse_rows: bool = False,  # yield parsed csv rows instead of byte chunks
+                   on_progress: Optional[Callable[[int], None]] = None,  # called with the total bytes received
+                   **kwargs  # passed to requests.Session.request
+                   ) -> Iterator[Union[bytes, list]]:
+    """generator that yields a csv export without loading the whole body into memory.  raises requests.HTTPError for error responses"""
+
+    parser = _CsvRowParser() if parse_rows else None
+
+    with self._open_stream(url, self._headers_receive_csv(), params, **kwargs) as res:
+        res.raise_for_status()
+
+        for chunk in _iter_chunks(res, chunk_size, on_progress):
+            if parser is None:
+                yield chunk
+                continue
+
+            yield from parser.feed(chunk)
+
+    if parser:
+        yield from parser.close()
+
+
+@patch_to(TransportSync)
+def download_csv(self,
+                 url: str,
+                 file_path: str,  # destination file, overwritten if it exists
+                 params: Optional[dict] = None,
+                 chunk_size: int = 2 ** 16,
+                 on_progress: Optional[Callable[[int], None]] = None,
+                 **kwargs  # passed to requests.Session.request
+                 ) -> ResponseGetData:
+    """writes a csv export straight to file_path, the response attribute is the file_path.  non-2xx responses return is_success = False and leave file_path untouched"""
+
+    with self._open_stream(url, self._headers_receive_csv(), params, **kwargs) as res:
+        if not _is_2xx(res.status_code):
+            return ResponseGetData(status=res.status_code, response=res.reason, is_success=False, auth_header=self.auth_header)
+
+        with open(file_path, 'wb') as f:
+            for chunk in _iter_chunks(res, chunk_size, on_progress):
+                f.write(chunk)
+
+    return ResponseGetData(status=res.status_code, response=file_path, is_success=True, auth_header=self.auth_header)
+
+
+@patch_to(TransportSync)
+def get_csv_frame(self,
+                  url: str,
+                  params: Optional[dict] = None,
+                  column_types: Optional[Dict[str, str]] = None,  # column name to a type hint, see CsvMaterializer
+                  backend: str = 'auto',  # auto, pyarrow or pandas
+                  block_size: int = 2 ** 23,  # bytes of csv parsed at a time
+                  chunk_size: int = 2 ** 16,
+                  on_progress: Optional[Callable[[int], None]] = None,
+                  **kwargs  # passed to requests.Session.request
+                  ) -> ResponseGetData:
+    """parses a csv export straight into a pyarrow.Table or pandas.DataFrame, the response attribute is the table.  non-2xx responses return is_success = False"""
+
+    materializer = CsvMaterializer(column_types=column_types, backend=backend, block_size=block_size)
+    blocks = []
+
+    with self._open_stream(url, self._headers_receive_csv(), params, **kwargs) as res:
+        if not _is_2xx(res.status_code):
+            return ResponseGetData(status=res.status_code, response=res.reason, is_success=False, auth_header=self.auth_header)
+
+        for chunk in _iter_chunks(res, chunk_size, on_progress):
+            blocks += materializer.feed(chunk)
+
+    blocks += materializer.close()
+    return ResponseGetData(status=res.status_code, response=materializer.to_frame(blocks), is_success=True, auth_header=self.auth_header)
+
+# %% ../nbs/95_Transport.ipynb 29
+class _JsonArrayParser:
+    """incrementally yields the elements of a top-level json array from a stream of byte chunks"""
+
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+    _STRUCTURE = re.compile(r'["\[\]{}]')  # characters that open or close a string, array or object
+    _STRING_END = re.compile(r'["\\]')
+    _SCALAR_END = re.compile(r'[ \t\n\r,\]]')
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json_decoder = json.JSONDecoder()
+        self._state = 'start'  # start, first (after the opening bracket), value, element, separator or done
+
+        # the element being read, kept across chunks so its text is only scanned once
+        self._element = []  # text of the element received so far
+        self._is_scalar = False  # numbers, true, false and null end at the next delimiter
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def _scan(self, text: str, pos: int) -> Optional[int]:
+        """index after the end of the current element, or None if it continues past text"""
+
+        if self._is_scalar:
+            match = self._SCALAR_END.search(text, pos)
+            return match.start() if match else None
+
+        while True:
+            if self._in_string:
+                if self._escaped:
+                    if pos == len(text):
+                        return None
+
+                    self._escaped, pos = False, pos + 1
+
+                match = self._STRING_END.search(text, pos)
+
+                if not match:
+                    return None
+
+                pos = match.end()
+
+                if match.group() == '\\':
+                    self._escaped = True
+                    continue
+
+                self._in_string = False
+
+                if self._depth == 0:
+                    return pos
+
+            else:
+                match = self._STRUCTURE.search(text, pos)
+
+                if not match:
+                    return None
+
+                char, pos = match.group(), match.end()
+
+                if char == '"':
+                    self._in_string = True
+
+                elif char in '[{':
+                    self._depth += 1
+
+                else:
+                    self._depth -= 1
+
+                    if self._depth == 0:
+                        return pos
+
+    def _parse(self, text: str, is_final: bool = False) -> list:
+        pos, items = 0, []
+
+        while self._state != 'done':
+            if self._state == 'element':
+                end = self._scan(text, pos)
+
+                # a scalar at the end of the buffer may continue in the next chunk
+                if end is None and not (is_final and self._is_scalar):
+                    self._element.append(text[pos:])
+                    break
+
+                end = len(text) if end is None else end
+                self._element.append(text[pos:end])
+
+                # the element is complete, so it is decoded once.  malformed json raises json.JSONDecodeError
+                items.append(self._json_decoder.decode(''.join(self._element)))
+                self._element = []
+                self._state, pos = 'separator', end
+                continue
+
+            pos = self._WHITESPACE.match(text, pos).end()
+
+            if pos == len(text):
+                break
+
+            char = text[pos]
+
+            if self._state == 'start':
+                if char != '[':
+                    raise ValueError('json stream must be a top-level array')
+
+                self._state, pos = 'first', pos + 1
+
+            elif self._state in ('first', 'separator') and char == ']':
+                self._state, pos = 'done', pos + 1
+
+            elif self._state == 'separator':
+                if char != ',':
+                    raise ValueError(f'expected , or ] in json stream, got {char}')
+
+                self._state, pos = 'value', pos + 1
+
+            else:
+                self._is_scalar = char not in '"[{'
+
+                # most elements are complete in the buffer and are decoded in place
+                try:
+                    item, end = self._json_decoder.raw_decode(text, pos)
+                except json.JSONDecodeError:
+                    end = None
+
+                if end is not None and (not self._is_scalar or self._SCALAR_END.match(text, end)):
+                    items.append(item)
+                    self._state, pos = 'separator', end
+
+                # the element continues in a later chunk, or is malformed
+                else:
+                    self._state, self._depth = 'element', 0
+
+        return items
+
+    def feed(self, chunk: bytes) -> list:
+        return self._parse(self._decoder.decode(chunk))
+
+    def close(self) -> list:
+        items = self._parse(self._decoder.decode(b'', final=True), is_final=True)
+
+        if self._state not in ('start', 'done'):
+            raise ValueError('json stream ended before the array was closed')
+
+        return items
+
+# %% ../nbs/95_Transport.ipynb 31
+@patch_to(TransportSync)
+def get_json_stream(self,
+                    url: str,
+                    params: Optional[dict] = None,
+                    chunk_size: int = 2 ** 16,  # bytes read from the socket at a time
+                    on_progress: Optional[Callable[[int], None]] = None,  # called with the total bytes received
+                    **kwargs  # passed to requests.Session.request
+                    ) -> Iterator[Any]:
+    """generator that yields the elements of a json array response as they arrive.  raises requests.HTTPError for error responses"""
+
+    parser = _JsonArrayParser()
+
+    with self._open_stream(url, self._headers_default_receive_json(), params, **kwargs) as res:
+        res.raise_for_status()
+
+        for chunk in _iter_chunks(res, chunk_size, on_progress):
+            yield from parser.feed(chunk)
+
+    yield from parser.close()
+
+# %% ../nbs/95_Transport.ipynb 33
+class RequestCoalescer:
+    """single-flight registry that shares the result of identical in-flight requests"""
+
+    inflight: Dict[tuple, asyncio.Task]
+    waiter_counts: Dict[tuple, int]
+
+    def __init__(self):
+        self.inflight = {}
+        self.waiter_counts = {}
+        self.request_count = 0  # requests actually sent
+        self.coalesced_count = 0  # requests that waited on an in-flight request instead
+
+    @property
+    def stats(self) -> dict:
+        return {'request_count': self.request_count,
+                'coalesced_count': self.coalesced_count,
+                'inflight_count': len(self.inflight)}
+
+    def _discard(self, key: tuple, task: asyncio.Task):
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+
+    async def run(self,
+                  key: tuple,  # identity of the request, see _make_request_key
+                  send_fn: Callable[[], Awaitable[ResponseGetData]]  # sends the request if none is in flight
+                  ) -> ResponseGetData:
+
+        task = self.inflight.get(key)
+
+        if task is not None:
+            self.coalesced_count += 1
+
+        else:
+            # the coalescer owns the request, so cancelling the caller that started it doesn't cancel the others
+            task = asyncio.ensure_future(send_fn())
+            task.add_done_callback(functools.partial(self._discard, key))
+            self.inflight[key] = task
+            self.request_count += 1
+
+        self.waiter_counts[key] = self.waiter_counts.get(key, 0) + 1
+
+        try:
+            # a cancelled caller only detaches from the shared request
+            return await asyncio.shield(task)
+
+        except asyncio.CancelledError:
+            # the request is cancelled once nobody is waiting for it anymore
+            if self.waiter_counts[key] == 1 and not task.done():
+                task.cancel()
+
+            raise
+
+        finally:
+            self.waiter_counts[key] -= 1
+
+            if not self.waiter_counts[key]:
+                del self.waiter_counts[key]
+
+# %% ../nbs/95_Transport.ipynb 34
+request_coalescer = RequestCoalescer()
+
+# %% ../nbs/95_Transport.ipynb 39
 class TransportAsync(RequestTransport):
-    """wrapper for aiohttp.ClientSession and aiohttp.ClientResponse for handling asynchronous code execution.  In the event of request_timeout, will default to synchronous code execution via requests.request library"""
+    """wrapper for aiohttp.ClientSession and aiohttp.ClientResponse for handling asynchronous code execution.  Failed requests are retried without blocking the event loop according to `retry_policy`"""
 
     def __init__(self,
                  # API Authentication header
                  auth_header: Optional[dict] = None,
                  request_timeout: int = 10,  # request timeout to prevent infinite loops
-                 session: Optional[aiohttp.ClientSession] = None
+                 session: Optional[aiohttp.ClientSession] = None,
+                 # pooled sessions used when no session is passed, defaults to the process-wide registry
+                 session_registry: Optional[SessionRegistry] = None,
+                 retry_policy: Optional[RetryPolicy] = None,  # defaults to RetryPolicy()
+                 # per-host token buckets shared by every transport, defaults to the process-wide registry
+                 rate_limiter_registry: Optional[RateLimiterRegistry] = None,
+                 # shares identical in-flight GET requests, defaults to the process-wide coalescer
+                 coalescer: Optional[RequestCoalescer] = None,
+                 # per-host circuit breakers shared by every transport, defaults to the process-wide registry
+                 circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+                 response_cache: Optional[ResponseCache] = None,  # defaults to the process-wide cache
+                 tracer: Optional[RequestTracer] = None,  # defaults to the process-wide tracer
+                 metrics: Optional[MetricsRegistry] = None,  # defaults to the process-wide registry
+                 cassette: Optional[Cassette] = None,  # defaults to the process-wide cassette if one is set
+                 debug_tracer: Optional[DebugTracer] = None,  # defaults to the process-wide debug tracer
+                 # decodes large response bodies off the event loop, defaults to the process-wide pool
+                 decode_pool: Optional[DecodePool] = None
                  ):
 
         self.session = session
-        super().__init__(auth_header=auth_header, request_timeout=request_timeout)
+        self.session_registry = session_registry or session_registry_default
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter_registry = rate_limiter_registry or rate_limiter_registry_default
+        self.coalescer = coalescer or request_coalescer
+        self.circuit_breakers = circuit_breakers or circuit_breaker_registry_default
+        self.decode_pool = decode_pool or decode_pool_default
+        super().__init__(auth_header=auth_header, request_timeout=request_timeout, response_cache=response_cache,
+                         tracer=tracer, metrics=metrics, cassette=cassette, debug_tracer=debug_tracer)
 
     async def _request(self,
                        url: str,
@@ -231,16 +909,57 @@ class TransportAsync(RequestTransport):
                        params: Optional[dict] = None,
                        body: Union[str, dict, None] = None,
                        session: Optional[aiohttp.ClientSession] = None,
-                       debug : bool = False
+                       debug : bool = False,
+                       coalesce: bool = False,  # share the response of an identical in-flight GET
+                       options: Optional[RequestOptions] = None  # per-call timeout, retries, cache policy and priority
                        ):
 
-        session = session or self.session
+        options = options or DEFAULT_REQUEST_OPTIONS
+        cache_key, cache_entry = self._cache_lookup(url, method, headers, params, options)
 
-        if session is None:
-            is_close_session = True
-            session = aiohttp.ClientSession()
+        if cache_entry is not None and cache_entry.is_fresh:
+            return cache_entry.response
+
+        if cache_entry is not None:
+            headers = {**headers, **cache_entry.get_conditional_headers()}
+
+        if coalesce and method == HTTPMethod.GET:
+            rgd = await self.coalescer.run(
+                # callers with a different timeout, retry budget or priority send their own request
+                (_make_request_key(method, url, headers, params), options),
+                lambda: self._send(url, method, headers, params, session=session, debug=debug, options=options))
         else:
-            is_close_session = False
+            rgd = await self._send(url, method, headers, params, body, session=session, debug=debug, options=options)
+
+        return self._cache_store(url, method, rgd, cache_key, cache_entry)
+
+    async def _send(self,
+                    url: str,
+                    method: HTTPMethod,
+                    headers: dict,
+                    params: Optional[dict] = None,
+                    body: Union[str, dict, None] = None,
+                    session: Optional[aiohttp.ClientSession] = None,
+                    debug : bool = False,
+                    options: Optional[RequestOptions] = None
+                    ):
+        """sends the request, retrying according to retry_policy.  options are local to this call so concurrent requests never see each other's settings"""
+
+        options = options or DEFAULT_REQUEST_OPTIONS
+        timeout = options.timeout or self.request_timeout
+        retry_policy = self.retry_policy
+
+        if options.max_retries is not None:
+            retry_policy = replace(retry_policy, max_retries=options.max_retries)
+
+        cassette = self.cassette or get_cassette()
+
+        if cassette is not None and cassette.is_replaying:
+            return await cassette.replay_async(method.value, url, params, body, auth_header=self.auth_header)
+
+        session = session or self.session or self.session_registry.get_session(url)
+        rate_limiter = self.rate_limiter_registry.get_limiter(url)
+        breaker = self.circuit_breakers.get_breaker(url)
 
         # self.logger.debug('{} {} {}'.format(method, url, body))
 
@@ -249,27 +968,498 @@ class TransportAsync(RequestTransport):
                         'params': params,
                         'data': body}
 
+        # debug events are only built while a sink is attached to the debug tracer
+        debug = debug and self.debug_tracer.is_active
+
         if debug:
-            print(request_args)
+            self.debug_tracer.emit('request', method.value, url, params=params, headers=headers, body=body)
+
+        # an open circuit raises CircuitOpenError instead of waiting out the request timeout.
+        # the breaker records one outcome per call, after retries, so one call's retries can't open the circuit on their own
+        if breaker:
+            breaker.before_request()
 
         try:
-            res = await getattr(session, method.value.lower())(
-                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
-                **request_args)
+            attempt = 0
 
-            return await ResponseGetData._from_aiohttp_response(res, auth_header=self.auth_header)
+            while True:
+                timing = None
+                started_at = time.perf_counter()
 
-        except asyncio.TimeoutError as e:
-            print('defaulting to sync request.  TimeoutError')
+                try:
+                    if rate_limiter:
+                        await rate_limiter.acquire(priority=options.priority)
 
-            res = requests.request(
-                method=method.value,
-                timeout=self.request_timeout,
-                **request_args)
+                    timing = self.tracer.start_timing(method.value, url)
+                    started_at = time.perf_counter()
 
-            return ResponseGetData._from_requests_response(res, auth_header=self.auth_header)
+                    # the context manager releases the connection back to the pool once the body is read
+                    async with getattr(session, method.value.lower())(
+                            timeout=aiohttp.ClientTimeout(total=timeout),
+                            trace_request_ctx=timing,
+                            **request_args) as res:
 
-        finally:
-            if is_close_session:
-                await session.close()
+                        # sessions created without the tracer's trace config
+                        if timing and timing.status is None:
+                            timing._mark_response(res.status)
+
+                        rgd = await ResponseGetData._from_aiohttp_response(res, auth_header=self.auth_header)
+                        rgd.elapsed = time.perf_counter() - started_at
+                        retry_after = res.headers.get('Retry-After')
+
+                    if timing:
+                        timing._finish()
+                        rgd.timing = timing
+                        self.tracer.export(timing)
+
+                # CancelledError is an Exception before python 3.8
+                except asyncio.CancelledError:
+                    raise
+
+                except Exception as e:
+                    self.metrics.record_request(url, method.value, type(e).__name__, time.perf_counter() - started_at,
+                                                is_error=True)
+
+                    if not retry_policy.should_retry_exception(method, e, attempt):
+                        if breaker:
+                            breaker.on_failure(type(e).__name__)
+
+                        raise
+
+                    delay = retry_policy.get_delay(attempt)
+
+                    if debug:
+                        self.debug_tracer.emit('retry', method.value, url,
+                                               message=f'retrying in {delay:.2f}s after {type(e).__name__}')
+
+                else:
+                    self.metrics.record_request(url, method.value, rgd.status, time.perf_counter() - started_at,
+                                                is_error=not rgd.is_success)
+
+                    if rate_limiter:
+                        rate_limiter.on_response(rgd.status, RetryPolicy._parse_retry_after(retry_after))
+
+                    if not retry_policy.should_retry_status(method, rgd.status, attempt):
+                        rgd.retry_count = attempt
+
+                        if breaker:
+                            breaker.on_response(rgd.status)
+
+                        # parsing a large body on the event loop would stall every other request in flight.
+                        # callers that only check the status leave the body lazy
+                        if options.decode_body:
+                            await rgd._decode_async(self.decode_pool)
+
+                        if debug:
+                            self.debug_tracer.emit('response', method.value, url, headers=rgd.headers, body=rgd,
+                                                   status=rgd.status, elapsed=time.perf_counter() - started_at)
+
+                        if cassette is not None and cassette.is_recording:
+                            cassette.record(method.value, url, params, body, headers, rgd, time.perf_counter() - started_at)
+
+                        return rgd
+
+                    delay = retry_policy.get_delay(attempt, retry_after)
+
+                    if debug:
+                        self.debug_tracer.emit('retry', method.value, url, status=rgd.status,
+                                               message=f'retrying in {delay:.2f}s after status {rgd.status}')
+
+                attempt += 1
+                await asyncio.sleep(delay)
+
+        # a cancelled call frees its half-open probe slot without counting as a failure
+        except asyncio.CancelledError:
+            if breaker:
+                breaker.release()
+
+            raise
+
+# %% ../nbs/95_Transport.ipynb 50
+async def _iter_chunks_async(res: aiohttp.ClientResponse,
+                             chunk_size: int,
+                             on_progress: Optional[Callable[[int], None]] = None  # called with the total bytes received
+                             ) -> AsyncIterator[bytes]:
+    bytes_received = 0
+
+    async for chunk in res.content.iter_chunked(chunk_size):
+        bytes_received += len(chunk)
+
+        if on_progress:
+            on_progress(bytes_received)
+
+        yield chunk
+
+
+@patch_to(TransportAsync)
+@contextlib.asynccontextmanager
+async def _open_stream(self,
+                       url: str,
+                       headers: dict,
+                       params: Optional[dict] = None,
+                       session: Optional[aiohttp.ClientSession] = None,
+                       method: HTTPMethod = HTTPMethod.GET,
+                       data: Any = None  # request body, e.g. an async iterable of upload chunks
+                       ) -> AsyncIterator[aiohttp.ClientResponse]:
+    """sends a request whose body is streamed, the connection is released when the context exits.  raises CircuitOpenError while the host's circuit is open"""
+
+    session = session or self.session or self.session_registry.get_session(url)
+    rate_limiter = self.rate_limiter_registry.get_limiter(url)
+    breaker = self.circuit_breakers.get_breaker(url)
+
+    if breaker:
+        breaker.before_request()
+
+    # only connecting and each socket read are bounded, a large export may take longer than request_timeout overall
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.request_timeout, sock_read=self.request_timeout)
+
+    # the outcome is recorded once the status arrives, errors raised while the caller reads the body aren't the host's
+    has_response = False
+
+    try:
+        if rate_limiter:
+            await rate_limiter.acquire()
+
+        async with session.request(method.value, url, headers=headers, params=params, data=data, timeout=timeout) as res:
+            has_response = True
+
+            if rate_limiter:
+                rate_limiter.on_response(res.status)
+
+            if breaker:
+                breaker.on_response(res.status)
+
+            yield res
+
+    except asyncio.CancelledError:
+        if breaker and not has_response:
+            breaker.release()
+
+        raise
+
+    except Exception as e:
+        if breaker and not has_response:
+            breaker.on_failure(type(e).__name__)
+
+        raise
+
+
+@patch_to(TransportAsync)
+async def get_csv_stream(self,
+                         url: str,
+                         params: Optional[dict] = None,
+                         chunk_size: int = 2 ** 16,  # bytes read from the socket at a time
+                         parse_rows: bool = False,  # yield parsed csv rows instead of byte chunks
+                         on_progress: Optional[Callable[[int], None]] = None,  # called with the total bytes received
+                         session: Optional[aiohttp.ClientSession] = None
+                         ) -> AsyncIterator[Union[bytes, list]]:
+    """async generator that yields a csv export without loading the whole body into memory.  raises aiohttp.ClientResponseError for error responses"""
+
+    parser = _CsvRowParser() if parse_rows else None
+
+    async with self._open_stream(url, self._headers_receive_csv(), params, session=session) as res:
+        res.raise_for_status()
+
+        async for chunk in _iter_chunks_async(res, chunk_size, on_progress):
+            if parser is None:
+                yield chunk
+                continue
+
+            for row in parser.feed(chunk):
+                yield row
+
+    if parser:
+        for row in parser.close():
+            yield row
+
+
+@patch_to(TransportAsync)
+async def download_csv(self,
+                       url: str,
+                       file_path: str,  # destination file, overwritten if it exists
+                       params: Optional[dict] = None,
+                       chunk_size: int = 2 ** 16,
+                       on_progress: Optional[Callable[[int], None]] = None,
+                       session: Optional[aiohttp.ClientSession] = None
+                       ) -> ResponseGetData:
+    """writes a csv export straight to file_path, the response attribute is the file_path.  non-2xx responses return is_success = False and leave file_path untouched"""
+
+    loop = asyncio.get_running_loop()
+
+    async with self._open_stream(url, self._headers_receive_csv(), params, session=session) as res:
+        if not _is_2xx(res.status):
+            return ResponseGetData(status=res.status, response=str(res.reason), is_success=False, auth_header=self.auth_header)
+
+        with open(file_path, 'wb') as f:
+            async for chunk in _iter_chunks_async(res, chunk_size, on_progress):
+                # file writes happen on the default executor so they don't block the event loop
+                await loop.run_in_executor(None, f.write, chunk)
+
+    return ResponseGetData(status=res.status, response=file_path, is_success=True, auth_header=self.auth_header)
+
+
+@patch_to(TransportAsync)
+async def get_csv_frame(self,
+                        url: str,
+                        params: Optional[dict] = None,
+                        column_types: Optional[Dict[str, str]] = None,  # column name to a type hint, see CsvMaterializer
+                        backend: str = 'auto',  # auto, pyarrow or pandas
+                        block_size: int = 2 ** 23,  # bytes of csv parsed at a time
+                        chunk_size: int = 2 ** 16,
+                        on_progress: Optional[Callable[[int], None]] = None,
+                        session: Optional[aiohttp.ClientSession] = None
+                        ) -> ResponseGetData:
+    """parses a csv export straight into a pyarrow.Table or pandas.DataFrame, the response attribute is the table.  non-2xx responses return is_success = False"""
+
+    materializer = CsvMaterializer(column_types=column_types, backend=backend, block_size=block_size)
+    loop = asyncio.get_running_loop()
+    blocks = []
+
+    async with self._open_stream(url, self._headers_receive_csv(), params, session=session) as res:
+        if not _is_2xx(res.status):
+            return ResponseGetData(status=res.status, response=str(res.reason), is_success=False, auth_header=self.auth_header)
+
+        async for chunk in _iter_chunks_async(res, chunk_size, on_progress):
+            # blocks are parsed on the default executor so they don't block the event loop
+            blocks += await loop.run_in_executor(None, materializer.feed, chunk)
+
+    blocks += await loop.run_in_executor(None, materializer.close)
+    frame = await loop.run_in_executor(None, materializer.to_frame, blocks)
+
+    return ResponseGetData(status=res.status, response=frame, is_success=True, auth_header=self.auth_header)
+
+
+@patch_to(TransportAsync)
+async def get_json_stream(self,
+                          url: str,
+                          params: Optional[dict] = None,
+                          chunk_size: int = 2 ** 16,  # bytes read from the socket at a time
+                          on_progress: Optional[Callable[[int], None]] = None,  # called with the total bytes received
+                          session: Optional[aiohttp.ClientSession] = None
+                          ) -> AsyncIterator[Any]:
+    """async generator that yields the elements of a json array response as they arrive.  raises aiohttp.ClientResponseError for error responses"""
+
+    parser = _JsonArrayParser()
+
+    async with self._open_stream(url, self._headers_default_receive_json(), params, session=session) as res:
+        res.raise_for_status()
+
+        async for chunk in _iter_chunks_async(res, chunk_size, on_progress):
+            for item in parser.feed(chunk):
+                yield item
+
+    for item in parser.close():
+        yield item
+
+# %% ../nbs/95_Transport.ipynb 54
+class _UploadCancelled(Exception):
+    """raised in the compression thread when the upload stops consuming chunks"""
+    pass
+
+# %% ../nbs/95_Transport.ipynb 55
+class GzipCsvStream:
+    """async iterable of gzip bytes, compressed from a csv source in a worker thread"""
+
+    _DONE = object()
+
+    def __init__(self,
+                 source: Union[str, Iterable, AsyncIterable],  # file path, iterable or async iterable of csv text / rows
+                 chunk_size: int = 2 ** 16,  # bytes of csv compressed at a time
+                 compresslevel: int = 6,
+                 max_pending_chunks: int = 8  # bound on buffered chunks between threads
+                 ):
+
+        self.source = source
+        self.chunk_size = chunk_size
+        self.compresslevel = compresslevel
+        self.max_pending_chunks = max_pending_chunks
+
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.compress_seconds = 0
+
+    @property
+    def stats(self) -> dict:
+        return {'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'compression_ratio': self.bytes_in / self.bytes_out if self.bytes_out else None,
+                'compress_seconds': self.compress_seconds,
+                'compress_mb_per_second': self.bytes_in / 1e6 / self.compress_seconds if self.compress_seconds else None}
+
+    @staticmethod
+    def _encode_row(row: Union[str, bytes, list, tuple]) -> bytes:
+        if isinstance(row, bytes):
+            return row
+
+        if isinstance(row, str):
+            return row.encode('utf-8')
+
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerow(row)
+        return buffer.getvalue().encode('utf-8')
+
+    def _iter_blocks(self, rows: Iterable) -> Iterator[bytes]:
+        """batches encoded rows into blocks of about chunk_size bytes"""
+
+        block, block_size = [], 0
+
+        for row in rows:
+            data = self._encode_row(row)
+            block.append(data)
+            block_size += len(data)
+
+            if block_size >= self.chunk_size:
+                yield b''.join(block)
+                block, block_size = [], 0
+
+        if block:
+            yield b''.join(block)
+
+    def _iter_file(self) -> Iterator[bytes]:
+        with open(self.source, 'rb') as f:
+            yield from iter(lambda: f.read(self.chunk_size), b'')
+
+# %% ../nbs/95_Transport.ipynb 56
+@patch_to(GzipCsvStream)
+def _compress(self,
+              blocks: Iterator[bytes],  # raw csv blocks, consumed in the worker thread
+              put: Callable[[Any], None]  # hands compressed chunks back to the event loop
+              ):
+    """worker thread body"""
+
+    # wbits = 16 + MAX_WBITS writes a gzip header and trailer
+    compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    try:
+        for block in blocks:
+            started_at = time.perf_counter()
+            data = compressor.compress(block)
+            self.compress_seconds += time.perf_counter() - started_at
+            self.bytes_in += len(block)
+
+            if data:
+                self.bytes_out += len(data)
+                put(data)
+
+        data = compressor.flush()
+        self.bytes_out += len(data)
+        put(data)
+        put(self._DONE)
+
+    except _UploadCancelled:
+        pass
+
+    except Exception as e:
+        put(e)
+
+
+@patch_to(GzipCsvStream)
+async def __aiter__(self):
+    loop = asyncio.get_running_loop()
+
+    compressed = asyncio.Queue()
+    compressed_slots = threading.Semaphore(self.max_pending_chunks)
+    cancelled = threading.Event()
+
+    def put(item):
+        while not compressed_slots.acquire(timeout=0.1):
+            if cancelled.is_set():
+                raise _UploadCancelled()
+
+        loop.call_soon_threadsafe(compressed.put_nowait, item)
+
+    feed_task = None
+
+    if isinstance(self.source, str):
+        blocks = self._iter_file()
+
+    elif hasattr(self.source, '__aiter__'):
+        # async sources are consumed on the event loop and handed to the worker thread
+        raw = queue.Queue()
+        raw_slots = asyncio.Semaphore(self.max_pending_chunks)
+
+        async def feed():
+            end = self._DONE
+
+            try:
+                block, block_size = [], 0
+                async for row in self.source:
+                    data = self._encode_row(row)
+                    block.append(data)
+                    block_size += len(data)
+
+                    if block_size >= self.chunk_size:
+                        await raw_slots.acquire()
+                        raw.put(b''.join(block))
+                        block, block_size = [], 0
+
+                if block:
+                    await raw_slots.acquire()
+                    raw.put(b''.join(block))
+
+            # the worker re-raises the source's error, so the upload fails instead of ending early with a valid gzip trailer
+            except Exception as e:
+                end = e
+
+            finally:
+                raw.put(end)
+
+        def iter_raw():
+            for block in iter(raw.get, self._DONE):
+                if isinstance(block, Exception):
+                    raise block
+
+                loop.call_soon_threadsafe(raw_slots.release)
+                yield block
+
+        blocks = iter_raw()
+        feed_task = asyncio.ensure_future(feed())
+
+    else:
+        blocks = self._iter_blocks(self.source)
+
+    worker = loop.run_in_executor(None, self._compress, blocks, put)
+
+    try:
+        while True:
+            item = await compressed.get()
+            compressed_slots.release()
+
+            if item is self._DONE:
+                break
+
+            if isinstance(item, Exception):
+                raise item
+
+            yield item
+
+        await worker
+
+    finally:
+        cancelled.set()
+
+        if feed_task and not feed_task.done():
+            feed_task.cancel()
+
+# %% ../nbs/95_Transport.ipynb 58
+@patch_to(TransportAsync)
+async def put_gzip_stream(self,
+                          url: str,
+                          source: Union[str, Iterable, AsyncIterable],  # file path, iterable or async iterable of csv text / rows
+                          chunk_size: int = 2 ** 16,
+                          compresslevel: int = 6,
+                          session: Optional[aiohttp.ClientSession] = None
+                          ) -> ResponseGetData:
+    """compresses and uploads a csv source as a chunked gzip body.  upload_stats on the response reports bytes in, bytes out and compression throughput"""
+
+    gzip_stream = GzipCsvStream(source, chunk_size=chunk_size, compresslevel=compresslevel)
+
+    # the body can only be read once, so streamed uploads are not retried
+    async with self._open_stream(url, self._headers_send_gzip(), session=session,
+                                 method=HTTPMethod.PUT, data=gzip_stream.__aiter__()) as res:
+        rgd = await ResponseGetData._from_aiohttp_response(res, auth_header=self.auth_header)
+
+    self.response_cache.invalidate(url)
 
+    rgd.upload_stats = gzip_stream.stats
+    return rgd
@@ -5,7 +5,192 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://jaewilson07.github.io',
                 'git_url': 'https://github.com/jaewilson07/nbdev_domo',
                 'lib_path': 'nbdev_domo'},
-  'syms': { 'nbdev_domo.DomoAccount': { 'nbdev_domo.DomoAccount.AccountConfig': ( 'domoaccount.html#accountconfig',
+  'syms': { 'nbdev_domo.Benchmarks': { 'nbdev_domo.Benchmarks.BenchmarkResult': ( 'benchmarks.html#benchmarkresult',
+                                                                                  'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.BenchmarkResult._from_durations': ( 'benchmarks.html#benchmarkresult._from_durations',
+                                                                                                  'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.BenchmarkResult.key': ( 'benchmarks.html#benchmarkresult.key',
+                                                                                      'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks._get_git_commit': ( 'benchmarks.html#_get_git_commit',
+                                                                                  'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks._time_repeat': ('benchmarks.html#_time_repeat', 'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.bench_dictdot': ('benchmarks.html#bench_dictdot', 'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.bench_get_from_id': ( 'benchmarks.html#bench_get_from_id',
+                                                                                    'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.bench_logger_add_log': ( 'benchmarks.html#bench_logger_add_log',
+                                                                                       'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.bench_response_parsing': ( 'benchmarks.html#bench_response_parsing',
+                                                                                         'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.bench_transport_throughput': ( 'benchmarks.html#bench_transport_throughput',
+                                                                                             'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.compare_benchmarks': ( 'benchmarks.html#compare_benchmarks',
+                                                                                     'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.domo_benchmarks': ( 'benchmarks.html#domo_benchmarks',
+                                                                                  'nbdev_domo/Benchmarks.py'),
+                                       'nbdev_domo.Benchmarks.run_benchmarks': ( 'benchmarks.html#run_benchmarks',
+                                                                                 'nbdev_domo/Benchmarks.py')},
+            'nbdev_domo.BulkExecutor': { 'nbdev_domo.BulkExecutor.BulkExecutor': ( 'bulkexecutor.html#bulkexecutor',
+                                                                                   'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkExecutor.__init__': ( 'bulkexecutor.html#bulkexecutor.__init__',
+                                                                                            'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkExecutor._run_one': ( 'bulkexecutor.html#bulkexecutor._run_one',
+                                                                                            'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkExecutor._to_coroutine': ( 'bulkexecutor.html#bulkexecutor._to_coroutine',
+                                                                                                 'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkExecutor.iter_results': ( 'bulkexecutor.html#bulkexecutor.iter_results',
+                                                                                                'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkExecutor.run': ( 'bulkexecutor.html#bulkexecutor.run',
+                                                                                       'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkResult': ( 'bulkexecutor.html#bulkresult',
+                                                                                 'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkResult.is_success': ( 'bulkexecutor.html#bulkresult.is_success',
+                                                                                            'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkSummary': ( 'bulkexecutor.html#bulksummary',
+                                                                                  'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkSummary._from_results': ( 'bulkexecutor.html#bulksummary._from_results',
+                                                                                                'nbdev_domo/BulkExecutor.py'),
+                                         'nbdev_domo.BulkExecutor.BulkSummary._percentile': ( 'bulkexecutor.html#bulksummary._percentile',
+                                                                                              'nbdev_domo/BulkExecutor.py')},
+            'nbdev_domo.Cassette': { 'nbdev_domo.Cassette.Cassette': ('cassette.html#cassette', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.__aenter__': ( 'cassette.html#cassette.__aenter__',
+                                                                                  'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.__aexit__': ( 'cassette.html#cassette.__aexit__',
+                                                                                 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.__enter__': ( 'cassette.html#cassette.__enter__',
+                                                                                 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.__exit__': ('cassette.html#cassette.__exit__', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.__init__': ('cassette.html#cassette.__init__', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.__len__': ('cassette.html#cassette.__len__', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette._get_delay': ( 'cassette.html#cassette._get_delay',
+                                                                                  'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette._open': ('cassette.html#cassette._open', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.close': ('cassette.html#cassette.close', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.get': ('cassette.html#cassette.get', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.is_recording': ( 'cassette.html#cassette.is_recording',
+                                                                                    'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.is_replaying': ( 'cassette.html#cassette.is_replaying',
+                                                                                    'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.load': ('cassette.html#cassette.load', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.record': ('cassette.html#cassette.record', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.replay': ('cassette.html#cassette.replay', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.Cassette.replay_async': ( 'cassette.html#cassette.replay_async',
+                                                                                    'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.CassetteEntry': ('cassette.html#cassetteentry', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.CassetteEntry.to_response': ( 'cassette.html#cassetteentry.to_response',
+                                                                                        'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.CassetteMissError': ('cassette.html#cassettemisserror', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.CassetteMissError.__init__': ( 'cassette.html#cassettemisserror.__init__',
+                                                                                         'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.get_cassette': ('cassette.html#get_cassette', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.make_cassette_key': ('cassette.html#make_cassette_key', 'nbdev_domo/Cassette.py'),
+                                     'nbdev_domo.Cassette.set_cassette': ('cassette.html#set_cassette', 'nbdev_domo/Cassette.py')},
+            'nbdev_domo.CircuitBreaker': { 'nbdev_domo.CircuitBreaker.CircuitBreaker': ( 'circuitbreaker.html#circuitbreaker',
+                                                                                         'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.__init__': ( 'circuitbreaker.html#circuitbreaker.__init__',
+                                                                                                  'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker._transition': ( 'circuitbreaker.html#circuitbreaker._transition',
+                                                                                                     'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.before_request': ( 'circuitbreaker.html#circuitbreaker.before_request',
+                                                                                                        'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.on_failure': ( 'circuitbreaker.html#circuitbreaker.on_failure',
+                                                                                                    'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.on_response': ( 'circuitbreaker.html#circuitbreaker.on_response',
+                                                                                                     'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.on_success': ( 'circuitbreaker.html#circuitbreaker.on_success',
+                                                                                                    'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.release': ( 'circuitbreaker.html#circuitbreaker.release',
+                                                                                                 'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreaker.state': ( 'circuitbreaker.html#circuitbreaker.state',
+                                                                                               'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreakerRegistry': ( 'circuitbreaker.html#circuitbreakerregistry',
+                                                                                                 'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreakerRegistry.__init__': ( 'circuitbreaker.html#circuitbreakerregistry.__init__',
+                                                                                                          'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreakerRegistry.configure': ( 'circuitbreaker.html#circuitbreakerregistry.configure',
+                                                                                                           'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreakerRegistry.get_breaker': ( 'circuitbreaker.html#circuitbreakerregistry.get_breaker',
+                                                                                                             'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitBreakerRegistry.states': ( 'circuitbreaker.html#circuitbreakerregistry.states',
+                                                                                                        'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitOpenError': ( 'circuitbreaker.html#circuitopenerror',
+                                                                                           'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitOpenError.__init__': ( 'circuitbreaker.html#circuitopenerror.__init__',
+                                                                                                    'nbdev_domo/CircuitBreaker.py'),
+                                           'nbdev_domo.CircuitBreaker.CircuitState': ( 'circuitbreaker.html#circuitstate',
+                                                                                       'nbdev_domo/CircuitBreaker.py')},
+            'nbdev_domo.Codec': { 'nbdev_domo.Codec.JsonCodec': ('codec.html#jsoncodec', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.JsonCodec.dumps': ('codec.html#jsoncodec.dumps', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.JsonCodec.loads': ('codec.html#jsoncodec.loads', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.MsgspecCodec': ('codec.html#msgspeccodec', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.MsgspecCodec.__init__': ('codec.html#msgspeccodec.__init__', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.MsgspecCodec.loads': ('codec.html#msgspeccodec.loads', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.OrjsonCodec': ('codec.html#orjsoncodec', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.OrjsonCodec.__init__': ('codec.html#orjsoncodec.__init__', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.OrjsonCodec.dumps': ('codec.html#orjsoncodec.dumps', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.OrjsonCodec.loads': ('codec.html#orjsoncodec.loads', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec._orjson_differs': ('codec.html#_orjson_differs', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.benchmark_codecs': ('codec.html#benchmark_codecs', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.get_available_codecs': ('codec.html#get_available_codecs', 'nbdev_domo/Codec.py'),
+                                  'nbdev_domo.Codec.set_codec': ('codec.html#set_codec', 'nbdev_domo/Codec.py')},
+            'nbdev_domo.CsvMaterializer': { 'nbdev_domo.CsvMaterializer.CsvMaterializer': ( 'csvmaterializer.html#csvmaterializer',
+                                                                                            'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer.__init__': ( 'csvmaterializer.html#csvmaterializer.__init__',
+                                                                                                     'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer._empty_block': ( 'csvmaterializer.html#csvmaterializer._empty_block',
+                                                                                                         'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer._parse_block': ( 'csvmaterializer.html#csvmaterializer._parse_block',
+                                                                                                         'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer._read_header': ( 'csvmaterializer.html#csvmaterializer._read_header',
+                                                                                                         'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer.close': ( 'csvmaterializer.html#csvmaterializer.close',
+                                                                                                  'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer.feed': ( 'csvmaterializer.html#csvmaterializer.feed',
+                                                                                                 'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer.CsvMaterializer.to_frame': ( 'csvmaterializer.html#csvmaterializer.to_frame',
+                                                                                                     'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer._arrow_type': ( 'csvmaterializer.html#_arrow_type',
+                                                                                        'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer._find_record_end': ( 'csvmaterializer.html#_find_record_end',
+                                                                                             'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer._is_date_hint': ( 'csvmaterializer.html#_is_date_hint',
+                                                                                          'nbdev_domo/CsvMaterializer.py'),
+                                            'nbdev_domo.CsvMaterializer._pandas_dtype': ( 'csvmaterializer.html#_pandas_dtype',
+                                                                                          'nbdev_domo/CsvMaterializer.py')},
+            'nbdev_domo.DebugSink': { 'nbdev_domo.DebugSink.DebugEvent': ('debugsink.html#debugevent', 'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugEvent.format': ( 'debugsink.html#debugevent.format',
+                                                                                  'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugEvent.to_dict': ( 'debugsink.html#debugevent.to_dict',
+                                                                                   'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugTracer': ('debugsink.html#debugtracer', 'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugTracer.__init__': ( 'debugsink.html#debugtracer.__init__',
+                                                                                     'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugTracer.add_sink': ( 'debugsink.html#debugtracer.add_sink',
+                                                                                     'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugTracer.emit': ( 'debugsink.html#debugtracer.emit',
+                                                                                 'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugTracer.is_active': ( 'debugsink.html#debugtracer.is_active',
+                                                                                      'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.DebugTracer.remove_sink': ( 'debugsink.html#debugtracer.remove_sink',
+                                                                                        'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink._format_body': ('debugsink.html#_format_body', 'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink._truncate': ('debugsink.html#_truncate', 'nbdev_domo/DebugSink.py'),
+                                      'nbdev_domo.DebugSink.print_sink': ('debugsink.html#print_sink', 'nbdev_domo/DebugSink.py')},
+            'nbdev_domo.DecodePool': { 'nbdev_domo.DecodePool.DecodePool': ('decodepool.html#decodepool', 'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodePool.__init__': ( 'decodepool.html#decodepool.__init__',
+                                                                                      'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodePool._get_executor': ( 'decodepool.html#decodepool._get_executor',
+                                                                                           'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodePool.run': ( 'decodepool.html#decodepool.run',
+                                                                                 'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodePool.should_offload': ( 'decodepool.html#decodepool.should_offload',
+                                                                                            'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodePool.shutdown': ( 'decodepool.html#decodepool.shutdown',
+                                                                                      'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodeStats': ('decodepool.html#decodestats', 'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool.DecodeStats.to_dict': ( 'decodepool.html#decodestats.to_dict',
+                                                                                      'nbdev_domo/DecodePool.py'),
+                                       'nbdev_domo.DecodePool._timed_call': ('decodepool.html#_timed_call', 'nbdev_domo/DecodePool.py')},
+            'nbdev_domo.DomoAccount': { 'nbdev_domo.DomoAccount.AccountConfig': ( 'domoaccount.html#accountconfig',
                                                                                   'nbdev_domo/DomoAccount.py'),
                                         'nbdev_domo.DomoAccount.DeleteAccountError': ( 'domoaccount.html#deleteaccounterror',
                                                                                        'nbdev_domo/DomoAccount.py'),
@@ -74,6 +259,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'nbdev_domo/DomoAccount.py'),
                                         'nbdev_domo.DomoAccount.get_accounts': ( 'domoaccount.html#get_accounts',
                                                                                  'nbdev_domo/DomoAccount.py'),
+                                        'nbdev_domo.DomoAccount.iter_accounts': ( 'domoaccount.html#iter_accounts',
+                                                                                  'nbdev_domo/DomoAccount.py'),
+                                        'nbdev_domo.DomoAccount.stream_accounts': ( 'domoaccount.html#stream_accounts',
+                                                                                    'nbdev_domo/DomoAccount.py'),
                                         'nbdev_domo.DomoAccount.update_account_config': ( 'domoaccount.html#update_account_config',
                                                                                           'nbdev_domo/DomoAccount.py'),
                                         'nbdev_domo.DomoAccount.update_account_name': ( 'domoaccount.html#update_account_name',
@@ -82,6 +271,8 @@ d = { 'settings': { 'branch': 'main',
                                      'nbdev_domo.DomoAuth.DomoDeveloperAuth': ('domoauth.html#domodeveloperauth', 'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoDeveloperAuth.__init__': ( 'domoauth.html#domodeveloperauth.__init__',
                                                                                          'nbdev_domo/DomoAuth.py'),
+                                     'nbdev_domo.DomoAuth.DomoDeveloperAuth._fetch_auth_token': ( 'domoauth.html#domodeveloperauth._fetch_auth_token',
+                                                                                                  'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoDeveloperAuth.generate_auth_header': ( 'domoauth.html#domodeveloperauth.generate_auth_header',
                                                                                                      'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoDeveloperAuth.get_auth_token': ( 'domoauth.html#domodeveloperauth.get_auth_token',
@@ -92,6 +283,8 @@ d = { 'settings': { 'branch': 'main',
                                      'nbdev_domo.DomoAuth.DomoFullAuth': ('domoauth.html#domofullauth', 'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoFullAuth.__post_init__': ( 'domoauth.html#domofullauth.__post_init__',
                                                                                          'nbdev_domo/DomoAuth.py'),
+                                     'nbdev_domo.DomoAuth.DomoFullAuth._fetch_auth_token': ( 'domoauth.html#domofullauth._fetch_auth_token',
+                                                                                             'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoFullAuth.generate_auth_header': ( 'domoauth.html#domofullauth.generate_auth_header',
                                                                                                 'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoFullAuth.get_auth_token': ( 'domoauth.html#domofullauth.get_auth_token',
@@ -99,6 +292,8 @@ d = { 'settings': { 'branch': 'main',
                                      'nbdev_domo.DomoAuth.DomoTokenAuth': ('domoauth.html#domotokenauth', 'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoTokenAuth.__post_init__': ( 'domoauth.html#domotokenauth.__post_init__',
                                                                                           'nbdev_domo/DomoAuth.py'),
+                                     'nbdev_domo.DomoAuth.DomoTokenAuth._fetch_auth_token': ( 'domoauth.html#domotokenauth._fetch_auth_token',
+                                                                                              'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoTokenAuth.generate_auth_header': ( 'domoauth.html#domotokenauth.generate_auth_header',
                                                                                                  'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth.DomoTokenAuth.get_auth_token': ( 'domoauth.html#domotokenauth.get_auth_token',
@@ -113,10 +308,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                             'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth._DomoAuth_Optional': ( 'domoauth.html#_domoauth_optional',
                                                                                  'nbdev_domo/DomoAuth.py'),
+                                     'nbdev_domo.DomoAuth._DomoAuth_Optional._get_cached_token': ( 'domoauth.html#_domoauth_optional._get_cached_token',
+                                                                                                   'nbdev_domo/DomoAuth.py'),
+                                     'nbdev_domo.DomoAuth._DomoAuth_Optional._get_token_cache': ( 'domoauth.html#_domoauth_optional._get_token_cache',
+                                                                                                  'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth._DomoAuth_Optional.generate_auth_header': ( 'domoauth.html#_domoauth_optional.generate_auth_header',
                                                                                                       'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth._DomoAuth_Optional.get_auth_token': ( 'domoauth.html#_domoauth_optional.get_auth_token',
                                                                                                 'nbdev_domo/DomoAuth.py'),
+                                     'nbdev_domo.DomoAuth._DomoAuth_Optional.is_token_expired': ( 'domoauth.html#_domoauth_optional.is_token_expired',
+                                                                                                  'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth._DomoAuth_Required': ( 'domoauth.html#_domoauth_required',
                                                                                  'nbdev_domo/DomoAuth.py'),
                                      'nbdev_domo.DomoAuth._DomoAuth_Required.__post_init__': ( 'domoauth.html#_domoauth_required.__post_init__',
@@ -147,17 +348,312 @@ d = { 'settings': { 'branch': 'main',
                                    'nbdev_domo.Logger.Logger.log_warning': ('logger.html#logger.log_warning', 'nbdev_domo/Logger.py'),
                                    'nbdev_domo.Logger.Logger.output_log': ('logger.html#logger.output_log', 'nbdev_domo/Logger.py'),
                                    'nbdev_domo.Logger.TracebackDetails': ('logger.html#tracebackdetails', 'nbdev_domo/Logger.py')},
+            'nbdev_domo.Metrics': { 'nbdev_domo.Metrics.Histogram': ('metrics.html#histogram', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.Histogram.__post_init__': ( 'metrics.html#histogram.__post_init__',
+                                                                                    'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.Histogram.get_cumulative_counts': ( 'metrics.html#histogram.get_cumulative_counts',
+                                                                                            'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.Histogram.observe': ('metrics.html#histogram.observe', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricFamily': ('metrics.html#metricfamily', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricFamily.__init__': ( 'metrics.html#metricfamily.__init__',
+                                                                                  'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricFamily.observe': ( 'metrics.html#metricfamily.observe',
+                                                                                 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricFamily.reset': ('metrics.html#metricfamily.reset', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricFamily.snapshot': ( 'metrics.html#metricfamily.snapshot',
+                                                                                  'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricFamily.to_prometheus': ( 'metrics.html#metricfamily.to_prometheus',
+                                                                                       'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry': ('metrics.html#metricsregistry', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.__init__': ( 'metrics.html#metricsregistry.__init__',
+                                                                                     'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.families': ( 'metrics.html#metricsregistry.families',
+                                                                                     'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.record_request': ( 'metrics.html#metricsregistry.record_request',
+                                                                                           'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.record_route_call': ( 'metrics.html#metricsregistry.record_route_call',
+                                                                                              'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.reset': ( 'metrics.html#metricsregistry.reset',
+                                                                                  'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.snapshot': ( 'metrics.html#metricsregistry.snapshot',
+                                                                                     'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.MetricsRegistry.to_prometheus': ( 'metrics.html#metricsregistry.to_prometheus',
+                                                                                          'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics._escape_label_value': ('metrics.html#_escape_label_value', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics._get_route_labels': ('metrics.html#_get_route_labels', 'nbdev_domo/Metrics.py'),
+                                    'nbdev_domo.Metrics.track_route': ('metrics.html#track_route', 'nbdev_domo/Metrics.py')},
+            'nbdev_domo.MockServer': { 'nbdev_domo.MockServer.MockDomoServer': ( 'mockserver.html#mockdomoserver',
+                                                                                 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.__aenter__': ( 'mockserver.html#mockdomoserver.__aenter__',
+                                                                                            'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.__aexit__': ( 'mockserver.html#mockdomoserver.__aexit__',
+                                                                                           'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.__init__': ( 'mockserver.html#mockdomoserver.__init__',
+                                                                                          'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._authenticate': ( 'mockserver.html#mockdomoserver._authenticate',
+                                                                                               'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._create_account': ( 'mockserver.html#mockdomoserver._create_account',
+                                                                                                 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._delete_account': ( 'mockserver.html#mockdomoserver._delete_account',
+                                                                                                 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._get_account': ( 'mockserver.html#mockdomoserver._get_account',
+                                                                                              'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._get_account_config': ( 'mockserver.html#mockdomoserver._get_account_config',
+                                                                                                     'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._get_account_id': ( 'mockserver.html#mockdomoserver._get_account_id',
+                                                                                                 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._get_accounts': ( 'mockserver.html#mockdomoserver._get_accounts',
+                                                                                               'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._get_me': ( 'mockserver.html#mockdomoserver._get_me',
+                                                                                         'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._get_oauth_token': ( 'mockserver.html#mockdomoserver._get_oauth_token',
+                                                                                                  'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._inject_faults': ( 'mockserver.html#mockdomoserver._inject_faults',
+                                                                                                'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._is_authorized': ( 'mockserver.html#mockdomoserver._is_authorized',
+                                                                                                'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._update_account_config': ( 'mockserver.html#mockdomoserver._update_account_config',
+                                                                                                        'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer._update_account_name': ( 'mockserver.html#mockdomoserver._update_account_name',
+                                                                                                      'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.app': ( 'mockserver.html#mockdomoserver.app',
+                                                                                     'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.base_url': ( 'mockserver.html#mockdomoserver.base_url',
+                                                                                          'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.close': ( 'mockserver.html#mockdomoserver.close',
+                                                                                       'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.start': ( 'mockserver.html#mockdomoserver.start',
+                                                                                       'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockDomoServer.stats': ( 'mockserver.html#mockdomoserver.stats',
+                                                                                       'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.MockServerConfig': ( 'mockserver.html#mockserverconfig',
+                                                                                   'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer._error_response': ( 'mockserver.html#_error_response',
+                                                                                  'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer._json_response': ( 'mockserver.html#_json_response',
+                                                                                 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer._make_account': ('mockserver.html#_make_account', 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer._make_account_config': ( 'mockserver.html#_make_account_config',
+                                                                                       'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer._make_dataset': ('mockserver.html#_make_dataset', 'nbdev_domo/MockServer.py'),
+                                       'nbdev_domo.MockServer.mock_domo_server': ( 'mockserver.html#mock_domo_server',
+                                                                                   'nbdev_domo/MockServer.py')},
+            'nbdev_domo.Paginator': { 'nbdev_domo.Paginator.PaginationError': ('paginator.html#paginationerror', 'nbdev_domo/Paginator.py'),
+                                      'nbdev_domo.Paginator.PaginationError.__init__': ( 'paginator.html#paginationerror.__init__',
+                                                                                         'nbdev_domo/Paginator.py'),
+                                      'nbdev_domo.Paginator._get_items_default': ( 'paginator.html#_get_items_default',
+                                                                                   'nbdev_domo/Paginator.py'),
+                                      'nbdev_domo.Paginator.paginate': ('paginator.html#paginate', 'nbdev_domo/Paginator.py')},
+            'nbdev_domo.RateLimiter': { 'nbdev_domo.RateLimiter.RateLimiterRegistry': ( 'ratelimiter.html#ratelimiterregistry',
+                                                                                        'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.RateLimiterRegistry.__init__': ( 'ratelimiter.html#ratelimiterregistry.__init__',
+                                                                                                 'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.RateLimiterRegistry.configure': ( 'ratelimiter.html#ratelimiterregistry.configure',
+                                                                                                  'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.RateLimiterRegistry.get_limiter': ( 'ratelimiter.html#ratelimiterregistry.get_limiter',
+                                                                                                    'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.TokenBucket': ('ratelimiter.html#tokenbucket', 'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.TokenBucket.__init__': ( 'ratelimiter.html#tokenbucket.__init__',
+                                                                                         'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.TokenBucket._get_waiters': ( 'ratelimiter.html#tokenbucket._get_waiters',
+                                                                                             'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.TokenBucket._refill': ( 'ratelimiter.html#tokenbucket._refill',
+                                                                                        'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.TokenBucket.acquire': ( 'ratelimiter.html#tokenbucket.acquire',
+                                                                                        'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter.TokenBucket.on_response': ( 'ratelimiter.html#tokenbucket.on_response',
+                                                                                            'nbdev_domo/RateLimiter.py'),
+                                        'nbdev_domo.RateLimiter._Waiter': ('ratelimiter.html#_waiter', 'nbdev_domo/RateLimiter.py')},
+            'nbdev_domo.ResponseCache': { 'nbdev_domo.ResponseCache.CacheEntry': ( 'responsecache.html#cacheentry',
+                                                                                   'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.CacheEntry.get_conditional_headers': ( 'responsecache.html#cacheentry.get_conditional_headers',
+                                                                                                           'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.CacheEntry.is_fresh': ( 'responsecache.html#cacheentry.is_fresh',
+                                                                                            'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.CacheEntry.is_revalidatable': ( 'responsecache.html#cacheentry.is_revalidatable',
+                                                                                                    'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache': ( 'responsecache.html#responsecache',
+                                                                                      'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.__init__': ( 'responsecache.html#responsecache.__init__',
+                                                                                               'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache._estimate_size': ( 'responsecache.html#responsecache._estimate_size',
+                                                                                                     'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache._get_path': ( 'responsecache.html#responsecache._get_path',
+                                                                                                'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache._remove': ( 'responsecache.html#responsecache._remove',
+                                                                                              'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.clear': ( 'responsecache.html#responsecache.clear',
+                                                                                            'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.get': ( 'responsecache.html#responsecache.get',
+                                                                                          'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.get_ttl': ( 'responsecache.html#responsecache.get_ttl',
+                                                                                              'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.invalidate': ( 'responsecache.html#responsecache.invalidate',
+                                                                                                 'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.revalidate': ( 'responsecache.html#responsecache.revalidate',
+                                                                                                 'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.set': ( 'responsecache.html#responsecache.set',
+                                                                                          'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.set_route_ttl': ( 'responsecache.html#responsecache.set_route_ttl',
+                                                                                                    'nbdev_domo/ResponseCache.py'),
+                                          'nbdev_domo.ResponseCache.ResponseCache.stats': ( 'responsecache.html#responsecache.stats',
+                                                                                            'nbdev_domo/ResponseCache.py')},
             'nbdev_domo.ResponseGetData': { 'nbdev_domo.ResponseGetData.ResponseGetData': ( 'responsegetdata.html#responsegetdata',
                                                                                             'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData.ResponseGetData._decode_async': ( 'responsegetdata.html#responsegetdata._decode_async',
+                                                                                                          'nbdev_domo/ResponseGetData.py'),
                                             'nbdev_domo.ResponseGetData.ResponseGetData._from_aiohttp_response': ( 'responsegetdata.html#responsegetdata._from_aiohttp_response',
                                                                                                                    'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData.ResponseGetData._from_body': ( 'responsegetdata.html#responsegetdata._from_body',
+                                                                                                       'nbdev_domo/ResponseGetData.py'),
                                             'nbdev_domo.ResponseGetData.ResponseGetData._from_requests_response': ( 'responsegetdata.html#responsegetdata._from_requests_response',
-                                                                                                                    'nbdev_domo/ResponseGetData.py')},
-            'nbdev_domo.Transport': { 'nbdev_domo.Transport.HTTPMethod': ('transport.html#httpmethod', 'nbdev_domo/Transport.py'),
+                                                                                                                    'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData.ResponseGetData.is_decoded': ( 'responsegetdata.html#responsegetdata.is_decoded',
+                                                                                                       'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData._add_slots': ( 'responsegetdata.html#_add_slots',
+                                                                                       'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData._decode_body': ( 'responsegetdata.html#_decode_body',
+                                                                                         'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData._get_response': ( 'responsegetdata.html#_get_response',
+                                                                                          'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData._select_headers': ( 'responsegetdata.html#_select_headers',
+                                                                                            'nbdev_domo/ResponseGetData.py'),
+                                            'nbdev_domo.ResponseGetData._set_response': ( 'responsegetdata.html#_set_response',
+                                                                                          'nbdev_domo/ResponseGetData.py')},
+            'nbdev_domo.Session': { 'nbdev_domo.Session.PoolConfig': ('session.html#poolconfig', 'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.PoolConfig._to_connector': ( 'session.html#poolconfig._to_connector',
+                                                                                     'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry': ('session.html#sessionregistry', 'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry.__aenter__': ( 'session.html#sessionregistry.__aenter__',
+                                                                                       'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry.__aexit__': ( 'session.html#sessionregistry.__aexit__',
+                                                                                      'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry.__init__': ( 'session.html#sessionregistry.__init__',
+                                                                                     'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry._close_at_exit': ( 'session.html#sessionregistry._close_at_exit',
+                                                                                           'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry._close_on_loop_shutdown': ( 'session.html#sessionregistry._close_on_loop_shutdown',
+                                                                                                    'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry.close': ( 'session.html#sessionregistry.close',
+                                                                                  'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry.configure': ( 'session.html#sessionregistry.configure',
+                                                                                      'nbdev_domo/Session.py'),
+                                    'nbdev_domo.Session.SessionRegistry.get_session': ( 'session.html#sessionregistry.get_session',
+                                                                                        'nbdev_domo/Session.py')},
+            'nbdev_domo.TokenCache': { 'nbdev_domo.TokenCache.CachedToken': ('tokencache.html#cachedtoken', 'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.CachedToken.expires_in': ( 'tokencache.html#cachedtoken.expires_in',
+                                                                                         'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.CachedToken.is_expired': ( 'tokencache.html#cachedtoken.is_expired',
+                                                                                         'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache': ('tokencache.html#tokencache', 'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.__init__': ( 'tokencache.html#tokencache.__init__',
+                                                                                      'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache._discard': ( 'tokencache.html#tokencache._discard',
+                                                                                      'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache._fetch': ( 'tokencache.html#tokencache._fetch',
+                                                                                    'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache._fetch_and_set': ( 'tokencache.html#tokencache._fetch_and_set',
+                                                                                            'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.clear': ( 'tokencache.html#tokencache.clear',
+                                                                                   'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.get': ( 'tokencache.html#tokencache.get',
+                                                                                 'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.get_or_fetch': ( 'tokencache.html#tokencache.get_or_fetch',
+                                                                                          'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.invalidate': ( 'tokencache.html#tokencache.invalidate',
+                                                                                        'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.set': ( 'tokencache.html#tokencache.set',
+                                                                                 'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache.TokenCache.stats': ( 'tokencache.html#tokencache.stats',
+                                                                                   'nbdev_domo/TokenCache.py'),
+                                       'nbdev_domo.TokenCache._fingerprint': ('tokencache.html#_fingerprint', 'nbdev_domo/TokenCache.py')},
+            'nbdev_domo.Tracing': { 'nbdev_domo.Tracing.RequestTiming': ('tracing.html#requesttiming', 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTiming._finish': ( 'tracing.html#requesttiming._finish',
+                                                                                  'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTiming._mark_response': ( 'tracing.html#requesttiming._mark_response',
+                                                                                         'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTiming._start': ( 'tracing.html#requesttiming._start',
+                                                                                 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTiming.to_dict': ( 'tracing.html#requesttiming.to_dict',
+                                                                                  'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer': ('tracing.html#requesttracer', 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.__init__': ( 'tracing.html#requesttracer.__init__',
+                                                                                   'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.add_callback': ( 'tracing.html#requesttracer.add_callback',
+                                                                                       'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.disable': ( 'tracing.html#requesttracer.disable',
+                                                                                  'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.enable': ( 'tracing.html#requesttracer.enable',
+                                                                                 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.export': ( 'tracing.html#requesttracer.export',
+                                                                                 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.remove_callback': ( 'tracing.html#requesttracer.remove_callback',
+                                                                                          'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.start_timing': ( 'tracing.html#requesttracer.start_timing',
+                                                                                       'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing.RequestTracer.trace_config': ( 'tracing.html#requesttracer.trace_config',
+                                                                                       'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._get_timing': ('tracing.html#_get_timing', 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_connection_create_end': ( 'tracing.html#_on_connection_create_end',
+                                                                                      'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_connection_create_start': ( 'tracing.html#_on_connection_create_start',
+                                                                                        'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_connection_queued_end': ( 'tracing.html#_on_connection_queued_end',
+                                                                                      'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_connection_queued_start': ( 'tracing.html#_on_connection_queued_start',
+                                                                                        'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_connection_reuseconn': ( 'tracing.html#_on_connection_reuseconn',
+                                                                                     'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_dns_cache_hit': ('tracing.html#_on_dns_cache_hit', 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_dns_resolvehost_end': ( 'tracing.html#_on_dns_resolvehost_end',
+                                                                                    'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_dns_resolvehost_start': ( 'tracing.html#_on_dns_resolvehost_start',
+                                                                                      'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_request_chunk_sent': ( 'tracing.html#_on_request_chunk_sent',
+                                                                                   'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_request_end': ('tracing.html#_on_request_end', 'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_request_headers_sent': ( 'tracing.html#_on_request_headers_sent',
+                                                                                     'nbdev_domo/Tracing.py'),
+                                    'nbdev_domo.Tracing._on_response_chunk_received': ( 'tracing.html#_on_response_chunk_received',
+                                                                                        'nbdev_domo/Tracing.py')},
+            'nbdev_domo.Transport': { 'nbdev_domo.Transport.CachePolicy': ('transport.html#cachepolicy', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream': ('transport.html#gzipcsvstream', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream.__aiter__': ( 'transport.html#gzipcsvstream.__aiter__',
+                                                                                        'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream.__init__': ( 'transport.html#gzipcsvstream.__init__',
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream._compress': ( 'transport.html#gzipcsvstream._compress',
+                                                                                        'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream._encode_row': ( 'transport.html#gzipcsvstream._encode_row',
+                                                                                          'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream._iter_blocks': ( 'transport.html#gzipcsvstream._iter_blocks',
+                                                                                           'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream._iter_file': ( 'transport.html#gzipcsvstream._iter_file',
+                                                                                         'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.GzipCsvStream.stats': ( 'transport.html#gzipcsvstream.stats',
+                                                                                    'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.HTTPMethod': ('transport.html#httpmethod', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestCoalescer': ( 'transport.html#requestcoalescer',
+                                                                                 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestCoalescer.__init__': ( 'transport.html#requestcoalescer.__init__',
+                                                                                          'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestCoalescer._discard': ( 'transport.html#requestcoalescer._discard',
+                                                                                          'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestCoalescer.run': ( 'transport.html#requestcoalescer.run',
+                                                                                     'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestCoalescer.stats': ( 'transport.html#requestcoalescer.stats',
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestOptions': ('transport.html#requestoptions', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestOptions.replace': ( 'transport.html#requestoptions.replace',
+                                                                                       'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.RequestTransport': ( 'transport.html#requesttransport',
                                                                                  'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.RequestTransport.__init__': ( 'transport.html#requesttransport.__init__',
                                                                                           'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestTransport._cache_lookup': ( 'transport.html#requesttransport._cache_lookup',
+                                                                                               'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RequestTransport._cache_store': ( 'transport.html#requesttransport._cache_store',
+                                                                                              'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.RequestTransport._headers_default_receive_json': ( 'transport.html#requesttransport._headers_default_receive_json',
                                                                                                                'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.RequestTransport._headers_receive_csv': ( 'transport.html#requesttransport._headers_receive_csv',
@@ -194,16 +690,90 @@ d = { 'settings': { 'branch': 'main',
                                                                                           'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.RequestTransport.put_text': ( 'transport.html#requesttransport.put_text',
                                                                                           'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RetryPolicy': ('transport.html#retrypolicy', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RetryPolicy._can_retry': ( 'transport.html#retrypolicy._can_retry',
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RetryPolicy._parse_retry_after': ( 'transport.html#retrypolicy._parse_retry_after',
+                                                                                               'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RetryPolicy.get_delay': ( 'transport.html#retrypolicy.get_delay',
+                                                                                      'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RetryPolicy.should_retry_exception': ( 'transport.html#retrypolicy.should_retry_exception',
+                                                                                                   'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.RetryPolicy.should_retry_status': ( 'transport.html#retrypolicy.should_retry_status',
+                                                                                                'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.TransportAsync': ('transport.html#transportasync', 'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.TransportAsync.__init__': ( 'transport.html#transportasync.__init__',
                                                                                         'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync._open_stream': ( 'transport.html#transportasync._open_stream',
+                                                                                            'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.TransportAsync._request': ( 'transport.html#transportasync._request',
                                                                                         'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync._send': ( 'transport.html#transportasync._send',
+                                                                                     'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync.download_csv': ( 'transport.html#transportasync.download_csv',
+                                                                                            'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync.get_csv_frame': ( 'transport.html#transportasync.get_csv_frame',
+                                                                                             'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync.get_csv_stream': ( 'transport.html#transportasync.get_csv_stream',
+                                                                                              'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync.get_json_stream': ( 'transport.html#transportasync.get_json_stream',
+                                                                                               'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportAsync.put_gzip_stream': ( 'transport.html#transportasync.put_gzip_stream',
+                                                                                               'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.TransportSync': ('transport.html#transportsync', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.__enter__': ( 'transport.html#transportsync.__enter__',
+                                                                                        'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.__exit__': ( 'transport.html#transportsync.__exit__',
+                                                                                       'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.TransportSync.__init__': ( 'transport.html#transportsync.__init__',
                                                                                        'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync._open_stream': ( 'transport.html#transportsync._open_stream',
+                                                                                           'nbdev_domo/Transport.py'),
                                       'nbdev_domo.Transport.TransportSync._request': ( 'transport.html#transportsync._request',
-                                                                                       'nbdev_domo/Transport.py')},
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.close': ( 'transport.html#transportsync.close',
+                                                                                    'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.download_csv': ( 'transport.html#transportsync.download_csv',
+                                                                                           'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.get_csv_frame': ( 'transport.html#transportsync.get_csv_frame',
+                                                                                            'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.get_csv_stream': ( 'transport.html#transportsync.get_csv_stream',
+                                                                                             'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.get_json_stream': ( 'transport.html#transportsync.get_json_stream',
+                                                                                              'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport.TransportSync.session': ( 'transport.html#transportsync.session',
+                                                                                      'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._CsvRowParser': ('transport.html#_csvrowparser', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._CsvRowParser.__init__': ( 'transport.html#_csvrowparser.__init__',
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._CsvRowParser._split_complete_records': ( 'transport.html#_csvrowparser._split_complete_records',
+                                                                                                      'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._CsvRowParser.close': ( 'transport.html#_csvrowparser.close',
+                                                                                    'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._CsvRowParser.feed': ( 'transport.html#_csvrowparser.feed',
+                                                                                   'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._JsonArrayParser': ( 'transport.html#_jsonarrayparser',
+                                                                                 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._JsonArrayParser.__init__': ( 'transport.html#_jsonarrayparser.__init__',
+                                                                                          'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._JsonArrayParser._parse': ( 'transport.html#_jsonarrayparser._parse',
+                                                                                        'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._JsonArrayParser._scan': ( 'transport.html#_jsonarrayparser._scan',
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._JsonArrayParser.close': ( 'transport.html#_jsonarrayparser.close',
+                                                                                       'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._JsonArrayParser.feed': ( 'transport.html#_jsonarrayparser.feed',
+                                                                                      'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._UploadCancelled': ( 'transport.html#_uploadcancelled',
+                                                                                 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._is_2xx': ('transport.html#_is_2xx', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._iter_chunks': ('transport.html#_iter_chunks', 'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._iter_chunks_async': ( 'transport.html#_iter_chunks_async',
+                                                                                   'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._make_request_key': ( 'transport.html#_make_request_key',
+                                                                                  'nbdev_domo/Transport.py'),
+                                      'nbdev_domo.Transport._resolve_options': ( 'transport.html#_resolve_options',
+                                                                                 'nbdev_domo/Transport.py')},
             'nbdev_domo.utils': { 'nbdev_domo.utils.DictDot': ('utils.html#dictdot', 'nbdev_domo/utils.py'),
                                   'nbdev_domo.utils.DictDot.__getattr__': ('utils.html#dictdot.__getattr__', 'nbdev_domo/utils.py'),
                                   'nbdev_domo.utils.DictDot.__init__': ('utils.html#dictdot.__init__', 'nbdev_domo/utils.py'),
@@ -211,5 +781,10 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'nbdev_domo/utils.py'),
                                   'nbdev_domo.utils.convert_epoch_millisecond_to_datetime': ( 'utils.html#convert_epoch_millisecond_to_datetime',
                                                                                               'nbdev_domo/utils.py'),
-                                  'nbdev_domo.utils.convert_snake_to_pascal': ( 'utils.html#convert_snake_to_pascal',
-                                                                                'nbdev_domo/utils.py')}}}
+                                  'nbdev_domo.utils.convert_snake_to_pascal': ('utils.html#convert_snake_to_pascal', 'nbdev_domo/utils.py'),
+                                  'nbdev_domo.utils.convert_url_to_host': ('utils.html#convert_url_to_host', 'nbdev_domo/utils.py'),
+                                  'nbdev_domo.utils.get_base_url': ('utils.html#get_base_url', 'nbdev_domo/utils.py'),
+                                  'nbdev_domo.utils.redact': ('utils.html#redact', 'nbdev_domo/utils.py'),
+                                  'nbdev_domo.utils.redact_body': ('utils.html#redact_body', 'nbdev_domo/utils.py'),
+                                  'nbdev_domo.utils.redact_headers': ('utils.html#redact_headers', 'nbdev_domo/utils.py'),
+                                  'nbdev_domo.utils.set_base_url': ('utils.html#set_base_url', 'nbdev_domo/utils.py')}}}
@@ -1,10 +1,17 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/99_Utils.ipynb.
 
 # %% auto 0
-__all__ = ['DictDot', 'convert_epoch_millisecond_to_datetime', 'convert_datetime_to_epoch_millisecond', 'convert_snake_to_pascal']
+__all__ = ['DOMO_BASE_URL_ENV', 'REDACTED', 'REDACTED_HEADERS', 'REDACTED_KEYS', 'DictDot',
+           'convert_epoch_millisecond_to_datetime', 'convert_datetime_to_epoch_millisecond', 'convert_snake_to_pascal',
+           'convert_url_to_host', 'get_base_url', 'set_base_url', 'redact', 'redact_body', 'redact_headers']
 
 # %% ../nbs/99_Utils.ipynb 3
+import os
 import datetime as dt
+from typing import Optional, Union, Any, FrozenSet
+from urllib.parse import urlparse
+
+import nbdev_domo.Codec as cd
 
 # %% ../nbs/99_Utils.ipynb 4
 from types import SimpleNamespace
@@ -54,3 +61,81 @@ def convert_snake_to_pascal(str):
     clean_str = str.replace("_", " ").title().replace(" ", "")
     return clean_str[0].lower()+clean_str[1:]
 
+
+# %% ../nbs/99_Utils.ipynb 13
+def convert_url_to_host(url: str) -> str:
+    '''returns the host portion of a url, or the value itself if it is already a host'''
+    return urlparse(url).netloc or url
+
+# %% ../nbs/99_Utils.ipynb 16
+DOMO_BASE_URL_ENV = 'DOMO_BASE_URL'
+
+_base_url_override = os.environ.get(DOMO_BASE_URL_ENV) or None
+
+
+def get_base_url(domo_instance: Optional[str] = None  # None for the developer apis hosted on api.domo.com
+                 ) -> str:
+    '''returns the scheme and host routes send requests to'''
+
+    if _base_url_override:
+        return _base_url_override.format(domo_instance=domo_instance or 'api').rstrip('/')
+
+    return f"https://{domo_instance or 'api'}.domo.com"
+
+
+def set_base_url(base_url: Optional[str] = None  # e.g. http://127.0.0.1:8080, None restores https://<domo_instance>.domo.com
+                 ) -> Optional[str]:
+    '''points every route at base_url, returns the previous override'''
+
+    global _base_url_override
+
+    previous_base_url = _base_url_override
+    _base_url_override = base_url
+
+    return previous_base_url
+
+# %% ../nbs/99_Utils.ipynb 19
+REDACTED = 'REDACTED'
+
+REDACTED_HEADERS = frozenset(['authorization', 'x-domo-authentication', 'x-domo-developer-token', 'cookie'])
+
+REDACTED_KEYS = frozenset(['password', 'sessionToken', 'access_token', 'refresh_token', 'client_secret', 'apikey',
+                           'awsSecretKey'])
+
+
+def redact(obj: Any, redacted_keys: FrozenSet[str] = REDACTED_KEYS) -> Any:
+    '''copy of a json-like obj with the values of redacted_keys replaced'''
+
+    if isinstance(obj, dict):
+        return {key: REDACTED if key in redacted_keys else redact(value, redacted_keys) for key, value in obj.items()}
+
+    if isinstance(obj, list):
+        return [redact(value, redacted_keys) for value in obj]
+
+    return obj
+
+
+def redact_body(body: Union[str, bytes, None], redacted_keys: FrozenSet[str] = REDACTED_KEYS) -> Optional[str]:
+    '''request bodies arrive serialized, json bodies are redacted and other bodies are kept as text'''
+
+    if body is None:
+        return None
+
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+
+    try:
+        return cd.codec.dumps(redact(cd.codec.loads(body), redacted_keys))
+
+    # not json
+    except Exception:
+        return body
+
+
+def redact_headers(headers: Optional[dict], redacted_headers: FrozenSet[str] = REDACTED_HEADERS) -> Optional[dict]:
+    '''copy of headers with the values of redacted_headers (lower case names) replaced'''
+
+    if headers is None:
+        return None
+
+    return {key: REDACTED if key.lower() in redacted_headers else value for key, value in headers.items()}